@@ -0,0 +1,131 @@
+"""
+Micro-benchmark: the detail cache's pack store vs one JSON file per problem.
+
+Fills both stores with the stub server's synthetic problem details and
+reports, for each: bulk write time, size on disk, warm random reads,
+reads through a fresh store (what one CLI invocation pays), then
+rewrites every entry and compacts the pack.
+
+    python benchmarks/bench_cache.py [--problems 3000] [--content-size 4096] [--reads 5000]
+
+Everything is written under a throwaway directory.
+"""
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from stub_server import _detail
+from leetcli.utils.cache import JsonStore
+from leetcli.utils.pack import PackStore, _lz4
+
+STORES = {
+    "json files": lambda path: JsonStore(path / "problems"),
+    "pack": PackStore,
+}
+
+
+def _read_times(make_store, keys, fresh):
+    store = make_store()
+    times = []
+    for key in keys:
+        if fresh:
+            store = make_store()
+        started = time.perf_counter()
+        entry = store._get(key)
+        times.append(time.perf_counter() - started)
+        assert entry is not None, key
+    return times
+
+
+def _bench(name, make, details, reads, fresh_reads):
+    path = Path(tempfile.mkdtemp(prefix="leetcli-bench-cache-"))
+    try:
+        store = make(path)
+        entries = [(slug, time.time(), data) for slug, data in details.items()]
+        started = time.perf_counter()
+        store._put_many(entries)
+        write = time.perf_counter() - started
+        count, size, _ = store._usage()
+
+        keys = list(details)
+        rng = random.Random(0)
+        warm = _read_times(lambda: store, [rng.choice(keys) for _ in range(reads)], fresh=False)
+        fresh = _read_times(lambda: make(path), [rng.choice(keys) for _ in range(fresh_reads)], fresh=True)
+
+        started = time.perf_counter()
+        store._put_many(entries)
+        rewrite = time.perf_counter() - started
+        _, rewritten_size, stale = store._usage()
+        compact = reclaimed = None
+        if hasattr(store, "_compact"):
+            started = time.perf_counter()
+            reclaimed = store._compact()
+            compact = time.perf_counter() - started
+        return {
+            "name": name,
+            "entries": count,
+            "write": write,
+            "size": size,
+            "warm": statistics.median(warm),
+            "fresh": statistics.median(fresh),
+            "rewrite": rewrite,
+            "rewritten_size": rewritten_size,
+            "stale": stale,
+            "compact": compact,
+            "reclaimed": reclaimed,
+        }
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--problems", type=int, default=3000)
+    parser.add_argument("--content-size", type=int, default=4096)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--fresh-reads", type=int, default=500)
+    args = parser.parse_args()
+
+    details = {}
+    for i in range(1, args.problems + 1):
+        slug = f"synthetic-problem-{i}"
+        details[slug] = _detail(slug, args.content_size)
+    raw = sum(len(str(data)) for data in details.values())
+    codec = "lz4" if _lz4() is not None else "zlib (lz4 not installed)"
+    print(f"{args.problems} problems, ~{raw / 1024 / 1024:.1f} MB of details, pack codec: {codec}\n")
+
+    results = [
+        _bench(name, make, details, args.reads, args.fresh_reads)
+        for name, make in STORES.items()
+    ]
+    print(
+        f"{'store':<12}{'write (ms)':>12}{'size (KB)':>12}{'warm read (us)':>16}"
+        f"{'fresh read (us)':>17}{'rewrite (ms)':>14}{'compact (ms)':>14}"
+    )
+    for r in results:
+        compact = f"{r['compact'] * 1000:.1f}" if r["compact"] is not None else "-"
+        print(
+            f"{r['name']:<12}{r['write'] * 1000:>12.1f}{r['size'] / 1024:>12.1f}{r['warm'] * 1e6:>16.1f}"
+            f"{r['fresh'] * 1e6:>17.1f}{r['rewrite'] * 1000:>14.1f}{compact:>14}"
+        )
+    json_files, packed = results
+    print(
+        f"\npack vs json files: write x{json_files['write'] / packed['write']:.1f}, "
+        f"size x{json_files['size'] / packed['size']:.1f} smaller, "
+        f"warm read x{json_files['warm'] / packed['warm']:.1f}, "
+        f"fresh read x{json_files['fresh'] / packed['fresh']:.1f}; "
+        f"compaction reclaimed {packed['reclaimed'] / 1024:.1f} KB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+End-to-end benchmark: real leetcli commands against a local stub server.
+
+Starts `stub_server.StubServer`, points `LeetCli` at it and drives the
+commands through click's CliRunner, as a user would from the shell. For
+every scenario it reports p50 / p95 wall time, requests, connections and
+body bytes per run, and writes everything to a JSON file that can be
+compared with an earlier one.
+
+    python benchmarks/bench_e2e.py [--runs 20] [--latency 0.02] [--content-size 4096]
+                                   [--output bench_e2e.json] [--compare old.json]
+
+Everything runs in a throwaway HOME and working directory, so the real
+~/.leetcode-cli is never touched. A fresh LeetCli (and so a fresh HTTP
+connection) is built for every run; only the interpreter is shared.
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+# leetcli resolves ~/.leetcode-cli at import time, so HOME must be
+# switched before the first leetcli import.
+HOME = tempfile.mkdtemp(prefix="leetcli-bench-home-")
+atexit.register(shutil.rmtree, HOME, ignore_errors=True)
+os.environ["HOME"] = HOME
+os.environ["USERPROFILE"] = HOME
+
+from click.testing import CliRunner
+
+from stub_server import StubServer
+from leetcli.main import LeetCli
+
+SOLUTION_FILE = "solution.py"
+FAILURE_MARKERS = ("Check internet connection", "Login Failed", "unknown error", "Please enter", "Failed to")
+SCENARIOS = (
+    ("problem", ["problem"]),
+    ("problem --limit 300", ["problem", "--limit", "300"]),
+    ("get 1", ["get", "1", "--refresh"]),
+    ("get 1 (cached)", ["get", "1"]),
+    ("get daily", ["get", "daily", "--refresh"]),
+    ("get 1-50", ["get", "1-50", "--refresh"]),
+    ("submit", ["submit", "1", SOLUTION_FILE]),
+    ("status", ["status", "--refresh"]),
+    ("status (cached)", ["status"]),
+)
+
+
+def _write_session():
+    config_dir = Path(HOME) / ".leetcode-cli"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    with open(config_dir / "session.json", "w", encoding="utf-8") as f:
+        json.dump({"LEETCODE_SESSION": "bench-session", "csrftoken": "bench-csrf", "language": "Python3"}, f)
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run(runner, server, argv):
+    """One command invocation; returns (seconds, counters, exit_code, output)."""
+    app = LeetCli(base_url=server.url)
+    server.state._reset()
+    started = time.perf_counter()
+    result = runner.invoke(app.cli, argv, obj=app, catch_exceptions=True)
+    elapsed = time.perf_counter() - started
+    return elapsed, server.state._snapshot(), result.exit_code, result.output
+
+
+def _scenario(runner, server, argv, runs, warmup):
+    for _ in range(warmup):
+        _run(runner, server, argv)
+
+    times, counters, failures = [], [], 0
+    for _ in range(runs):
+        elapsed, counts, exit_code, output = _run(runner, server, argv)
+        if exit_code != 0 or any(marker in output for marker in FAILURE_MARKERS):
+            failures += 1
+        times.append(elapsed)
+        counters.append(counts)
+
+    last = counters[-1]
+    return {
+        "argv": argv,
+        "runs": runs,
+        "failures": failures,
+        "p50_ms": round(_percentile(times, 50) * 1000, 2),
+        "p95_ms": round(_percentile(times, 95) * 1000, 2),
+        "mean_ms": round(statistics.fmean(times) * 1000, 2),
+        "requests": statistics.median(c["requests"] for c in counters),
+        "connections": statistics.median(c["connections"] for c in counters),
+        "bytes_sent": statistics.median(c["bytes_in"] for c in counters),
+        "bytes_received": statistics.median(c["bytes_out"] for c in counters),
+        "operations": last["operations"],
+    }
+
+
+def _compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["scenarios"]
+    print(f"\ncompared with {baseline_path}")
+    print(f"{'scenario':<22}{'p50 (ms)':>20}{'p95 (ms)':>20}{'requests':>14}")
+    for name, now in results.items():
+        old = baseline.get(name)
+        if not old:
+            print(f"{name:<22}{'(new)':>20}")
+            continue
+
+        def delta(key):
+            before, after = old[key], now[key]
+            change = (after - before) / before * 100 if before else 0.0
+            return f"{after:.1f} ({change:+.0f}%)"
+
+        print(f"{name:<22}{delta('p50_ms'):>20}{delta('p95_ms'):>20}{old['requests']:>6} -> {now['requests']:<5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the stub adds to every request")
+    parser.add_argument("--content-size", type=int, default=4096, help="bytes of statement HTML per problem")
+    parser.add_argument("--problems", type=int, default=3000)
+    parser.add_argument("--judge-polls", type=int, default=1, help="checks answered 'pending' per submission")
+    parser.add_argument("--only", action="append", help="run only scenarios whose name starts with this")
+    parser.add_argument("--output", type=Path, default=Path("bench_e2e.json"))
+    parser.add_argument("--compare", type=Path, help="earlier result file to diff against")
+    args = parser.parse_args()
+    output = args.output.resolve()
+
+    _write_session()
+    config = {
+        "latency": args.latency,
+        "content_size": args.content_size,
+        "problems": args.problems,
+        "judge_polls": args.judge_polls,
+        "runs": args.runs,
+        "warmup": args.warmup,
+    }
+    scenarios = [
+        (name, argv) for name, argv in SCENARIOS
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+
+    results = {}
+    runner = CliRunner()
+    with StubServer(
+        problems=args.problems,
+        latency=args.latency,
+        content_size=args.content_size,
+        judge_polls=args.judge_polls,
+    ) as server, runner.isolated_filesystem(temp_dir=HOME):
+        with open(SOLUTION_FILE, "w", encoding="utf-8") as f:
+            f.write("class Solution:\n    def solve(self, nums):\n        return 0\n")
+
+        print(f"stub at {server.url}, latency {args.latency * 1000:.0f} ms, {args.runs} runs per scenario\n")
+        print(f"{'scenario':<22}{'p50 (ms)':>10}{'p95 (ms)':>10}{'requests':>10}{'conns':>7}{'sent':>10}{'received':>11}")
+        for name, argv in scenarios:
+            result = _scenario(runner, server, argv, args.runs, args.warmup)
+            results[name] = result
+            failed = f"  ({result['failures']} failed)" if result["failures"] else ""
+            print(
+                f"{name:<22}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}{result['requests']:>10}"
+                f"{result['connections']:>7}{result['bytes_sent']:>10}{result['bytes_received']:>11}{failed}"
+            )
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "scenarios": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Micro-benchmark: leetcli's HTML -> Markdown converter vs BeautifulSoup.get_text.
+
+Converts every problem in a corpus of `content` payloads and reports
+import cost (median over --import-runs fresh interpreters) and
+per-document time for both.
+
+    python benchmarks/bench_markdown.py [--corpus benchmarks/data/problems.json] [--rounds 200] [--import-runs 20]
+
+BeautifulSoup is optional; its column is skipped when bs4 is not installed.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from leetcli.utils.markdown import _html_to_markdown
+
+DEFAULT_CORPUS = ROOT / "benchmarks" / "data" / "problems.json"
+
+
+def _import_cost(module, runs=20):
+    """
+    Median time of `import module`, timed with perf_counter inside each of
+    `runs` fresh interpreters so interpreter start-up noise stays out.
+    """
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    code = (
+        "import time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - started)\n"
+    )
+    times = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        times.append(float(proc.stdout))
+    return statistics.median(times)
+
+
+def _per_document(convert, documents, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for html in documents:
+            convert(html)
+    return (time.perf_counter() - started) / (rounds * len(documents))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--import-runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        documents = [p["content"] for p in json.load(f)["problems"] if p.get("content")]
+    size = sum(len(d) for d in documents)
+    print(f"corpus: {len(documents)} documents, {size / 1024:.1f} KB of HTML, {args.rounds} rounds\n")
+
+    results = [(
+        "leetcli.utils.markdown",
+        _import_cost("leetcli.utils.markdown", args.import_runs),
+        _per_document(_html_to_markdown, documents, args.rounds),
+    )]
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        print("bs4 is not installed; skipping the BeautifulSoup baseline.\n")
+    else:
+        results.append((
+            "bs4 get_text",
+            _import_cost("bs4", args.import_runs),
+            _per_document(lambda html: BeautifulSoup(html, "html.parser").get_text(), documents, args.rounds),
+        ))
+
+    print(f"{'converter':<24}{'import (ms)':>14}{'per doc (us)':>16}")
+    for name, import_cost, per_doc in results:
+        print(f"{name:<24}{import_cost * 1000:>14.1f}{per_doc * 1e6:>16.1f}")
+    if len(results) == 2:
+        (_, ours_import, ours_doc), (_, bs4_import, bs4_doc) = results
+        print(f"\nspeed-up: import x{bs4_import / ours_import:.1f}, per document x{bs4_doc / ours_doc:.1f}")
+
+
+if __name__ == "__main__":
+    main()
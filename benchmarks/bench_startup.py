@@ -0,0 +1,80 @@
+"""
+Startup-time benchmark for the leetcli entry point.
+
+Runs each command in a fresh interpreter (like the installed `leetcli`
+script) and reports min / median wall time, plus the modules that were
+imported, so regressions in import cost are easy to spot.
+
+    python benchmarks/bench_startup.py [--runs 20]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("requests", "browser_cookie3", "bs4", "tabulate", "sqlite3")
+COMMANDS = (
+    ["--help"],
+    ["get", "--help"],
+    ["set", "--help"],
+    ["logout", "--help"],
+)
+ENTRY = (
+    "import sys, json, atexit\n"
+    "heavy = {heavy!r}\n"
+    "atexit.register(lambda: sys.stderr.write(json.dumps([m for m in heavy if m in sys.modules])))\n"
+    "sys.argv = ['leetcli'] + {argv!r}\n"
+    "from leetcli.main import main\n"
+    "main()\n"
+)
+
+
+def _run(argv):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", ENTRY.format(heavy=HEAVY_MODULES, argv=argv)],
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    elapsed = time.perf_counter() - started
+    return elapsed, json.loads(proc.stderr.strip().splitlines()[-1])
+
+
+def _baseline(runs):
+    """Bare interpreter start, to separate Python's own cost from ours."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"])
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    base = _baseline(args.runs)
+    print(f"{'python -c pass':<24} min {min(base) * 1000:7.1f} ms   median {statistics.median(base) * 1000:7.1f} ms")
+    for argv in COMMANDS:
+        times, loaded = [], []
+        for _ in range(args.runs):
+            elapsed, loaded = _run(argv)
+            times.append(elapsed)
+        label = "leetcli " + " ".join(argv)
+        print(
+            f"{label:<24} min {min(times) * 1000:7.1f} ms   median {statistics.median(times) * 1000:7.1f} ms"
+            f"   heavy imports: {', '.join(loaded) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+Local stand-in for leetcode.com used by the end-to-end benchmarks.
+
+Serves POST /graphql (problem lists, single and aliased problem details,
+the daily problem, submission details, user status and progress) and
+POST /problems/<slug>/submit/ from synthetic data, with a configurable
+per-request latency, statement size and judge delay. It also counts
+requests, connections and body bytes so a benchmark can read them back.
+
+    python benchmarks/stub_server.py --port 8765 --latency 0.05
+
+Only the query shapes leetcli sends are understood; anything else gets a
+GraphQL error.
+"""
+import re
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SUBMIT_PATH_RE = re.compile(r"^/problems/([^/]+)/submit/?$")
+ALIAS_VARIABLE_RE = re.compile(r"^(titleSlug|submissionId)(\d+)$")
+SLUG_ID_RE = re.compile(r"-(\d+)$")
+DIFFICULTIES = ("Easy", "Medium", "Hard")
+TOPICS = ("array", "string", "hash-table", "dynamic-programming", "tree", "graph", "two-pointers")
+STATUS_ACCEPTED = 10
+STATUS_PENDING = 17
+
+
+def _question(i):
+    return {
+        "questionId": str(i),
+        "questionFrontendId": str(i),
+        "title": f"Synthetic Problem {i}",
+        "titleSlug": f"synthetic-problem-{i}",
+        "difficulty": DIFFICULTIES[i % 3],
+        "acRate": 35.0 + i % 50,
+        "isPaidOnly": i % 17 == 0,
+        "status": "ac" if i % 5 == 0 else None,
+        "freqBar": None,
+        "isFavor": False,
+        "hasSolution": True,
+        "hasVideoSolution": False,
+        "topicTags": [
+            {"name": TOPICS[(i + k) % len(TOPICS)].replace("-", " ").title(),
+             "id": str((i + k) % len(TOPICS)),
+             "slug": TOPICS[(i + k) % len(TOPICS)]}
+            for k in range(1 + i % 3)
+        ],
+    }
+
+
+def _content(i, size):
+    """Problem statement HTML of roughly `size` bytes in LeetCode's markup."""
+    head = (
+        f"<p>Given an integer array <code>nums</code> of problem {i}, return the answer "
+        f"modulo <code>10<sup>9</sup> + 7</code>.</p>\n"
+        "<p><strong class=\"example\">Example 1:</strong></p>\n"
+        "<pre>\n<strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+        "<strong>Output:</strong> [0,1]\n</pre>\n"
+        "<p><strong class=\"example\">Example 2:</strong></p>\n"
+        "<div class=\"example-block\"><p><strong>Input:</strong> <span class=\"example-io\">nums = [3,2,4], target = 6</span></p>\n"
+        "<p><strong>Output:</strong> <span class=\"example-io\">[1,2]</span></p></div>\n"
+        "<p><strong>Constraints:</strong></p>\n<ul>\n"
+        "\t<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+    )
+    filler = "<p>Each input has <em>exactly one</em> solution; you may not use the same element twice.</p>\n"
+    body = [head]
+    length = len(head)
+    while length < size:
+        body.append(filler)
+        length += len(filler)
+    return "".join(body)
+
+
+def _detail(slug, content_size):
+    match = SLUG_ID_RE.search(slug)
+    if not slug.startswith("synthetic-problem-") or not match:
+        return None
+    i = int(match.group(1))
+    data = _question(i)
+    data.update({
+        "content": _content(i, content_size),
+        "stats": json.dumps({"acRate": f"{data['acRate']}%"}),
+        "codeSnippets": [
+            {"lang": "Python3", "langSlug": "python3", "code": "class Solution:\n    def solve(self, nums: List[int], target: int) -> List[int]:\n        pass\n"},
+            {"lang": "C++", "langSlug": "cpp", "code": "class Solution {\npublic:\n    int solve(vector<int>& nums) {\n    }\n};\n"},
+            {"lang": "Java", "langSlug": "java", "code": "class Solution {\n    public int solve(int[] nums) {\n    }\n}\n"},
+        ],
+        "exampleTestcases": "[2,7,11,15]\n9\n[3,2,4]\n6",
+        "metaData": json.dumps({
+            "name": "solve",
+            "params": [{"name": "nums", "type": "integer[]"}, {"name": "target", "type": "integer"}],
+            "return": {"type": "integer[]"},
+        }),
+    })
+    return data
+
+
+class StubState:
+    """Configuration and counters shared by every handler thread."""
+    def __init__(
+        self,
+        problems=3000,
+        latency=0.0,
+        content_size=2048,
+        judge_polls=1,
+        throttle_every=0
+    ):
+        self.problems = problems
+        self.latency = latency
+        self.content_size = content_size
+        self.judge_polls = judge_polls
+        self.throttle_every = throttle_every
+        self._submit_calls = 0
+        self.questions = [_question(i) for i in range(1, problems + 1)]
+        self._lock = threading.Lock()
+        self._submissions = {}
+        self._next_submission = 1000
+        self._reset()
+
+    def _reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = set()
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.operations = {}
+
+    def _snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": len(self.connections),
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "operations": dict(self.operations),
+            }
+
+    def _count(self, client, operation, bytes_in):
+        with self._lock:
+            self.requests += 1
+            self.connections.add(client)
+            self.bytes_in += bytes_in
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+
+    def _sent(self, size):
+        with self._lock:
+            self.bytes_out += size
+
+    def _throttled(self):
+        """True for every `throttle_every`-th submit, answered with HTTP 429."""
+        with self._lock:
+            self._submit_calls += 1
+            return bool(self.throttle_every) and self._submit_calls % self.throttle_every == 0
+
+    def _submit(self):
+        with self._lock:
+            self._next_submission += 1
+            self._submissions[self._next_submission] = self.judge_polls
+            return self._next_submission
+
+    def _check(self, submission_id):
+        with self._lock:
+            if submission_id not in self._submissions:
+                return None
+            left = self._submissions[submission_id]
+            self._submissions[submission_id] = max(left - 1, 0)
+        status = STATUS_PENDING if left > 0 else STATUS_ACCEPTED
+        return {
+            "statusCode": status,
+            "runtime": "3 ms",
+            "memory": "17.1 MB",
+            "totalCorrect": 63,
+            "totalTestcases": 63,
+            "lastTestcase": "",
+            "compileError": None,
+            "runtimeError": None,
+        }
+
+
+def _operation(query):
+    for name in ("questionList", "activeDailyCodingChallengeQuestion", "userStatus",
+                 "userProfileUserQuestionProgressV2"):
+        if name in query:
+            return name
+    if "submissionDetails" in query:
+        return "submissionDetails"
+    if "question(" in query:
+        return "question"
+    return "unknown"
+
+
+def _graphql(state, query, variables):
+    operation = _operation(query)
+    aliased = {}
+    for key, value in variables.items():
+        match = ALIAS_VARIABLE_RE.match(key)
+        if match:
+            aliased[f"q{match.group(2)}"] = (match.group(1), value)
+
+    if aliased:
+        data, errors = {}, []
+        for alias, (kind, value) in aliased.items():
+            if kind == "titleSlug":
+                result = _detail(value, state.content_size)
+                message = "That question does not exist."
+            else:
+                result = state._check(int(value))
+                message = "Submission not found."
+            data[alias] = result
+            if result is None:
+                errors.append({"message": message, "path": [alias]})
+        out = {"data": data}
+        if errors:
+            out["errors"] = errors
+        return operation + "[batch]", out
+
+    if operation == "questionList":
+        skip = variables.get("skip") or 0
+        limit = variables.get("limit") or 50
+        rows = state.questions
+        difficulty = ((variables.get("filters") or {}).get("difficulty") or "").title()
+        if difficulty:
+            rows = [q for q in rows if q["difficulty"] == difficulty]
+        return operation, {"data": {"problemsetQuestionList": {"total": len(rows), "questions": rows[skip:skip + limit]}}}
+    if operation == "activeDailyCodingChallengeQuestion":
+        daily = _detail(f"synthetic-problem-{1 + int(time.time() // 86400) % state.problems}", state.content_size)
+        return operation, {"data": {"activeDailyCodingChallengeQuestion": {
+            "date": time.strftime("%Y-%m-%d"), "link": f"/problems/{daily['titleSlug']}/", "question": daily,
+        }}}
+    if operation == "question":
+        return operation, {"data": {"question": _detail(variables.get("titleSlug", ""), state.content_size)}}
+    if operation == "submissionDetails":
+        return operation, {"data": {"submissionDetails": state._check(int(variables.get("submissionId", 0)))}}
+    if operation in ("userStatus", "userProfileUserQuestionProgressV2"):
+        # Answers `status`'s combined document as well as either query alone.
+        data = {}
+        if "userStatus" in query:
+            data["userStatus"] = {"isSignedIn": True, "username": "bench-user"}
+        if "userProfileUserQuestionProgressV2" in query:
+            counts = [{"difficulty": d.upper(), "count": 100 + i * 7} for i, d in enumerate(DIFFICULTIES)]
+            data["userProfileUserQuestionProgressV2"] = {
+                "numAcceptedQuestions": counts,
+                "numFailedQuestions": counts,
+                "numUntouchedQuestions": counts,
+                "userSessionBeatsPercentage": [{"difficulty": d.upper(), "percentage": 50.0} for d in DIFFICULTIES],
+            }
+        return "+".join(data), {"data": data}
+    return operation, {"errors": [{"message": "Unsupported query."}]}
+
+
+def _handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, code, payload, headers=()):
+            body = json.dumps(payload).encode()
+            self.send_response(code)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            state._sent(len(body))
+
+        def do_POST(self):
+            raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            bytes_in = len(raw)
+            if state.latency:
+                time.sleep(state.latency)
+
+            match = SUBMIT_PATH_RE.match(self.path)
+            if match:
+                state._count(self.client_address, "submit", bytes_in)
+                if state._throttled():
+                    self._reply(429, {"error": "Too many requests"}, [("Retry-After", "1")])
+                else:
+                    self._reply(200, {"submission_id": state._submit()})
+                return
+            if self.path.rstrip("/") != "/graphql":
+                state._count(self.client_address, "not-found", bytes_in)
+                self._reply(404, {"error": "Not found"})
+                return
+
+            body = json.loads(raw or b"{}")
+            operation, payload = _graphql(state, body.get("query", ""), body.get("variables") or {})
+            state._count(self.client_address, operation, bytes_in)
+            self._reply(200, payload)
+
+        def do_GET(self):
+            """GET /stats returns the counters; GET /reset clears them."""
+            if self.path == "/reset":
+                state._reset()
+            body = json.dumps(state._snapshot()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+class StubServer:
+    """
+    Threaded stub server, usable as a context manager:
+
+        with StubServer(latency=0.05) as server:
+            LeetCli(base_url=server.url)
+    """
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        **options
+    ):
+        self.state = StubState(**options)
+        self.httpd = ThreadingHTTPServer((host, port), _handler(self.state))
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--problems", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--content-size", type=int, default=2048, help="bytes of statement HTML per problem")
+    parser.add_argument("--judge-polls", type=int, default=1, help="checks answered 'pending' per submission")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth submit with HTTP 429")
+    args = parser.parse_args()
+
+    server = StubServer(
+        port=args.port,
+        problems=args.problems,
+        latency=args.latency,
+        content_size=args.content_size,
+        judge_polls=args.judge_polls,
+        throttle_every=args.throttle_every,
+    )
+    print(f"stub leetcode listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import os
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+USERINFO_DIR = Path(os.path.expanduser("~/.leetcode-cli"))
+USERINFO_FILE = USERINFO_DIR / "session.json"
+
+
+class SessionConfig:
+    """
+    Cached view of `~/.leetcode-cli/session.json`.
+
+    The file is parsed once and re-read only when its mtime, size or inode
+    changes. Writes go to a temp file in the same directory that is then
+    renamed over the original, so a parallel `leetcli` never reads a
+    half-written file.
+    """
+    def __init__(
+        self,
+        path: Path = USERINFO_FILE
+    ):
+        self.path = Path(path)
+        self._data = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _stat_stamp(
+        self
+    ) -> tuple:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _load(
+        self
+    ) -> dict:
+        with self._lock:
+            try:
+                stamp = self._stat_stamp()
+            except FileNotFoundError:
+                self._data, self._stamp = None, None
+                raise FileNotFoundError("User info file not found.")
+
+            if stamp != self._stamp:
+                with open(self.path, "r") as f:
+                    self._data = json.load(f)
+                self._stamp = stamp
+            return self._data
+
+    def _get(
+        self,
+        key: str,
+        default=None
+    ):
+        try:
+            return self._load().get(key, default)
+        except FileNotFoundError:
+            return default
+
+    def _write(
+        self,
+        data: dict
+    ) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent,
+                prefix=f".{self.path.name}.",
+                suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+            self._data = dict(data)
+            self._stamp = self._stat_stamp()
+
+    def _update(
+        self,
+        **values
+    ) -> dict:
+        data = dict(self._load())
+        data.update(values)
+        self._write(data)
+        return data
+
+    def _delete(
+        self
+    ) -> bool:
+        with self._lock:
+            self._data, self._stamp = None, None
+            try:
+                self.path.unlink()
+                return True
+            except FileNotFoundError:
+                return False
+
+    def _exists(
+        self
+    ) -> bool:
+        return self.path.exists()
+
+
+SESSION_CONFIG = SessionConfig()
@@ -1,48 +1,94 @@
-import os
-import json
+import time
+import queue
+import hashlib
 import platform
+import threading
 from typing import (
     Optional, 
     Tuple, 
     Union
 )
 from http.cookiejar import CookieJar
-import requests
-import browser_cookie3
-from tabulate import tabulate
-from pathlib import Path
-from leetcli.utils.req import (
-    _req_header, 
-    _req_cookies,
+from leetcli.auth.config import (
+    SESSION_CONFIG,
+    USERINFO_DIR
+)
+from leetcli.utils.cache import (
+    _atomic_write_json,
+    _read_json
 )
 from leetcli.utils.query import (
-    _req_user_progress_v2_query
+    _req_user_status_query,
+    _req_user_progress_v2_query,
+    _req_user_status_progress_query
 )
 from leetcli.utils.variable import (
     _req_user_progress_variable
 )
+from leetcli.utils.table import _render
+from leetcli.utils.trace import _traced
 
-LEETCODE_URL = "https://leetcode.com/graphql"
-USERINFO_DIR = Path(os.path.expanduser("~/.leetcode-cli"))
-USERINFO_FILE = USERINFO_DIR / "session.json"
 LEETCODE_DOMAIN = "leetcode.com"
+STATUS_CACHE_FILE = USERINFO_DIR / "status.json"
+STATUS_CACHE_TTL = 30
+LOGIN_MEMO_FILE = USERINFO_DIR / "login.json"
+BROWSER_PROBE_TIMEOUT = 10.0
+SESSION_COOKIES = ("LEETCODE_SESSION", "csrftoken")
+BROWSERS_SUPPORT = {
+    "chrome":       ["Linux", "Darwin", "Windows"],
+    "firefox":      ["Linux", "Darwin", "Windows"],
+    "librewolf":    ["Linux", "Darwin", "Windows"],
+    "opera":        ["Linux", "Darwin", "Windows"],
+    "opera_gx":     ["Darwin", "Windows"],
+    "edge":         ["Linux", "Darwin", "Windows"],
+    "chromium":     ["Linux", "Darwin", "Windows"],
+    "brave":        ["Linux", "Darwin", "Windows"],
+    "vivaldi":      ["Linux", "Darwin", "Windows"],
+    "w3m":          ["Linux"],
+    "lynx":         ["Linux"],
+    "safari":       ["Darwin"],
+}
+PROGRESS_COLUMNS = [
+    ("difficulty", "Difficulty", 10),
+    ("accepted", "Accepted", 8),
+    ("failed", "Failed", 8),
+    ("untouched", "Untouched", 9),
+    ("beats", "Beats (%)", 9),
+]
 
 
 class UserInfoManager:
-    def __init__(self):
-        pass
+    """
+    Login session and account progress.
+
+    Network operations have a blocking form on `client` and a coroutine
+    form (`_a...`) on `aclient`, built from `client` unless passed in.
+    """
+    def __init__(self, client, aclient=None):
+        self.client = client
+        self._aclient = aclient
+        self.config = SESSION_CONFIG
+        self.status_path = STATUS_CACHE_FILE
+
+    @property
+    def aclient(self):
+        if self._aclient is None:
+            from leetcli.utils.aclient import AsyncLeetClient
+            self._aclient = AsyncLeetClient(
+                self.client.csrftoken,
+                self.client.session,
+                base_url=self.client.base_url
+            )
+        return self._aclient
 
+    @_traced("user.status")
     def _get_userinfo(
-        self,
-        url
+        self
     ) -> Optional[Tuple[str, bool]]:
         try:
-            with open(USERINFO_FILE, "r") as f:
-                cookies_dict = json.load(f)
-            session = requests.Session()
-            for k, v in cookies_dict.items():
-                session.cookies.set(k, v)
-            username, is_active = self._test_userinfo(url, session)
+            if not self.config._exists():
+                raise FileNotFoundError("User info file not found.")
+            username, is_active = self._test_userinfo()
             return username, is_active
         
         except FileNotFoundError as e:
@@ -54,44 +100,187 @@ class UserInfoManager:
         except Exception as e:
             raise e
 
-    def _create_userinfo(
+    @_traced("user.cached_status")
+    def _get_status(
+        self,
+        refresh=False,
+        ttl=STATUS_CACHE_TTL
+    ):
+        """
+        Login state and progress for `status`, as (userinfo, records, age).
+
+        Answers from ~/.leetcode-cli/status.json while it is younger than
+        `ttl` seconds and belongs to the current session; `refresh` skips
+        it. Once the username is known (from an earlier run or `login`),
+        identity and progress come back in one combined document instead
+        of two serial requests. `age` is the cache age in seconds, or None
+        when the answer was just fetched.
+        """
+        if not self.config._exists():
+            raise FileNotFoundError("User info file not found.")
+        key = self._session_key()
+        cached = _read_json(self.status_path, {})
+        if cached.get("session") != key:
+            cached = {}
+        age = time.time() - cached.get("fetched_at", 0)
+        if not refresh and cached.get("records") is not None and 0 <= age < ttl:
+            return (cached["signed_in"], cached["username"]), cached["records"], age
+
+        try:
+            username = cached.get("username")
+            records = None
+            if username:
+                data = self.client._graphql(
+                    _req_user_status_progress_query(),
+                    _req_user_progress_variable(username)
+                )
+                userinfo = self._user_status(data)
+                if userinfo[1] == username and (data.get("data") or {}).get("userProfileUserQuestionProgressV2"):
+                    records = self._progress_records(username, data)
+            else:
+                userinfo = self._test_userinfo()
+
+            if userinfo[0] and records is None:
+                data = self.client._graphql(
+                    _req_user_progress_v2_query(),
+                    _req_user_progress_variable(userinfo[1])
+                )
+                records = self._progress_records(userinfo[1], data)
+
+        except Exception as e:
+            raise ConnectionError(str(e))
+
+        self._remember_status(userinfo, records or [])
+        return userinfo, records or [], None
+
+    def _session_key(
+        self
+    ) -> str:
+        """Fingerprint of the saved session, so a new login never sees old status."""
+        session = self.config._get("LEETCODE_SESSION") or ""
+        return hashlib.sha256(session.encode()).hexdigest()[:16]
+
+    def _remember_status(
+        self,
+        userinfo,
+        records=None
+    ) -> None:
+        """
+        Save identity (and progress) for `_get_status`. `login` stores the
+        identity alone, so the next `status` is already a single request.
+        """
+        try:
+            _atomic_write_json(self.status_path, {
+                "session": self._session_key(),
+                "signed_in": userinfo[0],
+                "username": userinfo[1],
+                "records": records,
+                "fetched_at": time.time() if records is not None else 0,
+            })
+        except OSError:
+            pass
+
+    def _forget_status(
         self
+    ) -> None:
+        """
+        Mark the cached progress stale (e.g. after a submit). The identity
+        stays, so the next `status` is still a single combined request.
+        """
+        cached = _read_json(self.status_path, {})
+        if cached.get("records") is None:
+            return
+        cached.update(records=None, fetched_at=0)
+        try:
+            _atomic_write_json(self.status_path, cached)
+        except OSError:
+            pass
+
+    @_traced("user.browser_cookies")
+    def _create_userinfo(
+        self,
+        browser: Optional[str] = None,
+        timeout: float = BROWSER_PROBE_TIMEOUT
     ) -> Optional[Union[CookieJar, str]]:
         """
         Create New Session from Leetcode
+
+        Reads LeetCode cookies from `browser`, or else probes every browser
+        supported on this OS at once and takes the first jar holding both
+        LEETCODE_SESSION and csrftoken. The browser that worked last time
+        is given the first `timeout` seconds on its own, so a repeat login
+        usually opens one cookie store. Browsers that do not answer within
+        `timeout` seconds are abandoned. Sets `self.browser` on success.
         """
-        cookies = None
         current_os = platform.system()
-        browsers_support = {
-            "chrome":       ["Linux", "Darwin", "Windows"],
-            "firefox":      ["Linux", "Darwin", "Windows"],
-            "librewolf":    ["Linux", "Darwin", "Windows"],
-            "opera":        ["Linux", "Darwin", "Windows"],
-            "opera_gx":     ["Darwin", "Windows"],
-            "edge":         ["Linux", "Darwin", "Windows"],
-            "chromium":     ["Linux", "Darwin", "Windows"],
-            "brave":        ["Linux", "Darwin", "Windows"],
-            "vivaldi":      ["Linux", "Darwin", "Windows"],
-            "w3m":          ["Linux"],
-            "lynx":         ["Linux"],
-            "safari":       ["Darwin"],
-        }
-
-        for browser_name, os_list in browsers_support.items():
-            if current_os not in os_list:
-                continue
+        self.browser = None
+        if browser is not None:
+            if current_os not in BROWSERS_SUPPORT.get(browser, []):
+                raise ValueError(
+                    f"Unsupported browser on {current_os}: {browser}\n"
+                    f"Available options: {', '.join(self._supported_browsers())}"
+                )
+            candidates = [browser]
+        else:
+            candidates = self._supported_browsers()
+            last = _read_json(LOGIN_MEMO_FILE, {}).get("browser")
+            if last in candidates:
+                found = self._probe_browsers([last], timeout)
+                if found is not None:
+                    return found
+                candidates.remove(last)
+        return self._probe_browsers(candidates, timeout)
+
+    def _supported_browsers(
+        self
+    ) -> list:
+        current_os = platform.system()
+        return [name for name, os_list in BROWSERS_SUPPORT.items() if current_os in os_list]
+
+    def _probe_browsers(
+        self,
+        browsers,
+        timeout
+    ) -> Optional[CookieJar]:
+        """
+        Read cookies from every browser in `browsers` concurrently and return
+        the first jar with a LeetCode session (remembering its browser).
+
+        Each probe runs on a daemon thread, so one stuck on a locked cookie
+        store or a keychain prompt never delays `login` past `timeout`.
+        """
+        import browser_cookie3
+
+        results = queue.Queue()
+
+        def probe(name):
             try:
-                func = getattr(browser_cookie3, browser_name)
-            except AttributeError:
-                continue
+                cookies = getattr(browser_cookie3, name)(domain_name=LEETCODE_DOMAIN)
+            except Exception:
+                cookies = None
+            results.put((name, cookies))
 
+        for name in browsers:
+            if hasattr(browser_cookie3, name):
+                threading.Thread(target=probe, args=(name,), name=f"cookies-{name}", daemon=True).start()
+            else:
+                results.put((name, None))
+
+        deadline = time.monotonic() + timeout
+        for _ in browsers:
             try:
-                cookies = func(domain_name="leetcode.com")
-                if cookies:
-                    break
-            except Exception as e:
-                continue
-        return cookies
+                name, cookies = results.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            found = {cookie.name for cookie in cookies or [] if cookie.value}
+            if found.issuperset(SESSION_COOKIES):
+                self.browser = name
+                try:
+                    _atomic_write_json(LOGIN_MEMO_FILE, {"browser": name})
+                except OSError:
+                    pass
+                return cookies
+        return None
 
     def _save_userinfo(
         self, 
@@ -99,8 +288,6 @@ class UserInfoManager:
         default_language: str | None,
         LEETCODE_LANGUAGES
     ) -> None:
-        dir_path = os.path.dirname(USERINFO_FILE)
-        os.makedirs(dir_path, exist_ok=True)
         important_info = {}
         for cookie in cookies:
             if cookie.name in ("LEETCODE_SESSION", "csrftoken"):
@@ -113,80 +300,62 @@ class UserInfoManager:
                     f"Available options: {', '.join(sorted(set(LEETCODE_LANGUAGES.values())))}"
                 )
             important_info["language"] = LEETCODE_LANGUAGES[lang_key]
-        with open(USERINFO_FILE, "w") as f:
-            json.dump(important_info, f, indent=2)
+        self.config._write(important_info)
         
+    @_traced("user.check_session")
     def _test_userinfo(
-        self, 
-        url, 
-        session
+        self
     ) -> Tuple[bool, Optional[str]]:
         try:
-            headers = {
-                "Referer": "https://leetcode.com/",
-                "Content-Type": "application/json",
-                "x-csrftoken": session.cookies.get("csrftoken"),
-                "User-Agent": "Mozilla/5.0",
-            }
-
-            query = {
-                "operationName": "globalData",
-                "variables": {},
-                "query": """
-                query globalData {
-                userStatus {
-                    isSignedIn
-                    username
-                }
-                }
-                """
-            }
-            resp = session.post(url, headers=headers, json=query)
-            data = resp.json()
-            user_status = data.get("data", {}).get("userStatus", {})
-            is_signed_in = user_status.get("isSignedIn", False)
-            username = user_status.get("username")
-
-            if is_signed_in and username:
-                return True, username
-            else:
-                return False, None
-            
+            query = _req_user_status_query()
+            data = self.client._graphql(query, {})
+            return self._user_status(data)
+
         except Exception as e:
             raise ConnectionError
 
+    def _user_status(
+        self,
+        data
+    ) -> Tuple[bool, Optional[str]]:
+        user_status = data.get("data", {}).get("userStatus", {})
+        is_signed_in = user_status.get("isSignedIn", False)
+        username = user_status.get("username")
+
+        if is_signed_in and username:
+            return True, username
+        else:
+            return False, None
+
     def _delete_userinfo(
         self
     ) -> bool:
         try:
-            if USERINFO_FILE.exists():
-                USERINFO_FILE.unlink()
-                return True
-            else:
-                return False
+            self.status_path.unlink(missing_ok=True)
+            return self.config._delete()
         except Exception as e:
             return False
 
+    @staticmethod
+    def _load_userinfo() -> dict:
+        return SESSION_CONFIG._load()
+
     def _get_csrftoken(
         self
     ) -> str:
-        with open(USERINFO_FILE, "r") as f:
-            userinfo_dict = json.load(f)
-        return userinfo_dict['csrftoken']
+        return self.config._load()['csrftoken']
 
     def _get_session(
         self
     ) -> str:
-        with open(USERINFO_FILE, "r") as f:
-            userinfo_dict = json.load(f)
-        return userinfo_dict['LEETCODE_SESSION']
+        return self.config._load()['LEETCODE_SESSION']
 
     def _set_lang(
         self,
         language,
         LEETCODE_LANGUAGES
     ) -> None:
-        if not USERINFO_FILE.exists():
+        if not self.config._exists():
             raise FileNotFoundError("User info file not found.")
         lang_key = language.strip().lower()
         if lang_key not in LEETCODE_LANGUAGES:
@@ -195,65 +364,61 @@ class UserInfoManager:
                 f"Available options: {', '.join(sorted(set(LEETCODE_LANGUAGES.values())))}"
             )
         selected_lang = LEETCODE_LANGUAGES[lang_key]
-        with open(USERINFO_FILE, "r") as f:
-            data = json.load(f)
-        data["language"] = selected_lang
-
-        with open(USERINFO_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        self.config._update(language=selected_lang)
 
         return selected_lang
 
-    def _get_lang(
-        self
+    def _progress_display(
+        self,
+        record
+    ) -> list:
+        return [
+            record["difficulty"],
+            record["accepted"],
+            record["failed"],
+            record["untouched"],
+            f"{record['beats']:.2f}" if record["beats"] is not None else "-"
+        ]
+
+    def _progress_table(
+        self,
+        records,
+        fmt="table"
     ) -> str:
-        try:
-            with open(USERINFO_FILE, "r") as f:
-                userinfo_dict = json.load(f)
-            return userinfo_dict['language']
-        except Exception as e:
-            raise FileNotFoundError("User info file not found.")
-    
-    def _get_user_progress(
+        return "\n".join(_render(records, PROGRESS_COLUMNS, fmt, self._progress_display))
+
+    @_traced("user.async_progress")
+    async def _afetch_user_progress(
         self,
-        csrftoken,
-        session,
-        userinfo
-    ):
-        try:
-            result_table = []
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
-            )
-            query = _req_user_progress_v2_query()
-            variables = _req_user_progress_variable(userinfo[1])
-
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query, "variables": variables})
-            )
-            
-            data = json.loads(response.content)
-            progress_result = data["data"]["userProfileUserQuestionProgressV2"]
-        
-            accepted = {x["difficulty"]: x["count"] for x in progress_result["numAcceptedQuestions"]}
-            failed = {x["difficulty"]: x["count"] for x in progress_result["numFailedQuestions"]}
-            untouched = {x["difficulty"]: x["count"] for x in progress_result["numUntouchedQuestions"]}
-            beats = {x["difficulty"]: x["percentage"] for x in progress_result["userSessionBeatsPercentage"]}
-
-            for diff in ["EASY", "MEDIUM", "HARD"]:
-                result_table.append([
-                    diff.capitalize(),
-                    accepted.get(diff, 0),
-                    failed.get(diff, 0),
-                    untouched.get(diff, 0),
-                    f"{beats.get(diff):.2f}" if beats.get(diff) is not None else "-"
-                ])
-            return tabulate(result_table, headers=["Difficulty", "Accepted", "Failed", "Untouched", "Beats (%)"], tablefmt="fancy_grid") 
-       
-        except Exception as e:
-            raise e
\ No newline at end of file
+        username
+    ) -> list:
+        """Solved / failed / untouched counts per difficulty as records."""
+        query = _req_user_progress_v2_query()
+        variables = _req_user_progress_variable(username)
+
+        data = await self.aclient._graphql(query, variables)
+        return self._progress_records(username, data)
+
+    def _progress_records(
+        self,
+        username,
+        data
+    ) -> list:
+        records = []
+        progress_result = data["data"]["userProfileUserQuestionProgressV2"]
+
+        accepted = {x["difficulty"]: x["count"] for x in progress_result["numAcceptedQuestions"]}
+        failed = {x["difficulty"]: x["count"] for x in progress_result["numFailedQuestions"]}
+        untouched = {x["difficulty"]: x["count"] for x in progress_result["numUntouchedQuestions"]}
+        beats = {x["difficulty"]: x["percentage"] for x in progress_result["userSessionBeatsPercentage"]}
+
+        for diff in ["EASY", "MEDIUM", "HARD"]:
+            records.append({
+                "username": username,
+                "difficulty": diff.capitalize(),
+                "accepted": accepted.get(diff, 0),
+                "failed": failed.get(diff, 0),
+                "untouched": untouched.get(diff, 0),
+                "beats": beats.get(diff)
+            })
+        return records
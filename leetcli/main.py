@@ -1,11 +1,41 @@
+import os
+import sys
 import time
 import click
-from leetcli.auth.user import *
-from leetcli.problems.problem import *
-from leetcli.utils.language import LEETCODE_LANGUAGES
+from datetime import datetime
+from leetcli.utils.language import (
+    ALL_LANGUAGES,
+    LEETCODE_LANGUAGES,
+    _parse_languages
+)
+from leetcli.utils.spec import (
+    DEFAULT_SUBMIT_WORKERS,
+    _is_problem_spec,
+    _parse_problem_spec,
+    _parse_submit_targets
+)
+from leetcli.utils.table import OUTPUT_FORMATS
+from leetcli.utils.trace import (
+    DEFAULT_TRACE_FILE,
+    TRACE_ENV,
+    _span,
+    _start_trace
+)
 
-LEETCODE_URL = "https://leetcode.com/graphql"
 LEETCODE_LOGIN_PAGE = "https://leetcode.com/accounts/login/"
+SESSION_ATTRIBUTES = ("csrftoken", "session", "language")
+MACHINE_FORMATS = ("json", "jsonl", "csv")
+# Same path as leetcli.utils.daemon.DAEMON_SOCKET; checked here so a run
+# without a daemon never imports the socket/subprocess machinery.
+DAEMON_SOCKET_FILE = os.path.expanduser("~/.leetcode-cli/daemon.sock")
+
+format_option = click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=None,
+    help="Output format: table (boxed), plain (streamed fixed-width), json, jsonl or csv"
+)
 
 class LeetCli:
     """
@@ -18,31 +48,103 @@ class LeetCli:
     - Submit solutions
     - Set default language for submissions
     """
-    def __init__(self):
+    def __init__(self, base_url=None):
         """
         Initialize LeetCli instance.
 
-        - Loads user info from local session if available
-        - Retrieves csrf token, session, and default language
-        - Initializes ProblemManager
         - Adds all CLI commands to `self.cli`
+        - `base_url` points the client at another server (e.g. a local stub)
+
+        Everything else is created on first use, so `--help` and commands
+        that never touch the network skip the heavy imports:
+        - csrf token, session, and default language (one read of session.json)
+        - one pooled LeetClient (and its asyncio twin) shared by both managers
+        - UserInfoManager and ProblemManager
         """
-        self.cli = click.Group(help="leetcli - LeetCode Helper CLI")
-        self.user_manager = UserInfoManager()
-        try:
-            self.csrftoken = self.user_manager._get_csrftoken()
-            self.session = self.user_manager._get_session()
-            self.language = self.user_manager._get_lang()
+        self.cli = click.Group(
+            help="leetcli - LeetCode Helper CLI",
+            params=[
+                click.Option(
+                    ["--trace"],
+                    is_flag=True,
+                    help=f"Record a Chrome trace of this run to ${TRACE_ENV} or ./{DEFAULT_TRACE_FILE}.",
+                )
+            ],
+            callback=self._setup_trace
+        )
+        self._session_loaded = False
+        self.base_url = base_url
+        self._client = None
+        self._user_manager = None
+        self._problem_manager = None
+        self._add_commands()
 
-        except ConnectionError as e:
-            self.userinfo = ConnectionError
+    def __getattr__(self, name):
+        if name in SESSION_ATTRIBUTES and not self.__dict__.get("_session_loaded"):
+            self._load_session()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def _load_session(self):
+        """Read csrftoken, session and default language from session.json once."""
+        self._session_loaded = True
+        self.csrftoken = None
+        self.session = None
+        from leetcli.auth.user import UserInfoManager
+
+        try:
+            userinfo = UserInfoManager._load_userinfo()
+            self.csrftoken = userinfo['csrftoken']
+            self.session = userinfo['LEETCODE_SESSION']
+            self.language = userinfo['language']
 
         except Exception:
             self.userinfo = Exception
             self.csrftoken = None
             self.session = None
-        self.problem_manager = ProblemManager()
-        self._add_commands()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from leetcli.utils.client import LeetClient
+            if self.base_url:
+                self._client = LeetClient(self.csrftoken, self.session, base_url=self.base_url)
+            else:
+                self._client = LeetClient(self.csrftoken, self.session)
+        return self._client
+
+    @property
+    def user_manager(self):
+        if self._user_manager is None:
+            from leetcli.auth.user import UserInfoManager
+            self._user_manager = UserInfoManager(self.client)
+        return self._user_manager
+
+    @property
+    def problem_manager(self):
+        if self._problem_manager is None:
+            from leetcli.problems.problem import ProblemManager
+            self._problem_manager = ProblemManager(self.client)
+        return self._problem_manager
+
+    def _reset_request_state(self):
+        """Drop per-command flags so a long-lived instance (daemon) starts each command clean."""
+        self.__dict__.pop("userinfo", None)
+        if self._problem_manager is not None:
+            from leetcli.problems.problem import DEFAULT_BATCH_SIZE
+            self._problem_manager.refresh = False
+            self._problem_manager.offline = False
+            self._problem_manager.problem_dirs = False
+            self._problem_manager.batch_size = DEFAULT_BATCH_SIZE
+
+    def _setup_trace(self, trace):
+        """Enable tracing for --trace or $LEETCLI_TRACE and time the whole command."""
+        path = os.environ.get(TRACE_ENV) or (DEFAULT_TRACE_FILE if trace else None)
+        if not path:
+            return
+        _start_trace(path)
+        ctx = click.get_current_context()
+        ctx.with_resource(_span(f"leetcli {ctx.invoked_subcommand}", "command"))
 
     def _add_commands(self):
         self.cli.add_command(self.login)
@@ -52,6 +154,11 @@ class LeetCli:
         self.cli.add_command(self.set)
         self.cli.add_command(self.get)
         self.cli.add_command(self.submit)
+        self.cli.add_command(self.test)
+        self.cli.add_command(self.cache)
+        self.cli.add_command(self.search)
+        self.cli.add_command(self.sync)
+        self.cli.add_command(self.daemon)
 
     @click.command()
     @click.option(
@@ -59,8 +166,13 @@ class LeetCli:
         prompt="Set default language",
         help="Set default programming language.",
     )
+    @click.option(
+        "--browser",
+        default=None,
+        help="Read cookies from this browser only (e.g. chrome, firefox, safari) instead of probing all",
+    )
     @click.pass_obj
-    def login(obj, default_language):
+    def login(obj, default_language, browser):
         """
         Login to LeetCode and save session info locally.
 
@@ -71,23 +183,32 @@ class LeetCli:
 
         Options:
         --default-language: Default language to use for submissions
+        --browser: Browser to read cookies from; skips probing the others
 
         Notes:
+        - Browsers are probed concurrently (10s each at most) and the one
+          that worked is tried first on the next login.
         - On macOS Safari, policies may restrict browser access.
         - If login fails, you may need to log in manually via the browser.
         """
         try:
-            cookies = obj.user_manager._create_userinfo()
+            cookies = obj.user_manager._create_userinfo(browser)
+            if cookies:
+                click.secho(f"Found LeetCode session in {obj.user_manager.browser}.", fg="yellow")
             obj.user_manager._save_userinfo(
                 cookies, 
                 default_language, 
                 LEETCODE_LANGUAGES
             )
+            obj.csrftoken = obj.user_manager._get_csrftoken()
+            obj.session = obj.user_manager._get_session()
+            obj.client._set_auth(obj.csrftoken, obj.session)
 
             click.secho("Checking current login status...", fg="yellow")
             
-            obj.userinfo = obj.user_manager._get_userinfo(LEETCODE_URL)
+            obj.userinfo = obj.user_manager._get_userinfo()
             if isinstance(obj.userinfo, (list, tuple)) and obj.userinfo[0]:
+                obj.user_manager._remember_status(obj.userinfo)
                 click.secho(f"""Logged in successfully!\nCurrent user: {obj.userinfo[1]}""", fg="green")
             else:
                 click.secho(f"Please log in using main browser: {LEETCODE_LOGIN_PAGE}", fg="red")
@@ -112,8 +233,14 @@ class LeetCli:
                 click.secho("An unknown error occurred. Please report this issue on GitHub.", fg="red")
 
     @click.command()
+    @click.option(
+        "--refresh",
+        is_flag=True,
+        help="Ask LeetCode now instead of using a status fetched in the last 30 seconds"
+    )
+    @format_option
     @click.pass_obj
-    def status(obj):
+    def status(obj, refresh, fmt):
         """
         Check current login status and problem-solving progress.
 
@@ -121,17 +248,25 @@ class LeetCli:
         - Whether user is logged in
         - Current username
         - Progress summary (solved / unsolved / attempted problems)
+
+        With --format json/jsonl/csv only the progress goes to stdout.
+
+        The answer is cached for 30 seconds (per login session), so shell
+        prompts and status bars can call this often; --refresh bypasses it.
         """
         try:
-            obj.userinfo = obj.user_manager._get_userinfo(LEETCODE_URL)
+            obj.userinfo, records, _ = obj.user_manager._get_status(refresh)
             if isinstance(obj.userinfo, (list, tuple)) and obj.userinfo[0]:
-                user_progress = obj.user_manager._get_user_progress(
-                    obj.csrftoken,
-                    obj.session,
-                    obj.userinfo
+                user_progress = obj.user_manager._progress_table(
+                    records,
+                    fmt or "table"
+                )
+                click.secho(
+                    f"""Login: {obj.userinfo[0]}\nCurrent user: {obj.userinfo[1]}""",
+                    fg="green",
+                    err=fmt in MACHINE_FORMATS
                 )
-                click.secho(f"""Login: {obj.userinfo[0]}\nCurrent user: {obj.userinfo[1]}""", fg="green")
-                click.secho(user_progress, fg="bright_white")
+                click.secho(user_progress, fg=None if fmt in MACHINE_FORMATS else "bright_white")
 
             else:
                 click.secho(f"""Login Failed\nUse "leetcli login" """, fg="red")
@@ -203,8 +338,32 @@ class LeetCli:
         show_default=True,
         help="Start index (e.g., --start=50)"
     )
+    @click.option(
+        "--limit",
+        default=10,
+        type=click.IntRange(min=1),
+        show_default=True,
+        help="Number of problems to show"
+    )
+    @click.option(
+        "--all-pages",
+        is_flag=True,
+        help="Stream every problem from --start to the end"
+    )
+    @click.option(
+        "--tag",
+        "tags",
+        multiple=True,
+        help="Only problems with this topic tag, e.g. --tag dynamic-programming (repeatable)"
+    )
+    @click.option(
+        "--any-tag",
+        is_flag=True,
+        help="With several --tag, match problems having any of them instead of all"
+    )
+    @format_option
     @click.pass_obj
-    def problem(obj, daily, mode, diff, start):
+    def problem(obj, daily, mode, diff, start, limit, all_pages, tags, any_tag, fmt):
         """
         Search and display problems.
 
@@ -213,38 +372,80 @@ class LeetCli:
         mode: Filter by solved / unsolved / tried / all
         diff: Filter by difficulty (easy, medium, hard)
         start: Start index for pagination
+        limit: Number of problems to show
+        all_pages: Show every problem after start
+        tags: Topic tags to filter by (all of them, or any with --any-tag)
+        fmt: table, plain, json, jsonl or csv
 
         Notes:
         - Default mode shows all problems.
         - Can combine with difficulty filter.
+        - Listings longer than one page are streamed row by row while the
+          next page is fetched in the background (plain by default;
+          plain, jsonl and csv stream, table and json wait for every row).
+        - --tag listings come from the local catalog's tag index with no
+          network request (only the very first run syncs the catalog);
+          solved status is as of the last sync.
         """
         try:
+            color = None if fmt in MACHINE_FORMATS else "bright_white"
+            if tags and daily is None:
+                result, shown, total = obj.problem_manager._get_tagged_problems(
+                    tags,
+                    not any_tag,
+                    mode,
+                    diff,
+                    start,
+                    None if all_pages else limit,
+                    fmt or "table"
+                )
+                if total == 0:
+                    return click.secho("No problem matches these tags.", fg="yellow", err=fmt in MACHINE_FORMATS)
+                click.secho(result, fg=color)
+                return click.secho(
+                    f"{shown} of {total} problems tagged {(' or ' if any_tag else ' and ').join(tags)}",
+                    fg="green",
+                    err=fmt in MACHINE_FORMATS
+                )
+
             if daily == 'daily':
-                result = obj.problem_manager._get_daily_problem(
-                    obj.csrftoken,
-                    obj.session,
+                result = obj.problem_manager._get_daily_problem(fmt or "table")
 
+            elif daily == None and (all_pages or limit > 10):
+                lines = obj.problem_manager._stream_problemlist(
+                    mode,
+                    diff,
+                    start,
+                    None if all_pages else limit,
+                    fmt or "plain"
                 )
+                for line in lines:
+                    click.secho(line, fg=color)
+                return
 
             elif daily == None:
                 result = obj.problem_manager._get_problemlist(
-                    obj.csrftoken, 
-                    obj.session, 
                     mode, 
                     diff,
                     start,
+                    fmt or "table",
+                    limit
                 )
             else:
-                click.secho(f"""Use "leetcli problem daily" or "leetcli problem [-option] [--start] """, fg="red")
-            
-            click.secho(result, fg="bright_white") 
+                click.secho(f"""Use "leetcli problem daily" or "leetcli problem [-option] [--start] [--limit] """, fg="red")
+                return
+
+            click.secho(result, fg=color) 
 
-        except requests.exceptions.ConnectionError as e:
+        except ConnectionError as e:
             click.secho(f"""Check internet connection. """, fg="red")
 
         except FileNotFoundError as e:
             click.secho(f"""Login Failed\nUse "leetcli login" """, fg="red")
 
+        except LookupError as e:
+            click.secho(str(e), fg="red")
+
         except Exception as e:
             click.secho(f"An unknown error occurred. Please report this issue on GitHub. ({e})", fg="red")
 
@@ -280,43 +481,130 @@ class LeetCli:
     @click.command()
     @click.argument("problem_id", required=True)
     @click.argument("language", required=False)
+    @click.option(
+        "--workers",
+        default=8,
+        type=click.IntRange(1, 32),
+        show_default=True,
+        help="Concurrent downloads when several problems are selected"
+    )
+    @click.option(
+        "--batch-size",
+        default=10,
+        type=click.IntRange(1, 50),
+        show_default=True,
+        help="Problems fetched per GraphQL request when several are selected"
+    )
+    @click.option(
+        "--refresh",
+        is_flag=True,
+        help="Ignore cached problem details and download them again"
+    )
+    @click.option(
+        "--offline",
+        is_flag=True,
+        help="Use only the local catalog and cache, never the network"
+    )
+    @click.option(
+        "--langs",
+        default=None,
+        help="Comma-separated languages to write templates for, e.g. py,cpp,rs"
+    )
+    @click.option(
+        "--all-langs",
+        is_flag=True,
+        help="Write a template for every language the problem offers"
+    )
+    @click.option(
+        "--problem-dir",
+        is_flag=True,
+        help="Put each problem's files in its own directory, e.g. 1_Two_Sum/"
+    )
     @click.pass_obj
-    def get(obj, problem_id, language):
+    def get(obj, problem_id, language, workers, batch_size, refresh, offline, langs, all_langs, problem_dir):
         """
         Download a problem from LeetCode.
 
         Arguments:
-        problem_id: Problem frontend ID or "daily"
+        problem_id: Problem frontend ID, "daily", or a selection such as "1-300,450,daily"
         language: Optional, use default language if not provided
+        workers: Number of concurrent downloads for a selection
+        batch_size: Problems fetched per request for a selection
+        refresh: Bypass the problem cache
+        offline: Serve everything from the local catalog and cache
+        langs: Several languages at once, e.g. "py,cpp,rs"
+        all_langs: Every language the problem has a template for
+        problem_dir: One directory per problem
 
         Notes:
         - Downloads problem template in the specified language.
+        - --langs/--all-langs write every template from a single fetch.
         - Supports both relative and absolute file paths.
+        - A selection is downloaded concurrently; failures are reported per problem.
+        - Problem details are cached, so fetching another language is free.
         """
         try:
-            if language == None:
+            if language is not None and (langs is not None or all_langs):
+                return click.secho("Give either a language or --langs/--all-langs, not both.", fg="red")
+            if refresh and offline:
+                return click.secho("--refresh and --offline cannot be used together.", fg="red")
+            if langs is not None and all_langs:
+                return click.secho("--langs and --all-langs cannot be used together.", fg="red")
+            if all_langs:
+                language = ALL_LANGUAGES
+            elif langs is not None:
+                try:
+                    language = _parse_languages(langs)
+                except ValueError as e:
+                    return click.secho(str(e), fg="red")
+            elif language is None:
                 language = obj.language
-            else:
-                language = language
+            obj.problem_manager.refresh = refresh
+            obj.problem_manager.offline = offline
+            obj.problem_manager.problem_dirs = problem_dir
+            obj.problem_manager.batch_size = batch_size
+
+            if _is_problem_spec(problem_id):
+                items = _parse_problem_spec(problem_id)
+
+                def on_result(item, error):
+                    if error is None:
+                        click.secho(f"{item}: downloaded", fg="green")
+                    else:
+                        click.secho(f"{item}: {error}", fg="red")
+
+                results, elapsed = obj.problem_manager._download_problems(
+                    items,
+                    language,
+                    workers,
+                    on_result
+                )
+                succeeded = sum(1 for _, error in results if error is None)
+                rate = len(results) / elapsed if elapsed > 0 else float(len(results))
+                return click.secho(
+                    f"Downloaded {succeeded}/{len(results)} problems in {elapsed:.2f}s ({rate:.1f} problems/sec)",
+                    fg="green" if succeeded == len(results) else "yellow"
+                )
 
             if problem_id == 'daily':
-                obj.problem_manager._download_problem_daily(
-                    obj.csrftoken,
-                    obj.session,
+                skipped = obj.problem_manager._download_problem_daily(
                     language
                 )
             
             else:
-                problem_id = int(problem_id)
-                obj.problem_manager._download_problem(
-                    obj.csrftoken, 
-                    obj.session,
+                try:
+                    problem_id = int(problem_id)
+                except ValueError:
+                    raise ValueError(f"Invalid problem ID: {problem_id}")
+                skipped = obj.problem_manager._download_problem(
                     problem_id,
                     language
                 )
+            if skipped:
+                click.secho(f"No template for: {', '.join(skipped)}", fg="yellow")
             return click.secho(f"""Download Succeed!""", fg="green")
             
-        except requests.exceptions.ConnectionError as e:
+        except ConnectionError as e:
             click.secho(f"""Check internet connection. """, fg="red")
 
         except TypeError as e:
@@ -326,11 +614,126 @@ class LeetCli:
             click.secho(f"""Login Failed\nUse "leetcli login" """, fg="red")
 
         except ValueError as e:
-            click.secho(f"""Please enter either "leetcli get daily" or a "leetcli get [problem_id]".""", fg="red")
+            click.secho(str(e), fg="red")
+            click.secho(f"""Please enter either "leetcli get daily", "leetcli get [problem_id]" or a selection like "leetcli get 1-10,42".""", fg="red")
 
         except AttributeError as e:
             click.secho(f"""Failed to get language, try "leetcli set [language]" """, fg="red")
 
+        except LookupError as e:
+            click.secho(str(e), fg="red")
+
+        except Exception as e:
+            click.secho(f"An unknown error occurred. Please report this issue on GitHub. {e}", fg="red")
+
+
+    @click.command()
+    @click.argument("targets", nargs=-1, required=True)
+    @click.option(
+        "--timeout",
+        default=60.0,
+        type=float,
+        show_default=True,
+        help="Seconds to wait for the judge before giving up (per round of --workers submissions)"
+    )
+    @click.option(
+        "--workers",
+        default=DEFAULT_SUBMIT_WORKERS,
+        type=click.IntRange(1, 8),
+        show_default=True,
+        help="Solutions submitted at the same time when submitting several"
+    )
+    @format_option
+    @click.pass_obj
+    def submit(obj, targets, timeout, workers, fmt):
+        """
+        Submit solution files to LeetCode.
+
+        Arguments:
+        targets: "PROBLEM_ID FILE" pairs, files named like 1_Two_Sum.py,
+                 or directories of such files (e.g. "leetcli submit 1 a.py 2 b.py")
+        timeout: Seconds to wait for the judge
+        workers: Submissions in flight at once
+        fmt: table, plain, json, jsonl or csv
+
+        Notes:
+        - File extension or language name is used to detect submission language.
+        - A directory must hold one solution per problem; with several (e.g.
+          from "get --langs"), name the file to submit.
+        - Polls the judge with backoff and prints the verdict as soon as it is final.
+        - With several solutions, the verdicts of every in-flight submission
+          are polled in one request and a combined table is printed at the end.
+        - Rate limits (HTTP 429) are honoured by waiting as the server asks.
+        """
+        try:
+            pairs = _parse_submit_targets(targets)
+            if len(pairs) > 1:
+                def on_progress(finished, total, elapsed):
+                    click.secho(
+                        f"\rJudging {total} submissions... {finished}/{total} done, {elapsed:.1f}s",
+                        fg="yellow",
+                        nl=False,
+                        err=True
+                    )
+
+                try:
+                    result, failures, elapsed = obj.problem_manager._submit_problems(
+                        pairs,
+                        workers,
+                        timeout * -(-len(pairs) // workers),
+                        on_progress,
+                        fmt or "table"
+                    )
+                finally:
+                    click.echo("\r\033[K", nl=False, err=True)
+                obj.user_manager._forget_status()
+                click.secho(result, fg=None if fmt in MACHINE_FORMATS else "bright_white")
+                return click.secho(
+                    f"{len(pairs) - failures}/{len(pairs)} accepted in {elapsed:.1f}s",
+                    fg="green" if not failures else "yellow",
+                    err=fmt in MACHINE_FORMATS
+                )
+
+            problem_id, filename = pairs[0]
+            submission_id = obj.problem_manager._submit_problem(
+                problem_id,
+                filename,
+            )
+            def on_wait(attempt, elapsed):
+                click.secho(
+                    f"\rJudging submission {submission_id}... {elapsed:.1f}s (check {attempt + 1})",
+                    fg="yellow",
+                    nl=False,
+                    err=True
+                )
+
+            try:
+                result = obj.problem_manager._wait_submit_problem(
+                    submission_id,
+                    timeout,
+                    on_wait,
+                    fmt or "table"
+                )
+            finally:
+                click.echo("\r\033[K", nl=False, err=True)
+            obj.user_manager._forget_status()
+            return click.secho(result, fg=None if fmt in MACHINE_FORMATS else "bright_white")
+
+        except ConnectionError as e:
+            click.secho(f"""Check internet connection. """, fg="red")
+
+        except TimeoutError as e:
+            click.secho(str(e), fg="red")
+
+        except ValueError as e:
+            click.secho(str(e), fg="red")
+
+        except LookupError as e:
+            click.secho(str(e), fg="red")
+
+        except FileNotFoundError as e:
+            click.secho(f"""Login Failed\nUse "leetcli login" """, fg="red")
+
         except Exception as e:
             click.secho(f"An unknown error occurred. Please report this issue on GitHub. {e}", fg="red")
 
@@ -338,42 +741,61 @@ class LeetCli:
     @click.command()
     @click.argument("problem_id", type=int, required=True)
     @click.argument(
-        "filename", 
-        type=click.Path(exists=True),
+        "filename",
+        type=click.Path(exists=True, dir_okay=False),
         required=True
     )
+    @click.option(
+        "--timeout",
+        default=5.0,
+        type=float,
+        show_default=True,
+        help="Seconds each example may run before it is killed"
+    )
+    @click.option("--offline", is_flag=True, help="Only use cached problem details")
+    @format_option
     @click.pass_obj
-    def submit(obj, problem_id, filename):
+    def test(obj, problem_id, filename, timeout, offline, fmt):
         """
-        Submit a solution file to LeetCode.
+        Run a problem's example testcases against a local Python3 solution.
 
         Arguments:
         problem_id: LeetCode problem frontend ID
-        filename: Path to solution file (relative or absolute)
+        filename: Path to a Python3 solution file
+        timeout: Seconds per example
+        fmt: table, plain, json, jsonl or csv
 
         Notes:
-        - File extension or language name is used to detect submission language.
-        - Waits for 10 seconds before checking submission result.
+        - Examples and the function signature come from the problem details
+          and are cached, so later runs need no network.
+        - Each example runs in its own Python process; ListNode and TreeNode
+          arguments are built from the example values.
+        - Nothing is sent to LeetCode; use "leetcli submit" for a real verdict.
         """
         try:
-            submission_id = obj.problem_manager._submit_problem(
-                obj.csrftoken,
-                obj.session,
+            obj.problem_manager.offline = offline
+            result, records = obj.problem_manager._test_problem(
                 problem_id,
                 filename,
+                timeout,
+                fmt or "table"
             )
-            time.sleep(10)
-            result = obj.problem_manager._check_submit_problem(
-                obj.csrftoken,
-                obj.session,
-                submission_id
+            machine = fmt in MACHINE_FORMATS
+            click.secho(result, fg=None if machine else "bright_white")
+            for record in records:
+                if record["error"] and not machine:
+                    click.secho(f"Case {record['case']}:\n{record['error'].rstrip()}", fg="red")
+            passed = sum(1 for record in records if record["result"] == "Passed")
+            click.secho(
+                f"{passed}/{len(records)} examples passed",
+                fg="green" if passed == len(records) else "red",
+                err=machine
             )
-            return click.secho(result, fg="bright_white")
 
-        except requests.exceptions.ConnectionError as e:
+        except ConnectionError as e:
             click.secho(f"""Check internet connection. """, fg="red")
 
-        except ValueError as e:
+        except (ValueError, LookupError) as e:
             click.secho(str(e), fg="red")
 
         except FileNotFoundError as e:
@@ -382,6 +804,215 @@ class LeetCli:
         except Exception as e:
             click.secho(f"An unknown error occurred. Please report this issue on GitHub. {e}", fg="red")
 
+    @click.command()
+    @click.argument("terms", nargs=-1, required=True)
+    @click.option(
+        "--diff",
+        type=click.Choice(["easy", "medium", "hard"], case_sensitive=False),
+        default=None,
+        help="Filter by difficulty (easy, medium, hard)"
+    )
+    @click.option(
+        "--limit",
+        default=20,
+        type=click.IntRange(min=1),
+        show_default=True,
+        help="Maximum number of results"
+    )
+    @click.pass_obj
+    def search(obj, terms, diff, limit):
+        """
+        Search downloaded problems by their description, offline.
+
+        Arguments:
+        terms: Words to look for, e.g. sliding window
+
+        Notes:
+        - Only problems fetched with "leetcli get" are indexed.
+        - Results are ranked with BM25.
+        - Quote a phrase to require the words in order: leetcli search '"modulo 10^9+7"'
+        """
+        try:
+            table, count, elapsed = obj.problem_manager._search_problems(
+                " ".join(terms),
+                diff,
+                limit
+            )
+            if count == 0:
+                return click.secho("No downloaded problem matches.", fg="yellow")
+            click.secho(table, fg="bright_white")
+            click.secho(f"{count} results in {elapsed * 1000:.1f} ms", fg="green")
+
+        except Exception as e:
+            click.secho(f"An unknown error occurred. Please report this issue on GitHub. {e}", fg="red")
+
+    @click.command()
+    @click.option(
+        "--full",
+        is_flag=True,
+        help="Re-download every catalog row instead of only what changed"
+    )
+    @click.pass_obj
+    def sync(obj, full):
+        """
+        Update the local problem catalog.
+
+        Notes:
+        - Only new problems are downloaded in full; for the rest only
+          solved status and acceptance rate are refreshed, so a daily
+          sync takes a couple of requests.
+        - The catalog backs problem ID lookups and "leetcli problem --tag".
+        """
+        try:
+            started = time.monotonic()
+            stats = obj.problem_manager._sync_catalog(full)
+            elapsed = time.monotonic() - started
+            click.secho(
+                f"Catalog: {stats['total']} problems, {stats['new']} new, {stats['updated']} updated "
+                f"({stats['requests']} requests, {elapsed:.2f}s)",
+                fg="green"
+            )
+            if stats["previous"] is not None:
+                previous = datetime.fromtimestamp(float(stats["previous"]))
+                click.secho(f"Previous sync: {previous:%Y-%m-%d %H:%M}", fg="bright_white")
+
+        except ConnectionError as e:
+            click.secho(f"""Check internet connection. """, fg="red")
+
+        except Exception as e:
+            click.secho(f"An unknown error occurred. Please report this issue on GitHub. {e}", fg="red")
+
+    @click.group()
+    def cache():
+        """
+        Inspect or clear the local problem cache.
+
+        Problem details are cached in ~/.leetcode-cli/cache by titleSlug.
+        """
+
+    @cache.command("stats")
+    @click.pass_obj
+    def cache_stats(obj):
+        """
+        Show cache size, limits and hit ratio.
+        """
+        stats = obj.problem_manager.cache._stats()
+        click.secho(
+            f"Entries:   {stats['entries']}\n"
+            f"Size:      {stats['bytes'] / 1024:.1f} KB / {stats['max_bytes'] / 1024 / 1024:.1f} MB\n"
+            f"Stale:     {stats['stale_bytes'] / 1024:.1f} KB\n"
+            f"TTL:       {stats['ttl'] / 3600:g} hours\n"
+            f"Hits:      {stats['hits']}\n"
+            f"Misses:    {stats['misses']}\n"
+            f"Hit ratio: {stats['hit_ratio'] * 100:.1f}%",
+            fg="bright_white"
+        )
+
+    @cache.command("clear")
+    @click.pass_obj
+    def cache_clear(obj):
+        """
+        Delete every cached problem and reset the counters.
+        """
+        removed = obj.problem_manager.cache._clear()
+        click.secho(f"Removed {removed} cached problems.", fg="green")
+
+    @cache.command("compact")
+    @click.pass_obj
+    def cache_compact(obj):
+        """
+        Rewrite the cache file without replaced or evicted problems.
+        """
+        reclaimed = obj.problem_manager.cache._compact()
+        click.secho(f"Reclaimed {reclaimed / 1024:.1f} KB.", fg="green")
+
+    @cache.command("config")
+    @click.option(
+        "--ttl",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Hours before a cached problem is fetched again"
+    )
+    @click.option(
+        "--max-size",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Maximum cache size in MB; least recently used problems are evicted first"
+    )
+    @click.pass_obj
+    def cache_config(obj, ttl, max_size):
+        """
+        Set the cache TTL and maximum size.
+        """
+        cache = obj.problem_manager.cache
+        cache._configure(
+            ttl=ttl * 3600 if ttl is not None else None,
+            max_bytes=max_size * 1024 * 1024 if max_size is not None else None
+        )
+        click.secho(
+            f"TTL: {cache.ttl / 3600:g} hours, max size: {cache.max_bytes / 1024 / 1024:g} MB",
+            fg="blue"
+        )
+
+    @click.group()
+    def daemon():
+        """
+        Keep a warm leetcli process in the background.
+
+        While the daemon runs, every leetcli command is sent to it over a
+        Unix socket (~/.leetcode-cli/daemon.sock) and its output streamed
+        back, so imports, the HTTP connection pool, the session and the
+        local catalog are reused instead of set up again on every run.
+        Commands fall back to running locally when no daemon answers.
+        login, logout and --trace always run locally; set
+        LEETCLI_NO_DAEMON=1 to bypass the daemon for one command.
+        """
+
+    @daemon.command("start")
+    @click.option(
+        "--idle-timeout",
+        default=60,
+        type=click.IntRange(min=1),
+        show_default=True,
+        help="Minutes without a command before the daemon exits"
+    )
+    def daemon_start(idle_timeout):
+        """
+        Start the background daemon (no-op if it is already running).
+        """
+        from leetcli.utils.daemon import _start_daemon
+
+        try:
+            pid = _start_daemon(idle_timeout * 60.0)
+            click.secho(f"Daemon running (pid {pid}).", fg="green")
+
+        except (OSError, TimeoutError) as e:
+            click.secho(str(e), fg="red")
+
+    @daemon.command("stop")
+    def daemon_stop():
+        """
+        Stop the background daemon.
+        """
+        from leetcli.utils.daemon import _stop_daemon
+
+        if _stop_daemon():
+            click.secho("Daemon stopped.", fg="green")
+        else:
+            click.secho("No daemon is running.", fg="yellow")
+
+    @daemon.command("status")
+    def daemon_status():
+        """
+        Show whether the daemon is running.
+        """
+        from leetcli.utils.daemon import _control
+
+        pid = _control("ping")
+        if pid is None:
+            click.secho("No daemon is running.", fg="yellow")
+        else:
+            click.secho(f"Daemon running (pid {pid}).", fg="green")
 
     def run(self):
         """EntryPoint"""
@@ -389,6 +1020,16 @@ class LeetCli:
 
 
 def main():
+    if (
+        not os.environ.get("LEETCLI_NO_DAEMON")
+        and not os.environ.get(TRACE_ENV)
+        and os.path.exists(DAEMON_SOCKET_FILE)
+    ):
+        from leetcli.utils.daemon import _forward
+
+        code = _forward(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
     app = LeetCli()
     app.run()
 
@@ -0,0 +1,289 @@
+import os
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+from leetcli.utils.trace import _traced
+
+CATALOG_DIR = Path(os.path.expanduser("~/.leetcode-cli"))
+CATALOG_FILE = CATALOG_DIR / "catalog.db"
+
+CATALOG_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS problems (
+        frontend_id   TEXT PRIMARY KEY,
+        question_id   TEXT NOT NULL,
+        title         TEXT NOT NULL,
+        title_slug    TEXT NOT NULL,
+        difficulty    TEXT,
+        ac_rate       REAL,
+        is_paid_only  INTEGER NOT NULL DEFAULT 0,
+        status        TEXT,
+        topic_tags    TEXT NOT NULL DEFAULT '[]'
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_problems_slug ON problems (title_slug);
+    CREATE TABLE IF NOT EXISTS problem_tags (
+        tag          TEXT NOT NULL,
+        frontend_id  TEXT NOT NULL,
+        PRIMARY KEY (tag, frontend_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_problem_tags_id ON problem_tags (frontend_id);
+    CREATE TABLE IF NOT EXISTS catalog_meta (
+        key    TEXT PRIMARY KEY,
+        value  TEXT
+    );
+"""
+# Catalog `status` values for the list modes of `leetcli problem`.
+STATUS_FILTERS = {
+    "solved": "p.status = 'ac'",
+    "tried": "p.status = 'notac'",
+    "unsolved": "p.status IS NULL",
+}
+
+
+class ProblemCatalog:
+    """
+    Local SQLite copy of `questionList`.
+
+    Resolves a frontend ID (the number shown on the site) to `titleSlug`
+    and `questionId` without a network round trip, and keeps a
+    tag -> frontend ID index (`problem_tags`) for offline tag filtering.
+    """
+    def __init__(
+        self,
+        path: Path = CATALOG_FILE
+    ):
+        self.path = Path(path)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(
+        self
+    ) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(CATALOG_SCHEMA)
+            if conn.execute("SELECT 1 FROM problem_tags LIMIT 1").fetchone() is None:
+                # Catalogs synced before the tag index existed.
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO problem_tags (tag, frontend_id) VALUES (?, ?)",
+                        (
+                            (tag, frontend_id)
+                            for frontend_id, tags in conn.execute("SELECT frontend_id, topic_tags FROM problems")
+                            for tag in json.loads(tags)
+                        )
+                    )
+            self._conn = conn
+        return self._conn
+
+    @_traced("catalog.upsert")
+    def _upsert(
+        self,
+        questions: Iterable[dict]
+    ) -> int:
+        """
+        Insert or refresh full list rows; returns how many were inserted
+        or actually changed (identical rows are left untouched).
+        """
+        rows = [
+            (
+                str(q["questionFrontendId"]),
+                str(q["questionId"]),
+                q["title"],
+                q["titleSlug"],
+                q.get("difficulty"),
+                float(q["acRate"]) if q.get("acRate") is not None else None,
+                int(bool(q.get("isPaidOnly"))),
+                q.get("status"),
+                json.dumps([t["slug"] for t in q.get("topicTags") or []]),
+            )
+            for q in questions
+        ]
+        with self._lock:
+            conn = self._connect()
+            before = conn.total_changes
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO problems (
+                        frontend_id, question_id, title, title_slug, difficulty,
+                        ac_rate, is_paid_only, status, topic_tags
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (frontend_id) DO UPDATE SET
+                        question_id  = excluded.question_id,
+                        title        = excluded.title,
+                        title_slug   = excluded.title_slug,
+                        difficulty   = excluded.difficulty,
+                        ac_rate      = excluded.ac_rate,
+                        is_paid_only = excluded.is_paid_only,
+                        status       = excluded.status,
+                        topic_tags   = excluded.topic_tags
+                    WHERE (
+                        problems.question_id, problems.title, problems.title_slug,
+                        problems.difficulty, problems.ac_rate, problems.is_paid_only,
+                        problems.status, problems.topic_tags
+                    ) IS NOT (
+                        excluded.question_id, excluded.title, excluded.title_slug,
+                        excluded.difficulty, excluded.ac_rate, excluded.is_paid_only,
+                        excluded.status, excluded.topic_tags
+                    )
+                    """,
+                    rows
+                )
+                changed = conn.total_changes - before
+                conn.executemany(
+                    "DELETE FROM problem_tags WHERE frontend_id = ?",
+                    [(row[0],) for row in rows]
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO problem_tags (tag, frontend_id) VALUES (?, ?)",
+                    [(tag, row[0]) for row in rows for tag in json.loads(row[8])]
+                )
+        return changed
+
+    def _get(
+        self,
+        frontend_id
+    ) -> Optional[dict]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM problems WHERE frontend_id = ?",
+                (str(frontend_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        problem = dict(row)
+        problem["is_paid_only"] = bool(problem["is_paid_only"])
+        problem["topic_tags"] = json.loads(problem["topic_tags"])
+        return problem
+
+    def _count(
+        self
+    ) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+
+    def _frontend_ids(
+        self
+    ) -> set:
+        with self._lock:
+            return {row[0] for row in self._connect().execute("SELECT frontend_id FROM problems")}
+
+    @_traced("catalog.update_progress")
+    def _update_progress(
+        self,
+        questions: Iterable[dict]
+    ) -> int:
+        """
+        Apply `status` and `acRate` from slim list rows to known problems;
+        returns how many rows actually changed.
+        """
+        rows = []
+        for q in questions:
+            ac_rate = float(q["acRate"]) if q.get("acRate") is not None else None
+            rows.append((q.get("status"), ac_rate, str(q["questionFrontendId"]), q.get("status"), ac_rate))
+        with self._lock:
+            conn = self._connect()
+            before = conn.total_changes
+            with conn:
+                conn.executemany(
+                    """
+                    UPDATE problems SET status = ?, ac_rate = ?
+                    WHERE frontend_id = ? AND (status IS NOT ? OR ac_rate IS NOT ?)
+                    """,
+                    rows
+                )
+            return conn.total_changes - before
+
+    def _get_meta(
+        self,
+        key: str
+    ) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM catalog_meta WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(
+        self,
+        **values
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                    [(key, str(value)) for key, value in values.items()]
+                )
+
+    @_traced("catalog.filter_tags")
+    def _filter_tags(
+        self,
+        tags: Sequence[str],
+        match_all: bool = True,
+        difficulty: Optional[str] = None,
+        mode: str = "all",
+        start: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[dict], int]:
+        """
+        Problems carrying every tag (or any, with `match_all=False`),
+        optionally narrowed by difficulty and solved/unsolved/tried status.
+
+        Returns (rows from `start`, up to `limit`, total matches), ordered
+        by frontend ID.
+        """
+        tags = list(dict.fromkeys(tag.strip().lower().replace(" ", "-") for tag in tags))
+        where = []
+        params: list = list(tags)
+        if difficulty:
+            where.append("p.difficulty = ? COLLATE NOCASE")
+            params.append(difficulty)
+        if mode in STATUS_FILTERS:
+            where.append(STATUS_FILTERS[mode])
+
+        having = f"HAVING COUNT(*) = {len(tags)}" if match_all else ""
+        sql = f"""
+            SELECT p.*, COUNT(*) OVER () AS total FROM problems p
+            JOIN (
+                SELECT frontend_id FROM problem_tags
+                WHERE tag IN ({", ".join("?" * len(tags))})
+                GROUP BY frontend_id {having}
+            ) t USING (frontend_id)
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY CAST(p.frontend_id AS INTEGER)
+            LIMIT ? OFFSET ?
+        """
+        params.extend((-1 if limit is None else limit, start))
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        total = rows[0]["total"] if rows else 0
+        problems = []
+        for row in rows:
+            problem = dict(row)
+            del problem["total"]
+            problem["is_paid_only"] = bool(problem["is_paid_only"])
+            problem["topic_tags"] = json.loads(problem["topic_tags"])
+            problems.append(problem)
+        return problems, total
+
+    def _tags(
+        self
+    ) -> dict:
+        """{tag: number of problems} for every indexed tag."""
+        with self._lock:
+            return dict(self._connect().execute(
+                "SELECT tag, COUNT(*) FROM problem_tags GROUP BY tag ORDER BY tag"
+            ).fetchall())
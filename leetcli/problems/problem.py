@@ -1,186 +1,687 @@
 import os
 import json
-import requests
-from tabulate import tabulate
-from bs4 import BeautifulSoup
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from leetcli.utils.query import (
     _req_problem_query,
-    _req_problem_detail_query,
-    _req_problem_daily_query,
-    _req_problem_solution_detail_query
+    _req_problem_status_query,
+    _req_problem_detail_batch_query,
+    _req_problem_daily_row_query,
+    _req_problem_daily_slim_query,
+    _req_problem_solution_detail_query,
+    _req_problem_solution_detail_batch_query
 )
 from leetcli.utils.variable import (
     _req_problem_variable,
-    _req_one_problem_variable,
-    _req_problem_detail_variable,
+    _req_problem_page_variable,
+    _req_problem_detail_batch_variable,
     _req_problem_submit_variable,
-    _req_problem_solution_detail_variable
-)
-from leetcli.utils.req import (
-    _req_header, 
-    _req_cookies,
-    _req_solution_header
+    _req_problem_solution_detail_variable,
+    _req_problem_solution_detail_batch_variable
 )
 from leetcli.utils.file import (
     _create_code_file,
+    _create_code_files,
     _create_markdown_file,
-    _get_code_str
+    _get_code_str,
+    _problem_basename
 )
 from leetcli.utils.language import (
+    ALL_LANGUAGES,
     _detect_language
 )
-from leetcli.problems.status_code import STATUS_CODE_MAP
+from leetcli.utils.poll import (
+    _poll,
+    _apoll
+)
+from leetcli.utils.table import _render
+from leetcli.utils.markdown import _html_to_markdown
+from leetcli.utils.trace import (
+    _span,
+    _traced
+)
+from leetcli.utils.cache import DetailCache
+from leetcli.utils.batch import (
+    DEFAULT_BATCH_SIZE,
+    _chunks,
+    _run_batch,
+    _arun_batch
+)
+from leetcli.problems.status_code import (
+    STATUS_CODE_MAP,
+    STATUS_ACCEPTED,
+    STATUS_PENDING
+)
+from leetcli.problems.catalog import ProblemCatalog
+from leetcli.problems.search import SearchIndex
+from leetcli.problems.runner import (
+    DEFAULT_TEST_TIMEOUT,
+    _run_examples
+)
 
-LEETCODE_URL = "https://leetcode.com/graphql"
+SYNC_PAGE_SIZE = 2000
+LIST_PAGE_SIZE = 100
+PROBLEM_COLUMNS = [
+    ("id", "ID", 5),
+    ("title", "Title", 60),
+    ("difficulty", "Difficulty", 10),
+    ("ac_rate", "Acceptance", 10),
+    ("paid_only", "isPaidOnly", 10),
+    ("status", "Status", 6),
+]
+SEARCH_COLUMNS = [
+    ("id", "ID", 5),
+    ("title", "Title", 60),
+    ("difficulty", "Difficulty", 10),
+    ("score", "Score", 8),
+]
+SUBMISSION_COLUMNS = [
+    ("status_code", "Status Code", 11),
+    ("result", "Result", 24),
+    ("runtime", "Runtime (ms)", 12),
+    ("memory", "Memory (KB)", 11),
+    ("passed", "Passed", 9),
+    ("runtime_error", "Runtime Error", 60),
+]
+SUBMISSION_FIELDS = (
+    "submission_id", "status_code", "result", "runtime",
+    "memory", "total_correct", "total_testcases", "runtime_error"
+)
+BATCH_SUBMISSION_COLUMNS = [
+    ("problem_id", "ID", 5),
+    ("file", "File", 30),
+] + SUBMISSION_COLUMNS
+TEST_COLUMNS = [
+    ("case", "#", 3),
+    ("input", "Input", 40),
+    ("expected", "Expected", 20),
+    ("output", "Output", 20),
+    ("result", "Result", 19),
+    ("elapsed_ms", "Time (ms)", 9),
+]
+STATUS_ICONS = {"ac": "✅", "notac": "⚠️", None: "❌"}
 
 class ProblemManager():
-    def __init__(self):
-        pass
+    """
+    Problem listing, download, submission and local testing.
+
+    Every network operation has a blocking form driven by `client` and a
+    coroutine form (`_a...`) driven by `aclient`, an `AsyncLeetClient`
+    created from `client` on first use unless one is passed in. Both share
+    the catalog, the detail cache and the search index. The CLI uses the
+    blocking forms, so proxies and CA bundles configured for `requests`
+    apply to every command.
+    """
+    def __init__(self, client, aclient=None):
+        self.client = client
+        self._aclient = aclient
+        self.catalog = ProblemCatalog()
+        self.cache = DetailCache()
+        self.search_index = SearchIndex()
+        self.refresh = False
+        self.offline = False
+        self.problem_dirs = False
+        self.batch_size = DEFAULT_BATCH_SIZE
+
+    @property
+    def aclient(self):
+        if self._aclient is None:
+            from leetcli.utils.aclient import AsyncLeetClient
+            self._aclient = AsyncLeetClient(
+                self.client.csrftoken,
+                self.client.session,
+                base_url=self.client.base_url
+            )
+        return self._aclient
+
+    @_traced("problem.sync_catalog")
+    def _sync_catalog(
+        self,
+        full=False,
+        graphql=None
+    ) -> dict:
+        """
+        Bring the local catalog up to date.
+
+        An empty catalog (or `full`) pulls every row. Otherwise one slim
+        pass reads (frontend ID, status, acRate) for every problem and
+        updates only the rows that changed; full rows are then fetched
+        just for the positions of IDs the catalog does not know yet.
+        Both use pages of SYNC_PAGE_SIZE, so a daily refresh is about two
+        requests. Returns {"total", "new", "updated", "requests", "previous"}
+        where "previous" is the last sync's Unix time (None if never).
+        Requests go through `graphql` (default: `client._graphql`).
+        """
+        graphql = graphql or self.client._graphql
+        try:
+            known = self.catalog._frontend_ids()
+            stats = {
+                "total": 0,
+                "new": 0,
+                "updated": 0,
+                "requests": 0,
+                "previous": self.catalog._get_meta("synced_at"),
+            }
+
+            def pull(query, skip, limit):
+                variables = _req_problem_page_variable(skip, limit)
+                response = graphql(query, variables)
+                stats["requests"] += 1
+                return response['data']['problemsetQuestionList']
+
+            def store(questions):
+                new = sum(1 for q in questions if str(q['questionFrontendId']) not in known)
+                stats["new"] += new
+                stats["updated"] += self.catalog._upsert(questions) - new
+
+            if full or not known:
+                skip, total = 0, None
+                while total is None or skip < total:
+                    result = pull(_req_problem_query(), skip, SYNC_PAGE_SIZE)
+                    total = result['total']
+                    if not result['questions']:
+                        break
+                    store(result['questions'])
+                    skip += len(result['questions'])
+            else:
+                missing, rows = [], []
+                skip, total = 0, None
+                while total is None or skip < total:
+                    result = pull(_req_problem_status_query(), skip, SYNC_PAGE_SIZE)
+                    total = result['total']
+                    questions = result['questions']
+                    if not questions:
+                        break
+                    missing.extend(
+                        skip + i for i, q in enumerate(questions)
+                        if str(q['questionFrontendId']) not in known
+                    )
+                    rows.extend(questions)
+                    skip += len(questions)
+                stats["updated"] += self.catalog._update_progress(rows)
+
+                # One request per window of SYNC_PAGE_SIZE positions holding new IDs.
+                while missing:
+                    first = missing[0]
+                    window = [i for i in missing if i < first + SYNC_PAGE_SIZE]
+                    missing = missing[len(window):]
+                    result = pull(_req_problem_query(), first, window[-1] - first + 1)
+                    store(result['questions'])
+
+            stats["total"] = total or 0
+            self.catalog._set_meta(synced_at=time.time(), total=stats["total"])
+            return stats
+
+        except Exception as e:
+            raise e
+
+    def _resolve_problem(
+        self,
+        problem_id
+    ) -> dict:
+        """
+        Look up a frontend ID in the catalog, syncing it once on a miss.
+        """
+        problem = self.catalog._get(problem_id)
+        if problem is None and not self.offline:
+            self._sync_catalog()
+            problem = self.catalog._get(problem_id)
+        if problem is None:
+            raise LookupError(f"Problem {problem_id} does not exist.")
+        return problem
+
+    @_traced("problem.async_catalog")
+    async def _async_catalog(
+        self,
+        full=False
+    ) -> dict:
+        """
+        `_sync_catalog` for coroutines: the sync runs in a worker thread and
+        sends its requests on `aclient`.
+        """
+        return await asyncio.to_thread(self._sync_catalog, full, self._loop_graphql())
+
+    def _loop_graphql(
+        self
+    ):
+        """
+        A blocking `_graphql` for worker threads that sends on `aclient`
+        through the running event loop. Call it from the loop.
+        """
+        loop = asyncio.get_running_loop()
 
+        def graphql(query, variables=None):
+            return asyncio.run_coroutine_threadsafe(self.aclient._graphql(query, variables), loop).result()
+
+        return graphql
+
+    async def _aresolve_problem(
+        self,
+        problem_id
+    ) -> dict:
+        """
+        `_resolve_problem` for coroutines. Concurrent misses share one
+        catalog sync instead of starting one each.
+        """
+        problem = await asyncio.to_thread(self.catalog._get, problem_id)
+        if problem is None and not self.offline:
+            task = getattr(self, "_catalog_task", None)
+            if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                task = self._catalog_task = asyncio.ensure_future(self._async_catalog())
+            await asyncio.shield(task)
+            problem = await asyncio.to_thread(self.catalog._get, problem_id)
+        if problem is None:
+            raise LookupError(f"Problem {problem_id} does not exist.")
+        return problem
+
+    @_traced("problem.list")
     def _get_problemlist(
-        self, 
-        csrftoken, 
-        session, 
+        self,
         mode,
         difficulty,
-        start
+        start,
+        fmt="table",
+        limit=10
     ):
         try:
-            table_data = []
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                session, 
-                csrftoken,
-            )
             query = _req_problem_query()
             variables = _req_problem_variable(
                 mode,
                 difficulty,
-                start
-            )
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query, "variables": variables})
+                start,
+                limit
             )
-            
-            response = response.json()
+            response = self.client._graphql(query, variables)
             questions = response['data']['problemsetQuestionList']['questions']
+            self.catalog._upsert(questions)
+
+            return "\n".join(_render(
+                map(self._problem_record, questions),
+                PROBLEM_COLUMNS,
+                fmt,
+                self._problem_display
+            ))
 
-            for question in questions:
-                ac_rate = float(question['acRate'])
-                ac_rate_str = f"{ac_rate:.2f}%"
-                status_map = {"ac": "✅", "notac": "⚠️", None: "❌"}
-                table_data.append([
-                    question['questionFrontendId'],
-                    question['title'],
-                    question['difficulty'],
-                    ac_rate_str,
-                    question['isPaidOnly'],
-                    status_map[question['status']]
-                ])
-            return tabulate(
-                table_data,
-                headers=["ID", "Title", "Difficulty", "Acceptance", "isPaidOnly", "Status"],
-                tablefmt="fancy_grid"
-            )
-        
         except Exception as e:
             raise e
 
-    def _get_daily_problem(
+    @_traced("problem.async_list")
+    async def _afetch_problemlist(
+        self,
+        mode,
+        difficulty,
+        start,
+        limit=10
+    ) -> list:
+        """
+        One page of `questionList` as problem records (see `_problem_record`).
+        """
+        variables = _req_problem_variable(
+            mode,
+            difficulty,
+            start,
+            limit
+        )
+        response = await self.aclient._graphql(_req_problem_query(), variables)
+        questions = response['data']['problemsetQuestionList']['questions']
+        await asyncio.to_thread(self.catalog._upsert, questions)
+        return [self._problem_record(question) for question in questions]
+
+    def _iter_problemlist(
         self,
-        csrftoken, 
-        session,
+        mode,
+        difficulty,
+        start,
+        limit=None,
+        page_size=LIST_PAGE_SIZE
     ):
-        try:
-            table_data = []
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
-            )
-            query = _req_problem_daily_query()
+        """
+        Yield problem records page by page, up to `limit` rows (None = every page).
 
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query})
+        The next page is requested in the background while the caller
+        renders the current one, and only those two pages are held in memory.
+        """
+        query = _req_problem_query()
+        end = None if limit is None else start + limit
+
+        def fetch(skip):
+            size = page_size if end is None else min(page_size, end - skip)
+            variables = _req_problem_variable(
+                mode,
+                difficulty,
+                skip,
+                size
             )
-            response = response.json()
-            question = response['data']['activeDailyCodingChallengeQuestion']['question']
-            
+            response = self.client._graphql(query, variables)
+            return response['data']['problemsetQuestionList']
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            skip = start
+            future = executor.submit(fetch, skip) if end is None or skip < end else None
+            while future is not None:
+                page = future.result()
+                questions = page['questions']
+                skip += len(questions)
+                last = min(page['total'], end) if end is not None else page['total']
+                future = executor.submit(fetch, skip) if questions and skip < last else None
+
+                self.catalog._upsert(questions)
+                for question in questions:
+                    yield self._problem_record(question)
+
+    def _stream_problemlist(
+        self,
+        mode,
+        difficulty,
+        start,
+        limit=None,
+        fmt="plain"
+    ):
+        """
+        Yield the listing in `fmt` as pages arrive; every format but
+        table and json emits one line per problem without buffering.
+        """
+        return _render(
+            self._iter_problemlist(mode, difficulty, start, limit),
+            PROBLEM_COLUMNS,
+            fmt,
+            self._problem_display
+        )
+
+    @_traced("problem.search")
+    def _search_problems(
+        self,
+        query,
+        difficulty,
+        limit
+    ):
+        """
+        Search downloaded problems offline; returns (table, hits, seconds).
+        """
+        started = time.perf_counter()
+        hits = self.search_index._search(query, difficulty, limit)
+        elapsed = time.perf_counter() - started
+        table = "\n".join(_render(
+            [
+                {"id": frontend_id, "title": title, "difficulty": diff, "score": f"{score:.2f}"}
+                for score, frontend_id, title, diff in hits
+            ],
+            SEARCH_COLUMNS
+        ))
+        return table, len(hits), elapsed
+
+    @_traced("problem.list_tagged")
+    def _get_tagged_problems(
+        self,
+        tags,
+        match_all,
+        mode,
+        difficulty,
+        start,
+        limit,
+        fmt="table"
+    ):
+        """
+        List problems by topic tag from the local catalog's tag index.
+
+        Only an empty catalog goes online (one sync); otherwise no request
+        is made, so status and acceptance are as of the last sync.
+        Returns (output, shown, total).
+        """
+        if self.catalog._count() == 0 and not self.offline:
+            self._sync_catalog()
+        problems, total = self.catalog._filter_tags(tags, match_all, difficulty, mode, start, limit)
+        if total == 0:
+            known = self.catalog._tags()
+            unknown = [tag for tag in tags if tag.strip().lower().replace(" ", "-") not in known]
+            if unknown:
+                raise LookupError(
+                    f"Unknown tag: {', '.join(unknown)}. Tags look like: "
+                    f"{', '.join(sorted(known, key=known.get, reverse=True)[:8])}"
+                )
+        output = "\n".join(_render(
+            map(self._catalog_record, problems),
+            PROBLEM_COLUMNS,
+            fmt,
+            self._problem_display
+        ))
+        return output, len(problems), total
+
+    def _catalog_record(
+        self,
+        problem
+    ) -> dict:
+        """`_problem_record` for a catalog row."""
+        return {
+            "id": int(problem['frontend_id']),
+            "title": problem['title'],
+            "slug": problem['title_slug'],
+            "difficulty": problem['difficulty'],
+            "ac_rate": round(problem['ac_rate'] or 0.0, 2),
+            "paid_only": problem['is_paid_only'],
+            "status": problem['status'],
+            "tags": problem['topic_tags'],
+        }
+
+    def _problem_record(
+        self,
+        question
+    ) -> dict:
+        """Machine-readable form of a question list row (or daily question)."""
+        ac_rate = question.get('acRate')
+        if ac_rate is None:
             ac_rate = json.loads(question["stats"])["acRate"]
-            status_map = {"ac": "✅", "notac": "⚠️", None: "❌"}
-            table_data.append([
-                question['questionFrontendId'],
-                question['title'],
-                question['difficulty'],
-                ac_rate,
-                question['isPaidOnly'],
-                status_map[question['status']]
-            ])
-            return tabulate(
-                table_data,
-                headers=["ID", "Title", "Difficulty", "Acceptance", "isPaidOnly", "Status"],
-                tablefmt="fancy_grid"
-            )
+        return {
+            "id": int(question['questionFrontendId']),
+            "title": question['title'],
+            "slug": question['titleSlug'],
+            "difficulty": question['difficulty'],
+            "ac_rate": round(float(str(ac_rate).rstrip("%")), 2),
+            "paid_only": question['isPaidOnly'],
+            "status": question['status'],
+        }
+
+    def _problem_display(
+        self,
+        record
+    ) -> list:
+        return [
+            record['id'],
+            record['title'],
+            record['difficulty'],
+            f"{record['ac_rate']:.2f}%",
+            record['paid_only'],
+            STATUS_ICONS.get(record['status'], record['status'])
+        ]
+
+    @_traced("problem.daily")
+    def _get_daily_problem(
+        self,
+        fmt="table"
+    ):
+        try:
+            if self.offline:
+                raise LookupError("The daily problem cannot be resolved offline.")
+            response = self.client._graphql(_req_problem_daily_row_query())
+            question = response['data']['activeDailyCodingChallengeQuestion']['question']
+            return "\n".join(_render(
+                [self._problem_record(question)],
+                PROBLEM_COLUMNS,
+                fmt,
+                self._problem_display
+            ))
         except Exception as e:
             raise e
 
+    @_traced("problem.download")
     def _download_problem(
-        self, 
-        csrftoken, 
-        session,
+        self,
         problem_id,
         language
     ):
         try:
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
+            problem = self._resolve_problem(problem_id)
+            return self._download_slug(problem['title_slug'], language)
+
+        except Exception as e:
+            raise e
+
+    def _download_slug(
+        self,
+        titleSlug,
+        language
+    ):
+        try:
+            data = self._fetch_detail(titleSlug)
+            return self._write_problem(data, language)
+
+        except Exception as e:
+            raise e
+
+    def _fetch_detail(
+        self,
+        titleSlug
+    ):
+        """
+        Return `question` details for one problem (see `_fetch_details`).
+        """
+        data = self._fetch_details([titleSlug])[titleSlug]
+        if isinstance(data, Exception):
+            raise data
+        return data
+
+    @_traced("problem.fetch_details")
+    def _fetch_details(
+        self,
+        titleSlugs
+    ):
+        """
+        Return {titleSlug: details} for many problems.
+
+        Cached entries are used as-is; the rest are fetched in aliased
+        batches of `self.batch_size` and cached. A value is an exception
+        when that problem alone failed.
+        `self.refresh` skips the cache lookup; `self.offline` never goes online.
+        """
+        details, pending = self._cached_details(titleSlugs)
+        if pending:
+            fetched = _run_batch(
+                self.client,
+                pending,
+                _req_problem_detail_batch_query,
+                _req_problem_detail_batch_variable,
+                self.batch_size
             )
-            query = _req_problem_query()
-            variables = _req_one_problem_variable(problem_id)
+            self._store_details(fetched, details)
+        return {titleSlug: details[titleSlug] for titleSlug in titleSlugs}
 
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query, "variables": variables})
+    @_traced("problem.async_fetch_details")
+    async def _afetch_details(
+        self,
+        titleSlugs
+    ):
+        """
+        `_fetch_details` for coroutines; all batches are requested at once.
+        """
+        details, pending = await asyncio.to_thread(self._cached_details, titleSlugs)
+        if pending:
+            fetched = await _arun_batch(
+                self.aclient,
+                pending,
+                _req_problem_detail_batch_query,
+                _req_problem_detail_batch_variable,
+                self.batch_size
             )
-            response = response.json()
-            questions = response['data']['problemsetQuestionList']['questions']
-            
-            titleSlug = questions[0]['titleSlug']
+            await asyncio.to_thread(self._store_details, fetched, details)
+        return {titleSlug: details[titleSlug] for titleSlug in titleSlugs}
+
+    def _cached_details(
+        self,
+        titleSlugs
+    ):
+        """
+        Split `titleSlugs` into ({titleSlug: cached details}, [to fetch]).
+        Offline, the ones to fetch get a LookupError instead.
+        """
+        details = {}
+        pending = []
+        for titleSlug in titleSlugs:
+            data = None if self.refresh else self.cache._get(titleSlug)
+            if data is not None:
+                details[titleSlug] = data
+            else:
+                pending.append(titleSlug)
 
-            detail_query = _req_problem_detail_query()
-            variables = _req_problem_detail_variable(titleSlug)
+        if pending and self.offline:
+            for titleSlug in pending:
+                details[titleSlug] = LookupError(
+                    f"{titleSlug} is not cached; run without --offline to download it."
+                )
+            pending = []
+        return details, pending
 
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": detail_query, "variables": variables})
-            )
-            data = response.json()['data']['question']
+    def _store_details(
+        self,
+        fetched,
+        details
+    ):
+        self.cache._put_many({
+            titleSlug: data for titleSlug, data in fetched.items()
+            if data is not None and not isinstance(data, Exception)
+        })
+        details.update(fetched)
+
+    @_traced("problem.write")
+    def _write_problem(
+        self,
+        data,
+        language
+    ):
+        """
+        Write the statement and code template(s) of one problem.
+
+        `language` is one language, a list of them or ALL_LANGUAGES; every
+        template comes from the same detail payload. With `problem_dirs`
+        the files go into a directory named like them ("1_Two_Sum/").
+        Returns the requested languages the problem has no template for.
+        """
+        try:
             ac_rate = json.loads(data["stats"])["acRate"]
-            soup = BeautifulSoup(data['content'], 'html.parser')
-            content_text = soup.get_text()
-            
+            with _span("markdown", bytes=len(data['content'] or "")):
+                content_text = _html_to_markdown(data['content'])
+            with _span("search.index", bytes=len(content_text)):
+                self.search_index._add(
+                    data['questionFrontendId'],
+                    data['title'],
+                    data['difficulty'],
+                    content_text
+                )
+
+            directory = None
+            if self.problem_dirs:
+                directory = _problem_basename(data)
+                os.makedirs(directory, exist_ok=True)
+
             _create_markdown_file(
-                data, 
-                content_text, 
-                ac_rate
+                data,
+                content_text,
+                ac_rate,
+                directory
             )
+            if language == ALL_LANGUAGES or isinstance(language, (list, tuple)):
+                return _create_code_files(
+                    data,
+                    language,
+                    directory
+                )
             _create_code_file(
-                data, 
-                language
+                data,
+                language,
+                directory
             )
+            return []
 
         except TypeError as e:
             raise TypeError(
@@ -190,136 +691,474 @@ class ProblemManager():
         except Exception as e:
             raise e
 
+    def _select_problems(
+        self,
+        items,
+        daily=None,
+        graphql=None
+    ):
+        """
+        Resolve a selection for `_download_problems`.
 
-    def _download_problem_daily(
+        Returns (ids, slug_ids, ready): the frontend IDs in order with
+        "daily" replaced by `daily`'s, {titleSlug: ID} for the problems
+        whose details must be fetched, and {ID: daily question or
+        LookupError} for the ones already settled. The catalog is synced
+        once (through `graphql`) if any ID is missing from it.
+        """
+        daily_id = int(daily['questionFrontendId']) if daily is not None else None
+        ids = list(dict.fromkeys(daily_id if item == "daily" else item for item in items))
+        known = {problem_id: self.catalog._get(problem_id) for problem_id in ids if problem_id != daily_id}
+        if any(problem is None for problem in known.values()) and not self.offline:
+            self._sync_catalog(graphql=graphql)
+            known = {
+                problem_id: problem or self.catalog._get(problem_id)
+                for problem_id, problem in known.items()
+            }
+
+        slug_ids = {}
+        ready = {} if daily is None else {daily_id: daily}
+        for problem_id, problem in known.items():
+            if problem is None:
+                ready[problem_id] = LookupError(f"Problem {problem_id} does not exist.")
+            else:
+                slug_ids[problem['title_slug']] = problem_id
+        return ids, slug_ids, ready
+
+    def _write_results(
         self,
-        csrftoken,
-        session,
-        language
+        problems,
+        language,
+        results,
+        on_result=None
+    ) -> None:
+        """
+        Write {ID: details or exception} for a selection, recording each
+        ID's error (None on success) in `results` and passing it to
+        `on_result(item, error)`.
+        """
+        for problem_id, data in problems.items():
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                self._write_problem(data, language)
+                error = None
+            except Exception as e:
+                error = e
+            results[problem_id] = error
+            if on_result is not None:
+                on_result(problem_id, error)
+
+    @_traced("problem.download_many")
+    def _download_problems(
+        self,
+        items,
+        language,
+        workers,
+        on_result=None
     ):
-        try:
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
+        """
+        Download many problems concurrently.
+
+        `items` holds frontend IDs and/or "daily". IDs are resolved from the
+        catalog up front, then details are fetched in aliased batches of
+        `self.batch_size` on a bounded thread pool over `client`.
+        `on_result(item, error)` is called as each item finishes.
+        Returns (results, elapsed) where results is a list of (item, error).
+        """
+        started = time.monotonic()
+        daily = self._fetch_daily() if "daily" in items else None
+        ids, slug_ids, ready = self._select_problems(items, daily)
+        results = {}
+        self._write_results(ready, language, results, on_result)
+
+        def download(titleSlugs):
+            details = self._fetch_details(titleSlugs)
+            self._write_results(
+                {slug_ids[titleSlug]: data for titleSlug, data in details.items()},
+                language,
+                results,
+                on_result
             )
-            query = _req_problem_daily_query()
 
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query})
+        if workers > self.client.pool_size:
+            self.client._set_pool_size(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(download, _chunks(list(slug_ids), self.batch_size)))
+        return [(problem_id, results.get(problem_id)) for problem_id in ids], time.monotonic() - started
+
+    async def _adownload_problems(
+        self,
+        items,
+        language,
+        workers,
+        on_result=None
+    ):
+        """
+        `_download_problems` for coroutines: up to `workers` batches in
+        flight at once on `aclient`. Files, the search index and the
+        catalog are written in worker threads, off the event loop.
+        """
+        started = time.monotonic()
+        daily = await self._afetch_daily() if "daily" in items else None
+        ids, slug_ids, ready = await asyncio.to_thread(self._select_problems, items, daily, self._loop_graphql())
+        results = {}
+        await asyncio.to_thread(self._write_results, ready, language, results, on_result)
+
+        if workers > self.aclient.pool_size:
+            self.aclient._set_pool_size(workers)
+        slots = asyncio.Semaphore(workers)
+
+        async def download(titleSlugs):
+            async with slots:
+                details = await self._afetch_details(titleSlugs)
+            await asyncio.to_thread(
+                self._write_results,
+                {slug_ids[titleSlug]: data for titleSlug, data in details.items()},
+                language,
+                results,
+                on_result
             )
-            response = response.json()
-            response = response
-            question = response['data']['activeDailyCodingChallengeQuestion']['question']
-            problem_id = int(question['questionFrontendId'])
 
-            self._download_problem(
-                csrftoken, 
-                session, 
-                problem_id, 
+        await asyncio.gather(*map(download, _chunks(list(slug_ids), self.batch_size)))
+        return [(problem_id, results.get(problem_id)) for problem_id in ids], time.monotonic() - started
+
+    @_traced("problem.fetch_daily")
+    def _fetch_daily(
+        self
+    ):
+        """
+        Fetch today's question with everything needed to write its files.
+        """
+        if self.offline:
+            raise LookupError("The daily problem cannot be resolved offline.")
+        query = _req_problem_daily_slim_query()
+
+        response = self.client._graphql(query)
+        return self._daily_question(response)
+
+    @_traced("problem.async_fetch_daily")
+    async def _afetch_daily(
+        self
+    ):
+        if self.offline:
+            raise LookupError("The daily problem cannot be resolved offline.")
+        response = await self.aclient._graphql(_req_problem_daily_slim_query())
+        return await asyncio.to_thread(self._daily_question, response)
+
+    def _daily_question(
+        self,
+        response
+    ):
+        question = response['data']['activeDailyCodingChallengeQuestion']['question']
+        if question.get('content') is not None:
+            self.cache._put(question['titleSlug'], question)
+        return question
+
+    @_traced("problem.download_daily")
+    def _download_problem_daily(
+        self,
+        language
+    ):
+        try:
+            return self._write_problem(
+                self._fetch_daily(),
                 language
             )
 
         except Exception as e:
             raise e
 
+    @_traced("problem.submit")
     def _submit_problem(
         self,
-        csrftoken,
-        session,
         problem_id,
         filename,
     ):
         try:
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
-            )
+            problem = self._resolve_problem(problem_id)
+            titleSlug, data = self._submit_payload(problem, filename)
+            response = self.client._submit(titleSlug, data)
+            submission_id = response['submission_id']
+            return int(submission_id)
 
-            basename = os.path.basename(filename)
-            _, ext = os.path.splitext(basename)
-            language = _detect_language(ext)
-        
-            query = _req_problem_query()
-            variables = _req_one_problem_variable(problem_id)
+        except Exception as e:
+            raise e
+
+    @_traced("problem.async_submit")
+    async def _asubmit_problem(
+        self,
+        problem_id,
+        filename,
+    ):
+        problem = await self._aresolve_problem(problem_id)
+        titleSlug, data = await asyncio.to_thread(self._submit_payload, problem, filename)
+        response = await self.aclient._submit(titleSlug, data)
+        return int(response['submission_id'])
+
+    def _submit_payload(
+        self,
+        problem,
+        filename
+    ):
+        """(titleSlug, submit body) for a catalog row and a solution file."""
+        basename = os.path.basename(filename)
+        _, ext = os.path.splitext(basename)
+        language = _detect_language(ext)
+
+        code = _get_code_str(filename)
+        data = _req_problem_submit_variable(
+            language,
+            code,
+            problem['question_id']
+        )
+        return problem['title_slug'], data
+
+    @_traced("problem.check_submission")
+    def _get_submission_details(
+        self,
+        submission_id
+    ):
+        """
+        Fetch `submissionDetails`, or None while the judge has no result yet.
+        """
+        query = _req_problem_solution_detail_query()
+        variables = _req_problem_solution_detail_variable(submission_id)
+
+        result = self.client._graphql(query, variables)
+        return (result.get("data") or {}).get("submissionDetails")
 
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query, "variables": variables})
+    @_traced("problem.async_check_submission")
+    async def _aget_submission_details(
+        self,
+        submission_id
+    ):
+        query = _req_problem_solution_detail_query()
+        variables = _req_problem_solution_detail_variable(submission_id)
+
+        result = await self.aclient._graphql(query, variables)
+        return (result.get("data") or {}).get("submissionDetails")
+
+    @_traced("problem.wait_submission")
+    def _wait_submit_problem(
+        self,
+        submission_id,
+        deadline,
+        on_wait=None,
+        fmt="table"
+    ):
+        """
+        Poll the judge until the verdict is final and return the result table.
+        """
+        try:
+            data = _poll(
+                lambda: self._get_submission_details(submission_id),
+                lambda d: d is not None and d["statusCode"] != STATUS_PENDING,
+                deadline=deadline,
+                on_wait=on_wait
             )
-            
-            response = response.json()
-            question = response['data']['problemsetQuestionList']['questions']
-            
-            titleSlug = question[0]['titleSlug']
-            problem_id_internal = question[0]['questionId']
-
-            code = _get_code_str(filename)
-            solution_headers = _req_solution_header(
-                csrftoken,
-                titleSlug
+        except TimeoutError:
+            raise TimeoutError(
+                f"Judge did not finish within {deadline:g}s. Submission ID: {submission_id}"
             )
+        return self._format_submission(data, submission_id, fmt)
 
-            data = _req_problem_submit_variable(
-                language,
-                code,
-                problem_id_internal
+    @_traced("problem.async_wait_submission")
+    async def _apoll_submission(
+        self,
+        submission_id,
+        deadline,
+        on_wait=None
+    ) -> dict:
+        """
+        Poll the judge without blocking the loop; returns the submission record.
+        """
+        try:
+            data = await _apoll(
+                lambda: self._aget_submission_details(submission_id),
+                lambda d: d is not None and d["statusCode"] != STATUS_PENDING,
+                deadline=deadline,
+                on_wait=on_wait
             )
-            url = f"https://leetcode.com/problems/{titleSlug}/submit/"
-            response = requests.post(
-                url, 
-                headers=solution_headers, 
-                cookies=cookies, 
-                json=data
+        except TimeoutError:
+            raise TimeoutError(
+                f"Judge did not finish within {deadline:g}s. Submission ID: {submission_id}"
             )
-            submission_id = json.loads(response.content)['submission_id']
-            return int(submission_id)
+        return self._submission_record(data, submission_id)
 
-        except Exception as e:
-            raise e
-        
-    def _check_submit_problem(
+    def _format_submission(
         self,
-        csrftoken,
-        session,
-        submission_id
+        data,
+        submission_id=None,
+        fmt="table"
     ):
         try:
-            result_table = []
-            headers = _req_header(csrftoken)
-            cookies = _req_cookies(
-                    session, 
-                    csrftoken,
-            )
-            query = _req_problem_solution_detail_query()
-            variables = _req_problem_solution_detail_variable(submission_id)
-
-            response = requests.post(
-                LEETCODE_URL,
-                headers=headers,
-                cookies=cookies,
-                data=json.dumps({"query": query, "variables": variables})
-            )
-            
-            result = json.loads(response.content)
-            data = result["data"]["submissionDetails"]
-            status = STATUS_CODE_MAP.get(data["statusCode"], f"Unknown ({data['statusCode']})")
-            result_table.append([
-                data["statusCode"],
-                status,
-                data["runtime"],
-                data["memory"],
-                f"{data['totalCorrect']}/{data['totalTestcases']}",
-                data["runtimeError"][:60] + "..." if data["runtimeError"] else ""
-            ])
-            table_headers = ["Status Code", "Result", "Runtime (ms)", "Memory (KB)", "Passed", "Runtime Error"]
-            return tabulate(result_table, headers=table_headers, tablefmt="fancy_grid")
+            record = self._submission_record(data, submission_id)
+            return "\n".join(_render([record], SUBMISSION_COLUMNS, fmt, self._submission_display))
 
         except Exception as e:
             raise e
+
+    def _submission_record(
+        self,
+        data,
+        submission_id=None
+    ) -> dict:
+        return {
+            "submission_id": submission_id,
+            "status_code": data["statusCode"],
+            "result": STATUS_CODE_MAP.get(data["statusCode"], f"Unknown ({data['statusCode']})"),
+            "runtime": data["runtime"],
+            "memory": data["memory"],
+            "total_correct": data["totalCorrect"],
+            "total_testcases": data["totalTestcases"],
+            "runtime_error": data["runtimeError"],
+        }
+
+    def _submission_display(
+        self,
+        record
+    ) -> list:
+        return [
+            record["status_code"],
+            record["result"],
+            record["runtime"],
+            record["memory"],
+            f"{record['total_correct']}/{record['total_testcases']}" if record["total_testcases"] is not None else "",
+            record["runtime_error"][:60] + "..." if record["runtime_error"] else ""
+        ]
+
+    def _batch_submission_display(
+        self,
+        record
+    ) -> list:
+        return [record["problem_id"], os.path.basename(record["file"])] + self._submission_display(record)
+
+    @_traced("problem.test")
+    def _test_problem(
+        self,
+        problem_id,
+        filename,
+        timeout=DEFAULT_TEST_TIMEOUT,
+        fmt="table"
+    ):
+        """
+        Run a problem's example testcases against a local Python3 solution.
+
+        `exampleTestcases` and `metaData` come with the cached problem
+        details, so repeated runs stay offline. Returns (table, records).
+        """
+        if _detect_language(filename) != "python3":
+            raise ValueError("Only Python3 solutions can be tested locally.")
+        problem = self._resolve_problem(problem_id)
+        data = self._fetch_detail(problem['title_slug'])
+        if "metaData" not in data and not self.offline:
+            # Cached before the detail query asked for example testcases.
+            refresh, self.refresh = self.refresh, True
+            try:
+                data = self._fetch_detail(problem['title_slug'])
+            finally:
+                self.refresh = refresh
+
+        records = _run_examples(filename, data, timeout)
+        table = "\n".join(_render(records, TEST_COLUMNS, fmt, self._test_display))
+        return table, records
+
+    def _test_display(
+        self,
+        record
+    ) -> list:
+        return [
+            record["case"],
+            record["input"],
+            record["expected"] if record["expected"] is not None else "-",
+            json.dumps(record["output"], separators=(",", ":")) if record["output"] is not None else "-",
+            record["result"],
+            f"{record['elapsed_ms']:.2f}" if record["elapsed_ms"] is not None else "-"
+        ]
+
+    @_traced("problem.submit_many")
+    def _submit_problems(
+        self,
+        pairs,
+        workers,
+        deadline,
+        on_progress=None,
+        fmt="table"
+    ):
+        """
+        Submit many (problem_id, filename) pairs and wait for every verdict.
+
+        Up to `workers` submissions are in flight at once. While they are
+        being sent, the verdicts of all submitted-but-unjudged solutions are
+        polled together, one aliased `submissionDetails` document per round.
+        `on_progress(finished, total, elapsed)` is called before each wait.
+        Returns (table, failures, elapsed).
+        """
+        started = time.monotonic()
+        records = [
+            {"problem_id": problem_id, "file": filename, **dict.fromkeys(SUBMISSION_FIELDS), "result": "Submitting"}
+            for problem_id, filename in pairs
+        ]
+        pending = {}
+        finished = set()
+
+        missing = any(self.catalog._get(problem_id) is None for problem_id, _ in pairs)
+        if missing and not self.offline:
+            self._sync_catalog()
+
+        if workers + 1 > self.client.pool_size:
+            self.client._set_pool_size(workers + 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sending = {
+                executor.submit(self._submit_problem, problem_id, filename): i
+                for i, (problem_id, filename) in enumerate(pairs)
+            }
+
+            def poll():
+                for future in [f for f in sending if f.done()]:
+                    i = sending.pop(future)
+                    try:
+                        submission_id = future.result()
+                        records[i].update(submission_id=submission_id, result="Judging")
+                        pending[submission_id] = i
+                    except Exception as e:
+                        records[i]["result"] = f"Error: {e}"
+                        finished.add(i)
+
+                if pending:
+                    details = _run_batch(
+                        self.client,
+                        list(pending),
+                        _req_problem_solution_detail_batch_query,
+                        _req_problem_solution_detail_batch_variable,
+                        self.batch_size
+                    )
+                    for submission_id, data in details.items():
+                        if isinstance(data, Exception):
+                            i = pending.pop(submission_id)
+                            records[i]["result"] = f"Error: {data}"
+                            finished.add(i)
+                            continue
+                        if data is None or data["statusCode"] == STATUS_PENDING:
+                            continue
+                        i = pending.pop(submission_id)
+                        records[i].update(self._submission_record(data, submission_id))
+                        finished.add(i)
+                return not sending and not pending
+
+            def on_wait(attempt, elapsed):
+                if on_progress is not None:
+                    on_progress(len(finished), len(records), elapsed)
+
+            try:
+                _poll(poll, bool, deadline=deadline, on_wait=on_wait)
+            except TimeoutError:
+                for future in sending:
+                    future.cancel()
+                for i in list(sending.values()) + list(pending.values()):
+                    records[i]["result"] = f"Timed out after {deadline:g}s"
+
+        failures = sum(1 for record in records if record["status_code"] != STATUS_ACCEPTED)
+        table = "\n".join(_render(records, BATCH_SUBMISSION_COLUMNS, fmt, self._batch_submission_display))
+        return table, failures, time.monotonic() - started
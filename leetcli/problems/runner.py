@@ -0,0 +1,267 @@
+import os
+import re
+import sys
+import html
+import json
+import math
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+DEFAULT_TEST_TIMEOUT = 5.0
+OUTPUT_RE = re.compile(r"Output\s*:\s*(.+?)\s*(?=\n|$|(?:Explanation|Example|Input|Output|Constraints)\b)")
+TAG_RE = re.compile(r"<[^>]+>")
+FLOAT_TOLERANCE = 1e-5
+
+# Runs inside a fresh `python -I` per example. Reads {"file", "meta",
+# "inputs"} from stdin and prints one JSON line: {"output", "stdout",
+# "elapsed"} or {"error"}.
+HARNESS = r'''
+import io, sys, json, time, traceback, contextlib
+from typing import *
+from collections import *
+from functools import *
+from itertools import *
+from heapq import *
+from bisect import *
+from math import *
+import collections, functools, itertools, heapq, bisect, math, string, re, operator, random
+
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def to_list_node(values):
+    head = tail = ListNode()
+    for value in values:
+        tail.next = ListNode(value)
+        tail = tail.next
+    return head.next
+
+
+def to_tree(values):
+    if not values or values[0] is None:
+        return None
+    root = TreeNode(values[0])
+    queue = deque([root])
+    i = 1
+    while queue and i < len(values):
+        node = queue.popleft()
+        for side in ("left", "right"):
+            if i < len(values) and values[i] is not None:
+                child = TreeNode(values[i])
+                setattr(node, side, child)
+                queue.append(child)
+            i += 1
+    return root
+
+
+def build(value, kind):
+    kind = kind.strip()
+    if kind == "ListNode":
+        return to_list_node(value)
+    if kind == "TreeNode":
+        return to_tree(value)
+    inner = None
+    if kind.endswith("[]"):
+        inner = kind[:-2]
+    elif kind.startswith("list<") and kind.endswith(">"):
+        inner = kind[5:-1]
+    if inner is not None and value is not None:
+        return [build(item, inner) for item in value]
+    return value
+
+
+def plain(value):
+    if isinstance(value, ListNode):
+        out = []
+        while value is not None and len(out) < 100000:
+            out.append(value.val)
+            value = value.next
+        return out
+    if isinstance(value, TreeNode):
+        out, queue = [], deque([value])
+        while queue:
+            node = queue.popleft()
+            out.append(None if node is None else node.val)
+            if node is not None:
+                queue.extend((node.left, node.right))
+        while out and out[-1] is None:
+            out.pop()
+        return out
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+request = json.loads(sys.stdin.read())
+meta = request["meta"]
+stdout = io.StringIO()
+try:
+    namespace = dict(globals())
+    with open(request["file"], "r", encoding="utf-8") as f:
+        exec(compile(f.read(), request["file"], "exec"), namespace)
+    params = meta.get("params", [])
+    args = [build(value, param["type"]) for value, param in zip(request["inputs"], params)]
+    method = getattr(namespace["Solution"](), meta["name"])
+    with contextlib.redirect_stdout(stdout):
+        started = time.perf_counter()
+        result = method(*args)
+        elapsed = time.perf_counter() - started
+    returns = meta.get("return", {}).get("type")
+    if returns == "void":
+        result = args[meta.get("output", {}).get("paramindex", 0)]
+    output = plain(result)
+    if output is None and returns in ("ListNode", "TreeNode"):
+        output = []
+    print(json.dumps({"output": output, "stdout": stdout.getvalue(), "elapsed": elapsed}))
+except BaseException:
+    print(json.dumps({"error": traceback.format_exc(limit=-3), "stdout": stdout.getvalue()}))
+'''
+
+
+def _parse_meta(
+    data: dict
+) -> dict:
+    meta = data.get("metaData")
+    if not meta:
+        raise LookupError("This problem has no metaData to build test calls from.")
+    meta = json.loads(meta) if isinstance(meta, str) else meta
+    if "classname" in meta or "name" not in meta:
+        raise ValueError("Design problems (class with several methods) cannot be run locally.")
+    return meta
+
+
+def _expected_outputs(
+    content: Optional[str]
+) -> List[str]:
+    """Pull the "Output:" value of every example out of the statement HTML."""
+    if not content:
+        return []
+    text = html.unescape(TAG_RE.sub("", content))
+    return [match.strip() for match in OUTPUT_RE.findall(text)]
+
+
+def _parse_examples(
+    data: dict
+) -> List[Tuple[list, Optional[str]]]:
+    """
+    Split `exampleTestcases` into one argument list per example and pair
+    each with its expected output from the statement: [(inputs, expected)].
+    """
+    meta = _parse_meta(data)
+    count = len(meta.get("params", []))
+    lines = [line for line in (data.get("exampleTestcases") or "").splitlines() if line.strip()]
+    if not count or not lines:
+        raise LookupError("This problem has no example testcases.")
+    expected = _expected_outputs(data.get("content"))
+    examples = []
+    for i in range(0, len(lines) - count + 1, count):
+        inputs = [json.loads(line) for line in lines[i:i + count]]
+        index = i // count
+        examples.append((inputs, expected[index] if index < len(expected) else None))
+    return examples
+
+
+def _same(
+    actual,
+    expected
+) -> bool:
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        return actual == expected
+    if isinstance(actual, (int, float)) and isinstance(expected, (int, float)):
+        return math.isclose(actual, expected, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)
+    if isinstance(actual, list) and isinstance(expected, list):
+        return len(actual) == len(expected) and all(_same(a, e) for a, e in zip(actual, expected))
+    return actual == expected
+
+
+def _judge(
+    output,
+    expected: Optional[str]
+) -> str:
+    if expected is None:
+        return "No expected output"
+    try:
+        expected_value = json.loads(expected)
+    except ValueError:
+        return "Passed" if json.dumps(output) == expected or str(output) == expected else "Wrong Answer"
+    return "Passed" if _same(output, expected_value) else "Wrong Answer"
+
+
+def _run_example(
+    filename: str,
+    meta: dict,
+    inputs: list,
+    timeout: float
+) -> dict:
+    """Run one example in its own interpreter; never raises for solution errors."""
+    request = json.dumps({"file": os.path.abspath(filename), "meta": meta, "inputs": inputs})
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-I", "-c", HARNESS],
+            input=request,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {"result": "Time Limit Exceeded", "output": None, "elapsed": timeout, "error": None, "stdout": ""}
+
+    lines = proc.stdout.strip().splitlines()
+    try:
+        reply = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        return {"result": "Runtime Error", "output": None, "elapsed": None, "error": proc.stderr.strip()[-2000:], "stdout": proc.stdout}
+    if "error" in reply:
+        return {"result": "Runtime Error", "output": None, "elapsed": None, "error": reply["error"], "stdout": reply.get("stdout", "")}
+    return {"result": None, "output": reply["output"], "elapsed": reply["elapsed"], "error": None, "stdout": reply.get("stdout", "")}
+
+
+def _run_examples(
+    filename: str,
+    data: dict,
+    timeout: float = DEFAULT_TEST_TIMEOUT,
+    workers: Optional[int] = None
+) -> List[dict]:
+    """
+    Run every example of a problem against a Python3 solution file, each
+    in a separate interpreter killed after `timeout` seconds, in parallel.
+    Returns one record per example.
+    """
+    meta = _parse_meta(data)
+    examples = _parse_examples(data)
+    workers = workers or min(len(examples), os.cpu_count() or 1)
+
+    def run(case):
+        index, (inputs, expected) = case
+        outcome = _run_example(filename, meta, inputs, timeout)
+        return {
+            "case": index + 1,
+            "input": ", ".join(
+                f"{param['name']} = {json.dumps(value, separators=(',', ':'))}" for param, value in zip(meta["params"], inputs)
+            ),
+            "expected": expected,
+            "output": outcome["output"],
+            "result": outcome["result"] or _judge(outcome["output"], expected),
+            "elapsed_ms": None if outcome["elapsed"] is None else round(outcome["elapsed"] * 1000, 3),
+            "stdout": outcome["stdout"],
+            "error": outcome["error"],
+        }
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        return list(executor.map(run, enumerate(examples)))
@@ -0,0 +1,165 @@
+import os
+import re
+import math
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+SEARCH_DIR = Path(os.path.expanduser("~/.leetcode-cli"))
+SEARCH_FILE = SEARCH_DIR / "search.db"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SEARCH_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS docs (
+        frontend_id  TEXT PRIMARY KEY,
+        title        TEXT NOT NULL,
+        difficulty   TEXT,
+        length       INTEGER NOT NULL,
+        tokens       TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS postings (
+        term         TEXT NOT NULL,
+        frontend_id  TEXT NOT NULL,
+        tf           INTEGER NOT NULL,
+        PRIMARY KEY (term, frontend_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (frontend_id);
+"""
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+PHRASE_RE = re.compile(r'"([^"]+)"')
+
+
+def _tokenize(
+    text: str
+) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    Inverted index over downloaded problem statements, ranked with BM25.
+
+    Documents are added one at a time as problems are downloaded; adding
+    or replacing a document only touches that document's postings.
+    """
+    def __init__(
+        self,
+        path: Path = SEARCH_FILE
+    ):
+        self.path = Path(path)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(
+        self
+    ) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(SEARCH_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _add(
+        self,
+        frontend_id,
+        title: str,
+        difficulty: Optional[str],
+        text: str
+    ) -> None:
+        frontend_id = str(frontend_id)
+        tokens = _tokenize(title) + _tokenize(text)
+        counts = Counter(tokens)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM postings WHERE frontend_id = ?", (frontend_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?)",
+                    (frontend_id, title, difficulty, len(tokens), " ".join(tokens))
+                )
+                conn.executemany(
+                    "INSERT INTO postings VALUES (?, ?, ?)",
+                    ((term, frontend_id, tf) for term, tf in counts.items())
+                )
+
+    def _search(
+        self,
+        query: str,
+        difficulty: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Tuple[float, str, str, str]]:
+        """
+        Rank documents against `query` with BM25.
+
+        Quoted parts ("sliding window") must appear as consecutive words.
+        Returns [(score, frontend_id, title, difficulty)], best first.
+        """
+        phrases = [" ".join(_tokenize(p)) for p in PHRASE_RE.findall(query)]
+        terms = list(dict.fromkeys(_tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            conn = self._connect()
+            doc_count, total_length = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+            ).fetchone()
+            if not doc_count:
+                return []
+            marks = ", ".join("?" * len(terms))
+            doc_freq = dict(conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({marks}) GROUP BY term",
+                terms
+            ).fetchall())
+            sql = (
+                "SELECT p.term, p.tf, d.frontend_id, d.title, d.difficulty, d.length "
+                f"FROM postings p JOIN docs d ON d.frontend_id = p.frontend_id WHERE p.term IN ({marks})"
+            )
+            params = list(terms)
+            if difficulty:
+                sql += " AND d.difficulty = ? COLLATE NOCASE"
+                params.append(difficulty)
+            rows = conn.execute(sql, params).fetchall()
+
+        avg_length = total_length / doc_count
+        scores = {}
+        docs = {}
+        for term, tf, frontend_id, title, diff, length in rows:
+            df = doc_freq.get(term, 0)
+            idf = math.log((doc_count - df + 0.5) / (df + 0.5) + 1)
+            norm = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+            scores[frontend_id] = scores.get(frontend_id, 0.0) + idf * norm
+            docs[frontend_id] = (title, diff)
+
+        if phrases:
+            with self._lock:
+                conn = self._connect()
+                for frontend_id in list(scores):
+                    (tokens,) = conn.execute(
+                        "SELECT tokens FROM docs WHERE frontend_id = ?", (frontend_id,)
+                    ).fetchone()
+                    padded = f" {tokens} "
+                    if not all(f" {phrase} " in padded for phrase in phrases):
+                        del scores[frontend_id]
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            (score, frontend_id, docs[frontend_id][0], docs[frontend_id][1])
+            for frontend_id, score in ranked
+        ]
+
+    def _count(
+        self
+    ) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM docs").fetchone()[0]
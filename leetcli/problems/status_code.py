@@ -8,4 +8,7 @@ STATUS_CODE_MAP = {
     16: "Compile Error (CE)",
     17: "Pending / In Queue",
     18: "Partially Accepted",
-}
\ No newline at end of file
+}
+
+STATUS_ACCEPTED = 10
+STATUS_PENDING = 17
@@ -0,0 +1,304 @@
+import ssl
+import gzip
+import json
+import time
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from urllib.parse import urlsplit
+
+from leetcli.utils.req import (
+    _req_header,
+    _req_cookies,
+    _req_solution_header
+)
+from leetcli.utils.client import (
+    LEETCODE_BASE_URL,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    RATE_LIMIT_RETRIES,
+    _retry_delay
+)
+from leetcli.utils.trace import _span
+
+MAX_HEADER_LINES = 200
+
+
+class _Response:
+    """The parts of an HTTP response the managers use (mirrors `requests.Response`)."""
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncLeetClient:
+    """
+    asyncio counterpart of `LeetClient`, built on the standard library only.
+
+    Speaks HTTP/1.1 over a pool of up to `pool_size` keep-alive
+    connections; further requests queue for a free connection, so
+    hundreds of coroutines can share one client without opening hundreds
+    of sockets. Same headers, cookies, timeouts and 429 handling as
+    `LeetClient`, and network failures surface as `ConnectionError`.
+
+    Connections belong to the event loop that opened them; using the
+    client from a new loop (e.g. a second `asyncio.run`) starts a fresh pool.
+
+    Unlike `LeetClient` it does not read proxy or CA-bundle settings from
+    the environment, follow redirects or keep Set-Cookie, which is why
+    the CLI itself stays on `LeetClient`.
+    """
+    def __init__(
+        self,
+        csrftoken: Optional[str] = None,
+        session: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout=DEFAULT_TIMEOUT,
+        base_url: str = LEETCODE_BASE_URL
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.graphql_url = f"{self.base_url}/graphql"
+        url = urlsplit(self.base_url)
+        self.scheme = url.scheme
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.host_header = url.netloc
+        self.timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        self.pool_size = pool_size
+        self._ssl = None
+        self._loop = None
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = None
+        self._retry_at = 0.0
+        self._set_auth(csrftoken, session)
+
+    def _set_pool_size(
+        self,
+        pool_size: int
+    ) -> None:
+        """Allow up to `pool_size` connections; shrinking waits for the next event loop."""
+        if self._slots is not None and pool_size > self.pool_size:
+            for _ in range(pool_size - self.pool_size):
+                self._slots.release()
+        self.pool_size = pool_size
+
+    def _set_auth(
+        self,
+        csrftoken: Optional[str],
+        session: Optional[str]
+    ) -> None:
+        self.csrftoken = csrftoken
+        self.session = session
+        self.headers = {
+            k.lower(): v for k, v in _req_header(csrftoken).items() if v is not None
+        }
+        cookies = _req_cookies(session, csrftoken)
+        self.cookie = "; ".join(f"{name}={value}" for name, value in cookies.items() if value)
+
+    def _bind_loop(
+        self
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            for _, writer in self._idle:
+                try:
+                    writer.transport.abort()
+                except RuntimeError:
+                    pass
+            self._idle = []
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.pool_size)
+
+    async def _open(
+        self
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        ssl_context = None
+        if self.scheme == "https":
+            if self._ssl is None:
+                try:
+                    import certifi
+                    self._ssl = ssl.create_default_context(cafile=certifi.where())
+                except ImportError:
+                    self._ssl = ssl.create_default_context()
+            ssl_context = self._ssl
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl_context),
+            self.timeout[0]
+        )
+
+    async def _read_response(
+        self,
+        reader: asyncio.StreamReader
+    ) -> Tuple[int, Dict[str, str], bytes, bool]:
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("Server closed the connection.")
+            parts = status_line.decode("latin-1").split(None, 2)
+            if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+                raise ConnectionError(f"Malformed status line: {status_line[:80]!r}")
+            status = int(parts[1])
+
+            headers = {}
+            for _ in range(MAX_HEADER_LINES):
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if status >= 200:
+                break
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        if headers.get("content-encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return status, headers, body, keep_alive
+
+    async def _request(
+        self,
+        path: str,
+        body: bytes,
+        headers: Optional[dict] = None
+    ) -> _Response:
+        """Send one POST, retrying once if a pooled connection turned out to be stale."""
+        merged = dict(self.headers)
+        merged.update((k.lower(), v) for k, v in (headers or {}).items() if v is not None)
+        merged.update({
+            "host": self.host_header,
+            "content-length": str(len(body)),
+            "accept-encoding": "gzip",
+            "connection": "keep-alive",
+        })
+        if self.cookie:
+            merged["cookie"] = self.cookie
+        head = f"POST {path} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in merged.items()) + "\r\n"
+        message = head.encode("latin-1") + body
+
+        self._bind_loop()
+        async with self._slots:
+            for attempt in range(2):
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._open()
+                try:
+                    writer.write(message)
+                    await writer.drain()
+                    status, response_headers, content, keep_alive = await asyncio.wait_for(
+                        self._read_response(reader),
+                        self.timeout[1]
+                    )
+                except (OSError, EOFError, asyncio.IncompleteReadError, ValueError) as e:
+                    writer.transport.abort()
+                    if reused and attempt == 0:
+                        continue
+                    raise ConnectionError(str(e) or type(e).__name__) from e
+                except asyncio.TimeoutError as e:
+                    writer.transport.abort()
+                    raise ConnectionError(f"Timed out waiting for {self.host}") from e
+
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return _Response(status, response_headers, content)
+
+    async def _post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Optional[dict] = None
+    ) -> _Response:
+        path = url[len(self.base_url):] or "/"
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            delay = self._retry_at - time.monotonic()
+            if delay > 0:
+                with _span("http.rate_limit_wait", "network", seconds=round(delay, 3)):
+                    await asyncio.sleep(delay)
+            with _span("http.post", "network", url=url) as span:
+                try:
+                    response = await self._request(path, body, headers)
+                except (OSError, asyncio.TimeoutError) as e:
+                    raise ConnectionError(str(e)) from e
+                span._set(
+                    status=response.status_code,
+                    bytes_sent=len(body),
+                    bytes_received=len(response.content)
+                )
+            if response.status_code != 429:
+                return response
+            self._retry_at = max(
+                self._retry_at,
+                time.monotonic() + _retry_delay(response.headers.get("retry-after"), attempt)
+            )
+        raise ConnectionError(f"Rate limited by {self.base_url} (HTTP 429); try again later.")
+
+    async def _graphql(
+        self,
+        query: str,
+        variables: Optional[dict] = None
+    ) -> dict:
+        payload = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+        response = await self._post(self.graphql_url, json.dumps(payload).encode())
+        with _span("json.parse", bytes=len(response.content)):
+            return response.json()
+
+    async def _submit(
+        self,
+        titleSlug: str,
+        data: dict
+    ) -> dict:
+        response = await self._post(
+            f"{self.base_url}/problems/{titleSlug}/submit/",
+            json.dumps(data).encode(),
+            _req_solution_header(self.csrftoken, titleSlug)
+        )
+        with _span("json.parse", bytes=len(response.content)):
+            return response.json()
+
+    async def aclose(
+        self
+    ) -> None:
+        """Close every idle connection of the current loop."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        return False
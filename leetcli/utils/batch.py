@@ -0,0 +1,98 @@
+import asyncio
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Sequence
+)
+
+from leetcli.utils.query import _req_batch_alias
+
+DEFAULT_BATCH_SIZE = 10
+
+
+def _chunks(
+    values: Sequence,
+    size: int
+) -> List[Sequence]:
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def _run_batch(
+    client,
+    values: Sequence,
+    build_query: Callable[[int], str],
+    build_variables: Callable[[Sequence], dict],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict:
+    """
+    Resolve `values` with aliased GraphQL documents of up to `batch_size`
+    fields each (see `_req_batch_query`).
+
+    Returns {value: result}. A result is the aliased field's data, or an
+    exception when that alias (or its whole request) failed, so one bad
+    item never hides the others.
+    """
+    results = {}
+    for chunk in _chunks(list(values), batch_size):
+        try:
+            response = client._graphql(
+                build_query(len(chunk)),
+                build_variables(chunk)
+            )
+        except Exception as e:
+            results.update((value, e) for value in chunk)
+            continue
+        results.update(_split_batch(response, chunk))
+    return results
+
+
+async def _arun_batch(
+    client,
+    values: Sequence,
+    build_query: Callable[[int], str],
+    build_variables: Callable[[Sequence], dict],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict:
+    """
+    `_run_batch` for an `AsyncLeetClient`: every chunk is sent at once and
+    the client's connection pool bounds how many are in flight.
+    """
+    async def run(chunk):
+        try:
+            response = await client._graphql(
+                build_query(len(chunk)),
+                build_variables(chunk)
+            )
+        except Exception as e:
+            return {value: e for value in chunk}
+        return _split_batch(response, chunk)
+
+    results = {}
+    for part in await asyncio.gather(*map(run, _chunks(list(values), batch_size))):
+        results.update(part)
+    return results
+
+
+def _split_batch(
+    response: dict,
+    chunk: Sequence
+) -> Dict:
+    """Map each value of `chunk` to its alias' data or a LookupError."""
+    results = {}
+    data = response.get("data") or {}
+    errors = {}
+    for error in response.get("errors") or []:
+        path = error.get("path") or []
+        alias = path[0] if path else None
+        errors.setdefault(alias, error.get("message", "Unknown GraphQL error"))
+
+    for i, value in enumerate(chunk):
+        alias = _req_batch_alias(i)
+        if alias in errors:
+            results[value] = LookupError(errors[alias])
+        elif alias in data:
+            results[value] = data[alias]
+        else:
+            results[value] = LookupError(errors.get(None, f"No result for {value}"))
+    return results
@@ -0,0 +1,302 @@
+import os
+import json
+import time
+import atexit
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple
+)
+
+from leetcli.utils.pack import PackStore
+from leetcli.utils.trace import _traced
+
+CACHE_DIR = Path(os.path.expanduser("~/.leetcode-cli")) / "cache"
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _atomic_write_json(
+    path: Path,
+    data
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _read_json(
+    path: Path,
+    default
+):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+class JsonStore:
+    """
+    The previous layout: one JSON file per entry under `path`, stamped with
+    its fetch time. Kept to migrate old caches and as the baseline of
+    benchmarks/bench_cache.py.
+    """
+    def __init__(
+        self,
+        path: Path
+    ):
+        self.path = Path(path)
+
+    def _entry_path(
+        self,
+        key: str
+    ) -> Path:
+        return self.path / f"{key.replace('/', '_')}.json"
+
+    def _get(
+        self,
+        key: str
+    ) -> Optional[Tuple[float, dict]]:
+        path = self._entry_path(key)
+        entry = _read_json(path, None)
+        if entry is None:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return entry.get("fetched_at", 0), entry["data"]
+
+    def _put_many(
+        self,
+        entries: Iterable[Tuple[str, float, dict]]
+    ) -> None:
+        for key, fetched_at, data in entries:
+            _atomic_write_json(
+                self._entry_path(key),
+                {"fetched_at": fetched_at, "data": data}
+            )
+
+    def _scan(
+        self
+    ) -> list:
+        entries = []
+        if not self.path.exists():
+            return entries
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and not entry.name.startswith("."):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _items(
+        self
+    ) -> Iterator[Tuple[str, float, dict]]:
+        for _, _, path in self._scan():
+            entry = _read_json(Path(path), None)
+            if entry is not None and "data" in entry:
+                yield Path(path).stem, entry.get("fetched_at", 0), entry["data"]
+
+    def _evict(
+        self,
+        max_bytes: int
+    ) -> int:
+        entries = self._scan()
+        used = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if used <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            used -= size
+            removed += 1
+        return removed
+
+    def _usage(
+        self
+    ) -> Tuple[int, int, int]:
+        entries = self._scan()
+        return len(entries), sum(size for _, size, _ in entries), 0
+
+    def _clear(
+        self
+    ) -> int:
+        removed = 0
+        for _, _, path in self._scan():
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+class DetailCache:
+    """
+    Persistent cache of problem details keyed by `titleSlug`.
+
+    Entries live in a `PackStore` (compressed records in one pack file,
+    memory-mapped index) stamped with their fetch time. Entries older
+    than the TTL count as misses. When the live records pass the size
+    limit the least recently used ones are evicted. Hit/miss counters are
+    kept in `stats.json`. A cache left in the old one-file-per-problem
+    layout is moved into the pack on first use.
+    """
+    def __init__(
+        self,
+        path: Path = CACHE_DIR
+    ):
+        self.path = Path(path)
+        self.store = PackStore(self.path)
+        self.legacy_dir = self.path / "problems"
+        self.settings_file = self.path / "settings.json"
+        self.stats_file = self.path / "stats.json"
+        settings = _read_json(self.settings_file, {})
+        self.ttl = settings.get("ttl", DEFAULT_CACHE_TTL)
+        self.max_bytes = settings.get("max_bytes", DEFAULT_CACHE_MAX_BYTES)
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._flush_registered = False
+        if self.legacy_dir.is_dir():
+            self._migrate()
+
+    def _migrate(
+        self
+    ) -> None:
+        """Move entries of the one-JSON-file-per-problem layout into the pack."""
+        self.store._put_many(JsonStore(self.legacy_dir)._items())
+        shutil.rmtree(self.legacy_dir, ignore_errors=True)
+        self._evict()
+
+    def _count(
+        self,
+        hit: bool
+    ) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+            if not self._flush_registered:
+                atexit.register(self._flush_stats)
+                self._flush_registered = True
+
+    @_traced("cache.get")
+    def _get(
+        self,
+        key: str
+    ) -> Optional[dict]:
+        entry = self.store._get(key)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            self._count(False)
+            return None
+        self._count(True)
+        return entry[1]
+
+    @_traced("cache.put")
+    def _put(
+        self,
+        key: str,
+        data: dict
+    ) -> None:
+        self._put_many({key: data})
+
+    @_traced("cache.put_many")
+    def _put_many(
+        self,
+        entries: Dict[str, dict]
+    ) -> None:
+        if not entries:
+            return
+        fetched_at = time.time()
+        self.store._put_many((key, fetched_at, data) for key, data in entries.items())
+        self._evict()
+
+    def _evict(
+        self
+    ) -> int:
+        return self.store._evict(self.max_bytes)
+
+    def _compact(
+        self
+    ) -> int:
+        return self.store._compact()
+
+    def _flush_stats(
+        self
+    ) -> None:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+        if not hits and not misses:
+            return
+        stats = _read_json(self.stats_file, {})
+        stats["hits"] = stats.get("hits", 0) + hits
+        stats["misses"] = stats.get("misses", 0) + misses
+        _atomic_write_json(self.stats_file, stats)
+
+    def _stats(
+        self
+    ) -> dict:
+        self._flush_stats()
+        stats = _read_json(self.stats_file, {})
+        entries, used, stale = self.store._usage()
+        hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+        return {
+            "entries": entries,
+            "bytes": used,
+            "stale_bytes": stale,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+    def _clear(
+        self
+    ) -> int:
+        removed = self.store._clear()
+        with self._lock:
+            self._hits = self._misses = 0
+        try:
+            self.stats_file.unlink()
+        except FileNotFoundError:
+            pass
+        return removed
+
+    def _configure(
+        self,
+        ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ) -> None:
+        if ttl is not None:
+            self.ttl = ttl
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        _atomic_write_json(
+            self.settings_file,
+            {"ttl": self.ttl, "max_bytes": self.max_bytes}
+        )
+        self._evict()
@@ -0,0 +1,192 @@
+import json
+import time
+import threading
+from typing import Optional
+
+from leetcli.utils.req import (
+    _req_header,
+    _req_cookies,
+    _req_solution_header
+)
+from leetcli.utils.trace import _span
+
+LEETCODE_BASE_URL = "https://leetcode.com"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 30)
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_DELAY = 2.0
+RATE_LIMIT_MAX_DELAY = 60.0
+
+
+def _retry_delay(
+    retry_after: Optional[str],
+    attempt: int
+) -> float:
+    """Seconds to wait after a 429: Retry-After if given, else 2s, 4s, 8s..., capped."""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = RATE_LIMIT_DELAY * 2 ** attempt
+    return min(max(delay, 0.0), RATE_LIMIT_MAX_DELAY)
+
+
+class LeetClient:
+    """
+    Pooled HTTP client shared by every manager.
+
+    Holds one keep-alive `requests.Session` with the auth cookies and
+    headers already applied, so consecutive calls reuse a warm connection.
+    Network failures and timeouts surface as the builtin `ConnectionError`.
+
+    HTTP 429 responses are retried after the server's Retry-After (or an
+    exponential backoff); the pause is shared, so every thread using the
+    client waits it out together instead of hammering the server.
+
+    `requests` is only imported when the first request is sent, so creating
+    a client costs nothing for commands that never go online.
+    """
+    def __init__(
+        self,
+        csrftoken: Optional[str] = None,
+        session: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout=DEFAULT_TIMEOUT,
+        base_url: str = LEETCODE_BASE_URL
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.graphql_url = f"{self.base_url}/graphql"
+        self.timeout = timeout
+        self._http = None
+        self._retry_at = 0.0
+        self._retry_lock = threading.Lock()
+        self._http_lock = threading.Lock()
+        self._set_pool_size(pool_size)
+        self._set_auth(csrftoken, session)
+
+    @property
+    def http(self):
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    import requests
+
+                    http = requests.Session()
+                    self._mount_adapter(http)
+                    self._apply_auth(http)
+                    self._http = http
+        return self._http
+
+    def _set_pool_size(
+        self,
+        pool_size: int
+    ) -> None:
+        """Keep up to `pool_size` idle connections, e.g. one per worker thread."""
+        self.pool_size = pool_size
+        if self._http is not None:
+            self._mount_adapter(self._http)
+
+    def _mount_adapter(
+        self,
+        http
+    ) -> None:
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size
+        )
+        http.mount("https://", adapter)
+        http.mount("http://", adapter)
+
+    def _set_auth(
+        self,
+        csrftoken: Optional[str],
+        session: Optional[str]
+    ) -> None:
+        self.csrftoken = csrftoken
+        self.session = session
+        if self._http is not None:
+            self._apply_auth(self._http)
+
+    def _apply_auth(
+        self,
+        http
+    ) -> None:
+        http.headers.update(
+            {k: v for k, v in _req_header(self.csrftoken).items() if v is not None}
+        )
+        if self.csrftoken is None:
+            http.headers.pop("x-csrftoken", None)
+        http.cookies.clear()
+        for name, value in _req_cookies(self.session, self.csrftoken).items():
+            if value:
+                http.cookies.set(name, value)
+
+    def _post(
+        self,
+        url,
+        **kwargs
+    ):
+        http = self.http
+        import requests
+
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._wait_rate_limit()
+            with _span("http.post", "network", url=url) as span:
+                try:
+                    response = http.post(url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    raise ConnectionError(str(e)) from e
+                span._set(
+                    status=response.status_code,
+                    bytes_sent=len(response.request.body or b""),
+                    bytes_received=len(response.content)
+                )
+            if response.status_code != 429:
+                return response
+            self._back_off(response.headers.get("Retry-After"), attempt)
+        raise ConnectionError(f"Rate limited by {self.base_url} (HTTP 429); try again later.")
+
+    def _wait_rate_limit(
+        self
+    ) -> None:
+        delay = self._retry_at - time.monotonic()
+        if delay > 0:
+            with _span("http.rate_limit_wait", "network", seconds=round(delay, 3)):
+                time.sleep(delay)
+
+    def _back_off(
+        self,
+        retry_after: Optional[str],
+        attempt: int
+    ) -> None:
+        """Push the shared resume time out by Retry-After seconds (or 2s, 4s, 8s...)."""
+        delay = _retry_delay(retry_after, attempt)
+        with self._retry_lock:
+            self._retry_at = max(self._retry_at, time.monotonic() + delay)
+
+    def _graphql(
+        self,
+        query: str,
+        variables: Optional[dict] = None
+    ) -> dict:
+        payload = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+        response = self._post(self.graphql_url, data=json.dumps(payload))
+        with _span("json.parse", bytes=len(response.content)):
+            return response.json()
+
+    def _submit(
+        self,
+        titleSlug: str,
+        data: dict
+    ) -> dict:
+        response = self._post(
+            f"{self.base_url}/problems/{titleSlug}/submit/",
+            headers=_req_solution_header(self.csrftoken, titleSlug),
+            json=data
+        )
+        with _span("json.parse", bytes=len(response.content)):
+            return response.json()
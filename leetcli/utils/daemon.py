@@ -0,0 +1,312 @@
+import io
+import os
+import sys
+import json
+import time
+import socket
+import struct
+import signal
+import traceback
+import subprocess
+from pathlib import Path
+from typing import (
+    List,
+    Optional
+)
+
+DAEMON_DIR = Path(os.path.expanduser("~/.leetcode-cli"))
+DAEMON_SOCKET = DAEMON_DIR / "daemon.sock"
+DAEMON_PID_FILE = DAEMON_DIR / "daemon.pid"
+DAEMON_IDLE_TIMEOUT = 3600.0
+DAEMON_START_TIMEOUT = 5.0
+CONNECT_TIMEOUT = 0.2
+
+# Commands that need the user's terminal or manage the daemon itself
+# always run in the calling process.
+LOCAL_COMMANDS = {"daemon", "login", "logout"}
+LOCAL_FLAGS = {"--trace"}
+
+FRAME_HEADER = struct.Struct(">cI")
+STDOUT, STDERR, EXIT = b"1", b"2", b"x"
+
+
+def _supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and os.name != "nt"
+
+
+def _send_frame(
+    sock: socket.socket,
+    channel: bytes,
+    payload: bytes
+) -> None:
+    sock.sendall(FRAME_HEADER.pack(channel, len(payload)) + payload)
+
+
+def _recv_exact(
+    sock: socket.socket,
+    size: int
+) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Daemon closed the connection.")
+        data += chunk
+    return data
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as one frame."""
+    def __init__(self, sock, channel, isatty):
+        self.sock = sock
+        self.channel = channel
+        self._isatty = isatty
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    @property
+    def errors(self):
+        return "replace"
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self._isatty
+
+    def write(self, text):
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        if text:
+            _send_frame(self.sock, self.channel, text.encode("utf-8", "replace"))
+        return len(text)
+
+
+def _should_forward(
+    argv: List[str]
+) -> bool:
+    if os.environ.get("LEETCLI_NO_DAEMON") or os.environ.get("LEETCLI_TRACE"):
+        return False
+    if LOCAL_FLAGS.intersection(argv):
+        return False
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return command is not None and command not in LOCAL_COMMANDS
+
+
+def _forward(
+    argv: List[str],
+    path: Path = DAEMON_SOCKET
+) -> Optional[int]:
+    """
+    Run `argv` in the daemon, streaming its output to this process.
+
+    Returns the exit code, or None when there is no daemon to talk to
+    (the caller then runs the command itself).
+    """
+    if not _supported() or not _should_forward(argv) or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "stdout_tty": sys.stdout.isatty(),
+        "stderr_tty": sys.stderr.isatty(),
+    }
+    streams = {STDOUT: sys.stdout, STDERR: sys.stderr}
+    try:
+        sock.settimeout(None)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        while True:
+            channel, size = FRAME_HEADER.unpack(_recv_exact(sock, FRAME_HEADER.size))
+            payload = _recv_exact(sock, size)
+            if channel == EXIT:
+                return int(payload)
+            stream = streams[channel]
+            stream.write(payload.decode("utf-8", "replace"))
+            stream.flush()
+    except (OSError, ConnectionError):
+        sys.stderr.write("leetcli: lost connection to the daemon.\n")
+        return 1
+    finally:
+        sock.close()
+
+
+def _session_stamp():
+    from leetcli.auth.config import USERINFO_FILE
+
+    try:
+        stat = os.stat(USERINFO_FILE)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+    except OSError:
+        return None
+
+
+def _run_request(
+    app,
+    request: dict,
+    conn: socket.socket
+) -> int:
+    """Run one forwarded command with stdout/stderr redirected to `conn`."""
+    import click
+
+    stdout = _FrameWriter(conn, STDOUT, request.get("stdout_tty", False))
+    stderr = _FrameWriter(conn, STDERR, request.get("stderr_tty", False))
+    saved = sys.stdout, sys.stderr, os.getcwd()
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        os.chdir(request["cwd"])
+        app.cli.main(
+            args=request["argv"],
+            prog_name="leetcli",
+            obj=app,
+            standalone_mode=False,
+            color=request.get("stdout_tty") or None
+        )
+        return 0
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.exceptions.ClickException as e:
+        e.show(file=stderr)
+        return e.exit_code
+    except click.exceptions.Abort:
+        stderr.write("Aborted!\n")
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        stderr.write(traceback.format_exc())
+        return 1
+    finally:
+        sys.stdout, sys.stderr = saved[0], saved[1]
+        try:
+            os.chdir(saved[2])
+        except OSError:
+            pass
+
+
+def _serve(
+    path: Path = DAEMON_SOCKET,
+    idle_timeout: float = DAEMON_IDLE_TIMEOUT
+) -> None:
+    """
+    Daemon main loop: one warm LeetCli (HTTP pool, session, managers,
+    open SQLite handles) serving forwarded commands one at a time.
+
+    Requests run sequentially because commands change the working
+    directory and the process-wide stdout. Exits after `idle_timeout`
+    seconds without a request or on a "stop" request.
+    """
+    from leetcli.main import LeetCli
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(idle_timeout)
+    DAEMON_PID_FILE.write_text(str(os.getpid()))
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    app, stamp = LeetCli(), _session_stamp()
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                try:
+                    line = conn.makefile("rb").readline()
+                    request = json.loads(line)
+                except (OSError, ValueError):
+                    continue
+                if request.get("command") == "stop":
+                    _send_frame(conn, EXIT, b"0")
+                    break
+                if request.get("command") == "ping":
+                    _send_frame(conn, EXIT, str(os.getpid()).encode())
+                    continue
+
+                if _session_stamp() != stamp:
+                    app, stamp = LeetCli(), _session_stamp()
+                app._reset_request_state()
+                code = _run_request(app, request, conn)
+                try:
+                    _send_frame(conn, EXIT, str(code).encode())
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        for stale in (path, DAEMON_PID_FILE):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _control(
+    command: str,
+    path: Path = DAEMON_SOCKET
+) -> Optional[int]:
+    """Send "ping" or "stop"; returns the reply code, or None if no daemon answers."""
+    if not _supported() or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_START_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps({"command": command}).encode() + b"\n")
+            channel, size = FRAME_HEADER.unpack(_recv_exact(sock, FRAME_HEADER.size))
+            return int(_recv_exact(sock, size))
+    except (OSError, ConnectionError, ValueError):
+        return None
+
+
+def _start_daemon(
+    idle_timeout: float = DAEMON_IDLE_TIMEOUT
+) -> int:
+    """Spawn a detached daemon and wait until it answers; returns its pid."""
+    if not _supported():
+        raise OSError("Daemon mode needs Unix domain sockets, which this platform lacks.")
+    running = _control("ping")
+    if running is not None:
+        return running
+
+    subprocess.Popen(
+        [sys.executable, "-m", "leetcli.utils.daemon", str(idle_timeout)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True
+    )
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        pid = _control("ping")
+        if pid is not None:
+            return pid
+        time.sleep(0.05)
+    raise TimeoutError("The daemon did not start in time.")
+
+
+def _stop_daemon() -> bool:
+    """Ask the daemon to exit; False if none was running."""
+    return _control("stop") is not None
+
+
+if __name__ == "__main__":
+    _serve(idle_timeout=float(sys.argv[1]) if len(sys.argv) > 1 else DAEMON_IDLE_TIMEOUT)
@@ -1,4 +1,16 @@
-from leetcli.utils.language import LEETCODE_LANGUAGES
+import os
+from typing import (
+    List,
+    Optional,
+    Sequence,
+    Union
+)
+
+from leetcli.utils.language import (
+    ALL_LANGUAGES,
+    LEETCODE_LANGUAGES
+)
+from leetcli.utils.trace import _span
 
 LANG_FILE_EXT = {
     "Python3": "py",
@@ -21,14 +33,21 @@ LANG_FILE_EXT = {
     "Racket": "rkt",
 }
 
+def _problem_basename(
+    data
+) -> str:
+    """"1_Two_Sum": the name shared by a problem's files (and its directory)."""
+    safe_title = data['title'].replace(" ", "_").replace("/", "_")
+    return f"{data['questionFrontendId']}_{safe_title}"
+
 def _create_markdown_file(
     data,
     content_text,
-    ac_rate
+    ac_rate,
+    directory: Optional[str] = None
 ):
     try:
-        safe_title = data['title'].replace(" ", "_").replace("/", "_")
-        md_filename = f"{data['questionFrontendId']}_{safe_title}.md"
+        md_filename = os.path.join(directory or "", f"{_problem_basename(data)}.md")
 
         md_text = f"# {data['title']} (ID: {data['questionFrontendId']})\n\n"
         md_text += f"**Difficulty:** {data['difficulty']}\n\n"
@@ -36,15 +55,16 @@ def _create_markdown_file(
         md_text += "## Problem Description\n\n"
         md_text += content_text + "\n\n"
 
-        with open(md_filename, "w", encoding="utf-8") as f:
-            f.write(md_text)
+        with _span("file.write", path=md_filename) as span, open(md_filename, "w", encoding="utf-8") as f:
+            span._set(chars=f.write(md_text))
 
     except Exception as e:
         raise e
 
 def _create_code_file(
     data,
-    language
+    language,
+    directory: Optional[str] = None
 ):
     lang_key = language.strip().lower()
     try:
@@ -62,22 +82,52 @@ def _create_code_file(
                 f"No code snippet available for language: {language}\n"
                 f"Available options: {', '.join(sorted({c['lang'] for c in data['codeSnippets']}))}"
             )
-        safe_title = data['title'].replace(" ", "_").replace("/", "_")
-        filename = f"{data['questionFrontendId']}_{safe_title}.{LANG_FILE_EXT[lang_std]}"
+        filename = os.path.join(directory or "", f"{_problem_basename(data)}.{LANG_FILE_EXT[lang_std]}")
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(template)
+        with _span("file.write", path=filename) as span, open(filename, "w", encoding="utf-8") as f:
+            span._set(chars=f.write(template))
 
     except Exception as e:
         raise e
     
 
+def _create_code_files(
+    data,
+    languages: Union[str, Sequence[str]],
+    directory: Optional[str] = None
+) -> List[str]:
+    """
+    Write the template of every language in `languages` (or of every
+    language with a known extension for ALL_LANGUAGES) from one detail
+    payload. Languages the problem has no snippet for are skipped and
+    returned; LookupError if none could be written.
+    """
+    offered = [c['lang'] for c in data['codeSnippets'] or []]
+    if languages == ALL_LANGUAGES:
+        languages = [lang for lang in offered if lang in LANG_FILE_EXT]
+    written, skipped = [], []
+    for language in languages:
+        if LEETCODE_LANGUAGES.get(language.strip().lower()) in offered:
+            _create_code_file(data, language, directory)
+            written.append(language)
+        else:
+            skipped.append(language)
+    if not written:
+        raise LookupError(
+            f"No code snippet available for: {', '.join(skipped) or 'any supported language'}\n"
+            f"Available options: {', '.join(sorted(offered))}"
+        )
+    return skipped
+
+
 def _get_code_str(
     filename
 ) -> str:
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return f.read()
+        with _span("file.read", path=filename) as span, open(filename, "r", encoding="utf-8") as f:
+            code = f.read()
+            span._set(chars=len(code))
+            return code
         
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {filename}")
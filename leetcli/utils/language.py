@@ -1,4 +1,8 @@
 import os
+from typing import List
+
+# Pass as the language to write a template for every language a problem offers.
+ALL_LANGUAGES = "all"
 
 LEETCODE_LANGUAGES = {
     # --- Python ---
@@ -107,4 +111,23 @@ def _detect_language(filename_or_ext: str) -> str:
         )
 
     leetcode_lang = LEETCODE_LANGUAGES[lang_key]
-    return LANG_CONVERT.get(leetcode_lang, leetcode_lang)
\ No newline at end of file
+    return LANG_CONVERT.get(leetcode_lang, leetcode_lang)
+
+
+def _parse_languages(spec: str) -> List[str]:
+    """Turn "py,cpp,rs" into ["Python3", "C++", "Rust"], keeping order and dropping repeats."""
+    languages = []
+    for name in spec.split(","):
+        lang_key = name.strip().lower()
+        if not lang_key:
+            continue
+        if lang_key not in LEETCODE_LANGUAGES:
+            raise ValueError(
+                f"Unsupported language: {name.strip()}\n"
+                f"Available options: {', '.join(sorted(set(LEETCODE_LANGUAGES.values())))}"
+            )
+        if LEETCODE_LANGUAGES[lang_key] not in languages:
+            languages.append(LEETCODE_LANGUAGES[lang_key])
+    if not languages:
+        raise ValueError("No languages given.")
+    return languages
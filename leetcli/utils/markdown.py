@@ -0,0 +1,184 @@
+import re
+from html.parser import HTMLParser
+from typing import (
+    List,
+    Optional
+)
+
+BLOCK_TAGS = {"p", "div", "section", "blockquote", "table", "tr"}
+HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+WHITESPACE_RE = re.compile(r"[ \t\r\n\f\xa0]+")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+class _MarkdownConverter(HTMLParser):
+    """
+    Single-pass HTML -> Markdown for LeetCode problem statements.
+
+    Keeps what plain-text extraction loses: <pre> examples become fenced
+    blocks, <code> becomes inline code, <sup>/<sub> become ^ and _, and
+    lists keep their bullets and numbering.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.pre = 0
+        self.pre_start = False
+        self.code = 0
+        self.opened = -1
+        self.lists: List[list] = []
+        self.links: List[Optional[str]] = []
+
+    def _tail(
+        self
+    ) -> str:
+        for part in reversed(self.parts):
+            if part:
+                return part
+        return "\n\n"
+
+    def _break(
+        self,
+        count: int = 2
+    ) -> None:
+        """End the current block with `count` newlines (never more)."""
+        while self.parts and self.parts[-1].strip(" ") == "" and "\n" not in self.parts[-1]:
+            self.parts.pop()
+        if not self.parts:
+            return
+        tail = self._tail()
+        have = len(tail) - len(tail.rstrip("\n"))
+        if have < count:
+            self.parts.append("\n" * (count - have))
+
+    def _emit(
+        self,
+        text: str
+    ) -> None:
+        if self.pre:
+            if self.pre_start and text.startswith("\n"):
+                text = text[1:]
+            self.pre_start = False
+            self.parts.append(text)
+            return
+        text = WHITESPACE_RE.sub(" ", text)
+        if text.startswith(" ") and self.opened == len(self.parts):
+            marker = self.parts.pop()
+            self._emit(" ")
+            self.parts.append(marker)
+            text = text[1:]
+        if text.startswith(" ") and self._tail()[-1:] in ("\n", " "):
+            text = text[1:]
+        if text:
+            self.parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "sup":
+            self.parts.append("^")
+        elif tag == "sub":
+            self.parts.append("_")
+        elif tag == "pre":
+            self._break()
+            self.parts.append("```\n")
+            self.pre += 1
+            self.pre_start = True
+        elif self.pre:
+            return
+        elif tag in BLOCK_TAGS:
+            self._break()
+        elif tag in HEADING_TAGS:
+            self._break()
+            self.parts.append("#" * HEADING_TAGS[tag] + " ")
+        elif tag == "br":
+            self.parts.append("  \n")
+        elif tag in ("ul", "ol"):
+            self._break(1 if self.lists else 2)
+            self.lists.append([tag, 0])
+        elif tag == "li":
+            self._break(1)
+            indent = "  " * (len(self.lists) - 1)
+            if self.lists and self.lists[-1][0] == "ol":
+                self.lists[-1][1] += 1
+                self.parts.append(f"{indent}{self.lists[-1][1]}. ")
+            else:
+                self.parts.append(f"{indent}- ")
+        elif tag == "code":
+            self.code += 1
+            if self.code == 1:
+                self.parts.append("`")
+        elif self.code:
+            return
+        elif tag in ("strong", "b"):
+            self.parts.append("**")
+            self.opened = len(self.parts)
+        elif tag in ("em", "i"):
+            self.parts.append("*")
+            self.opened = len(self.parts)
+        elif tag == "a":
+            self.links.append(attrs.get("href"))
+            self.parts.append("[")
+        elif tag == "img":
+            self.parts.append(f"![{attrs.get('alt') or ''}]({attrs.get('src') or ''})")
+
+    def handle_endtag(self, tag):
+        if tag == "pre":
+            self.pre = max(self.pre - 1, 0)
+            if not self._tail().endswith("\n"):
+                self.parts.append("\n")
+            self.parts.append("```")
+            self._break()
+        elif self.pre:
+            return
+        elif tag in BLOCK_TAGS or tag in HEADING_TAGS:
+            self._break()
+        elif tag in ("ul", "ol"):
+            if self.lists:
+                self.lists.pop()
+            self._break(1 if self.lists else 2)
+        elif tag == "code":
+            self.code = max(self.code - 1, 0)
+            if self.code == 0:
+                self.parts.append("`")
+        elif self.code:
+            return
+        elif tag in ("strong", "b"):
+            self._close_inline("**")
+        elif tag in ("em", "i"):
+            self._close_inline("*")
+        elif tag == "a":
+            href = self.links.pop() if self.links else None
+            self.parts.append(f"]({href})" if href else "]")
+
+    def _close_inline(
+        self,
+        marker: str
+    ) -> None:
+        """Close emphasis outside any trailing space (`*a *b` is not Markdown)."""
+        if self.parts and self.parts[-1].endswith(" "):
+            self.parts[-1] = self.parts[-1].rstrip(" ")
+            self.parts.append(marker + " ")
+        else:
+            self.parts.append(marker)
+
+    def handle_data(self, data):
+        self._emit(data)
+
+    def _result(
+        self
+    ) -> str:
+        text = "".join(self.parts)
+        text = "\n".join(line.rstrip(" ") if not line.endswith("  ") else line for line in text.split("\n"))
+        return BLANK_LINES_RE.sub("\n\n", text).strip() + "\n"
+
+
+def _html_to_markdown(
+    html: str
+) -> str:
+    """Convert a problem's `content` HTML to Markdown."""
+    if html is None:
+        raise TypeError("Problem content is empty.")
+    converter = _MarkdownConverter()
+    converter.feed(html)
+    converter.close()
+    return converter._result()
@@ -0,0 +1,507 @@
+import os
+import json
+import mmap
+import time
+import zlib
+import struct
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# problems.idx: a header followed by an open-addressing table of
+# fixed-width slots, mapped into memory and updated in place.
+INDEX_MAGIC = b"LCIX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sIIIIIQ")  # magic, version, generation, capacity, count, deleted, live bytes
+SLOT = struct.Struct("<QQII")  # key hash (0 = empty), record offset, record length (0 = deleted), last access
+SLOT_ACCESS = struct.Struct("<I")
+SLOT_ACCESS_OFFSET = 20
+
+# problems.<generation>.pack: append-only records of
+# header + titleSlug + compressed JSON.
+RECORD_HEADER = struct.Struct("<BHdI")  # codec, key length, fetched_at, payload length
+CODEC_ZLIB = 1
+CODEC_LZ4 = 2
+
+INITIAL_CAPACITY = 1024
+MAX_LOAD = 0.7
+COMPACT_MIN_STALE_BYTES = 1024 * 1024
+COMPACT_STALE_RATIO = 0.5
+EVICT_LOW_WATER = 0.9
+
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+FNV_MASK = 0xFFFFFFFFFFFFFFFF
+
+_lz4_block = None
+
+
+def _lz4():
+    """`lz4.block`, or None when lz4 is not installed (records fall back to zlib)."""
+    global _lz4_block
+    if _lz4_block is None:
+        try:
+            import lz4.block
+            _lz4_block = lz4.block
+        except ImportError:
+            _lz4_block = False
+    return _lz4_block or None
+
+
+def _compress(
+    raw: bytes
+) -> Tuple[int, bytes]:
+    block = _lz4()
+    if block is not None:
+        return CODEC_LZ4, block.compress(raw, store_size=True)
+    return CODEC_ZLIB, zlib.compress(raw, 1)
+
+
+def _decompress(
+    codec: int,
+    payload: bytes
+) -> bytes:
+    if codec == CODEC_LZ4:
+        block = _lz4()
+        if block is None:
+            raise LookupError("This cache record is lz4-compressed but lz4 is not installed.")
+        try:
+            return block.decompress(payload)
+        except block.LZ4BlockError as e:
+            raise ValueError(str(e)) from e
+    if codec == CODEC_ZLIB:
+        try:
+            return zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(str(e)) from e
+    raise ValueError(f"Unknown cache record codec {codec}.")
+
+
+def _key_hash(
+    key: bytes
+) -> int:
+    """64-bit FNV-1a; hashlib would cost more to import than a lookup takes."""
+    h = FNV_OFFSET
+    for byte in key:
+        h = ((h ^ byte) * FNV_PRIME) & FNV_MASK
+    return h or 1
+
+
+def _compact_due(
+    pack_size: int,
+    live: int
+) -> bool:
+    """True once more than half of the pack (and at least 1 MB) is stale."""
+    return pack_size - live > max(COMPACT_MIN_STALE_BYTES, pack_size * COMPACT_STALE_RATIO)
+
+
+def _capacity_for(
+    count: int
+) -> int:
+    capacity = INITIAL_CAPACITY
+    while count > capacity * MAX_LOAD / 2:
+        capacity *= 2
+    return capacity
+
+
+class PackStore:
+    """
+    Problem details in one append-only pack file with a memory-mapped index.
+
+    Every `_put` appends a compressed record (lz4, or zlib without lz4)
+    to `problems.<generation>.pack` and points the key's slot in
+    `problems.idx` at it. A lookup hashes the `titleSlug`, probes the
+    mapped index and decompresses one slice of the mapped pack: no
+    directory scans and no per-entry files.
+
+    Replaced and evicted records stay in the pack as stale bytes until
+    `_compact` copies the live ones into the next generation; that runs
+    automatically once more than half of the pack is stale. Writers
+    serialise on `problems.lock`, so the daemon and a foreground process
+    can share the store.
+    """
+    def __init__(
+        self,
+        path: Path
+    ):
+        self.path = Path(path)
+        self.index_file = self.path / "problems.idx"
+        self.lock_file = self.path / "problems.lock"
+        self._lock = threading.RLock()
+        self._index = None
+        self._index_id = None
+        self._pack = None
+        self._pack_generation = None
+
+    def _pack_file(
+        self,
+        generation: int
+    ) -> Path:
+        return self.path / f"problems.{generation}.pack"
+
+    def _unmap(
+        self
+    ) -> None:
+        for mapped in (self._index, self._pack):
+            if mapped is not None:
+                mapped.close()
+        self._index = self._index_id = None
+        self._pack = self._pack_generation = None
+
+    def _refresh(
+        self
+    ) -> bool:
+        """Map `problems.idx`, again if another process replaced it; False if there is none."""
+        try:
+            stat = os.stat(self.index_file)
+        except FileNotFoundError:
+            self._unmap()
+            return False
+        identity = (stat.st_dev, stat.st_ino, stat.st_size)
+        if identity == self._index_id:
+            return True
+
+        self._unmap()
+        if stat.st_size < INDEX_HEADER.size:
+            return False
+        with open(self.index_file, "r+b") as f:
+            index = mmap.mmap(f.fileno(), 0)
+        magic, version, _, capacity, _, _, _ = INDEX_HEADER.unpack_from(index)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or len(index) != INDEX_HEADER.size + capacity * SLOT.size:
+            index.close()
+            return False
+        self._index, self._index_id = index, identity
+        return True
+
+    def _header(
+        self
+    ) -> Tuple[int, int, int, int, int]:
+        """(generation, capacity, count, deleted, live bytes) of the mapped index."""
+        return INDEX_HEADER.unpack_from(self._index)[2:]
+
+    def _set_header(
+        self,
+        generation: int,
+        capacity: int,
+        count: int,
+        deleted: int,
+        live: int
+    ) -> None:
+        INDEX_HEADER.pack_into(self._index, 0, INDEX_MAGIC, INDEX_VERSION, generation, capacity, count, deleted, live)
+
+    def _find(
+        self,
+        key_hash: int
+    ) -> Tuple[int, int]:
+        """(slot holding `key_hash` or -1, first slot a new entry could take)."""
+        _, capacity, _, _, _ = self._header()
+        mask = capacity - 1
+        i = key_hash & mask
+        free = -1
+        for _ in range(capacity):
+            slot_hash, _, length, _ = SLOT.unpack_from(self._index, INDEX_HEADER.size + i * SLOT.size)
+            if slot_hash == 0:
+                return -1, free if free >= 0 else i
+            if length == 0:
+                if free < 0:
+                    free = i
+            elif slot_hash == key_hash:
+                return i, free
+            i = (i + 1) & mask
+        return -1, free
+
+    def _slots(
+        self
+    ) -> List[Tuple[int, int, int, int, int]]:
+        """Every live slot as (slot, key hash, offset, length, last access)."""
+        _, capacity, _, _, _ = self._header()
+        slots = []
+        for i in range(capacity):
+            slot_hash, offset, length, access = SLOT.unpack_from(self._index, INDEX_HEADER.size + i * SLOT.size)
+            if slot_hash and length:
+                slots.append((i, slot_hash, offset, length, access))
+        return slots
+
+    def _map_pack(
+        self,
+        end: int
+    ) -> Optional[mmap.mmap]:
+        """The current pack mapped far enough to read up to `end`, or None."""
+        generation = self._header()[0]
+        if self._pack is not None and self._pack_generation == generation and len(self._pack) >= end:
+            return self._pack
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = self._pack_generation = None
+        try:
+            with open(self._pack_file(generation), "rb") as f:
+                if os.fstat(f.fileno()).st_size < end:
+                    return None
+                self._pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        self._pack_generation = generation
+        return self._pack
+
+    def _get(
+        self,
+        key: str
+    ) -> Optional[Tuple[float, dict]]:
+        """(fetched_at, data) for `key`, or None if it is missing or unreadable."""
+        key_bytes = key.encode()
+        with self._lock:
+            if not self._refresh():
+                return None
+            slot, _ = self._find(_key_hash(key_bytes))
+            if slot < 0:
+                return None
+            position = INDEX_HEADER.size + slot * SLOT.size
+            _, offset, length, _ = SLOT.unpack_from(self._index, position)
+            pack = self._map_pack(offset + length)
+            if pack is None:
+                return None
+            codec, key_length, fetched_at, payload_length = RECORD_HEADER.unpack_from(pack, offset)
+            start = offset + RECORD_HEADER.size
+            if RECORD_HEADER.size + key_length + payload_length != length or pack[start:start + key_length] != key_bytes:
+                return None
+            payload = pack[start + key_length:offset + length]
+            SLOT_ACCESS.pack_into(self._index, position + SLOT_ACCESS_OFFSET, int(time.time()))
+        try:
+            return fetched_at, json.loads(_decompress(codec, payload))
+        except (ValueError, LookupError):
+            return None
+
+    @contextmanager
+    def _writing(
+        self
+    ):
+        """Hold the store for writing, creating an empty index if there is none."""
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a+b") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                if not self._refresh():
+                    self._write_index(1, INITIAL_CAPACITY, [], 0)
+                yield
+
+    def _write_index(
+        self,
+        generation: int,
+        capacity: int,
+        slots: Iterable[Tuple[int, int, int, int]],
+        live: int
+    ) -> None:
+        """Atomically replace `problems.idx` with a table of (key hash, offset, length, access)."""
+        table = bytearray(INDEX_HEADER.size + capacity * SLOT.size)
+        mask = capacity - 1
+        count = 0
+        for slot_hash, offset, length, access in slots:
+            i = slot_hash & mask
+            while SLOT.unpack_from(table, INDEX_HEADER.size + i * SLOT.size)[0]:
+                i = (i + 1) & mask
+            SLOT.pack_into(table, INDEX_HEADER.size + i * SLOT.size, slot_hash, offset, length, access)
+            count += 1
+        INDEX_HEADER.pack_into(table, 0, INDEX_MAGIC, INDEX_VERSION, generation, capacity, count, 0, live)
+
+        tmp_path = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(table)
+            self._unmap()
+            os.replace(tmp_path, self.index_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._refresh()
+
+    def _append(
+        self,
+        generation: int,
+        records: List[bytes]
+    ) -> int:
+        """Append `records` to the pack; returns the offset of the first one."""
+        fd = os.open(
+            self._pack_file(generation),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644
+        )
+        try:
+            offset = os.fstat(fd).st_size
+            data = memoryview(b"".join(records))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        return offset
+
+    def _put_many(
+        self,
+        entries: Iterable[Tuple[str, float, dict]]
+    ) -> None:
+        """Store every (key, fetched_at, data) with one append and one lock round."""
+        records = []
+        for key, fetched_at, data in entries:
+            key_bytes = key.encode()
+            codec, payload = _compress(json.dumps(data, separators=(",", ":")).encode())
+            header = RECORD_HEADER.pack(codec, len(key_bytes), fetched_at, len(payload))
+            records.append((_key_hash(key_bytes), header + key_bytes + payload))
+        if not records:
+            return
+
+        with self._writing():
+            generation, capacity, count, deleted, live = self._header()
+            if count + deleted + len(records) > capacity * MAX_LOAD:
+                self._write_index(
+                    generation,
+                    _capacity_for(count + len(records)),
+                    [slot[1:] for slot in self._slots()],
+                    live
+                )
+                generation, capacity, count, deleted, live = self._header()
+
+            offset = self._append(generation, [record for _, record in records])
+            now = int(time.time())
+            for key_hash, record in records:
+                slot, free = self._find(key_hash)
+                if slot >= 0:
+                    live -= SLOT.unpack_from(self._index, INDEX_HEADER.size + slot * SLOT.size)[2]
+                else:
+                    slot = free
+                    if SLOT.unpack_from(self._index, INDEX_HEADER.size + slot * SLOT.size)[0]:
+                        deleted -= 1
+                    count += 1
+                SLOT.pack_into(self._index, INDEX_HEADER.size + slot * SLOT.size, key_hash, offset, len(record), now)
+                live += len(record)
+                offset += len(record)
+            self._set_header(generation, capacity, count, deleted, live)
+
+            if _compact_due(offset, live):
+                self._compact_locked()
+
+    def _put(
+        self,
+        key: str,
+        fetched_at: float,
+        data: dict
+    ) -> None:
+        self._put_many([(key, fetched_at, data)])
+
+    def _compact_locked(
+        self
+    ) -> int:
+        generation, _, _, _, live = self._header()
+        old_pack = self._pack_file(generation)
+        try:
+            old_size = os.path.getsize(old_pack)
+        except FileNotFoundError:
+            old_size = 0
+        slots = sorted(self._slots(), key=lambda slot: slot[2])
+        pack = self._map_pack(max(offset + length for _, _, offset, length, _ in slots)) if slots else None
+        if pack is None:
+            slots = []
+
+        new_pack = self._pack_file(generation + 1)
+        moved = []
+        with open(new_pack, "wb") as f:
+            offset = 0
+            for _, slot_hash, old_offset, length, access in slots:
+                f.write(pack[old_offset:old_offset + length])
+                moved.append((slot_hash, offset, length, access))
+                offset += length
+        self._write_index(generation + 1, _capacity_for(len(moved)), moved, offset)
+
+        for stale in self.path.glob("problems.*.pack"):
+            if stale != new_pack:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+        return max(old_size - offset, 0)
+
+    def _compact(
+        self
+    ) -> int:
+        """Rewrite the pack with live records only; returns the bytes reclaimed."""
+        if not self.index_file.exists():
+            return 0
+        with self._writing():
+            return self._compact_locked()
+
+    def _evict(
+        self,
+        max_bytes: int
+    ) -> int:
+        """
+        Once live records pass `max_bytes`, drop the least recently used
+        (oldest write first among equal access times) down to
+        EVICT_LOW_WATER of it, so the next evictions are some puts away.
+        The freed records are left to the usual stale-bytes compaction.
+        """
+        with self._lock:
+            if not self._refresh() or self._header()[4] <= max_bytes:
+                return 0
+        with self._writing():
+            generation, capacity, count, deleted, live = self._header()
+            target = int(max_bytes * EVICT_LOW_WATER)
+            removed = 0
+            for slot, slot_hash, _, length, _ in sorted(self._slots(), key=lambda slot: (slot[4], slot[2])):
+                if live <= target:
+                    break
+                SLOT.pack_into(self._index, INDEX_HEADER.size + slot * SLOT.size, slot_hash, 0, 0, 0)
+                live -= length
+                count -= 1
+                deleted += 1
+                removed += 1
+            self._set_header(generation, capacity, count, deleted, live)
+            try:
+                pack_size = os.path.getsize(self._pack_file(generation))
+            except FileNotFoundError:
+                pack_size = 0
+            if _compact_due(pack_size, live):
+                self._compact_locked()
+            return removed
+
+    def _usage(
+        self
+    ) -> Tuple[int, int, int]:
+        """(entries, bytes on disk, stale bytes a compaction would reclaim)."""
+        with self._lock:
+            if not self._refresh():
+                return 0, 0, 0
+            generation, _, count, _, live = self._header()
+            try:
+                pack_size = os.path.getsize(self._pack_file(generation))
+            except FileNotFoundError:
+                pack_size = 0
+            return count, pack_size + len(self._index), max(pack_size - live, 0)
+
+    def _clear(
+        self
+    ) -> int:
+        """Delete the index and every pack; returns the number of entries removed."""
+        if not self.path.exists():
+            return 0
+        with self._writing():
+            count = self._header()[2]
+            self._unmap()
+            for path in [self.index_file, *self.path.glob("problems.*.pack")]:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            return count
@@ -0,0 +1,81 @@
+import time
+import random
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional
+)
+
+POLL_INITIAL_DELAY = 0.5
+POLL_BACKOFF = 1.6
+POLL_MAX_DELAY = 4.0
+POLL_JITTER = 0.25
+POLL_DEADLINE = 60.0
+
+
+def _poll(
+    fetch: Callable[[], Any],
+    is_done: Callable[[Any], bool],
+    initial_delay: float = POLL_INITIAL_DELAY,
+    backoff: float = POLL_BACKOFF,
+    max_delay: float = POLL_MAX_DELAY,
+    jitter: float = POLL_JITTER,
+    deadline: float = POLL_DEADLINE,
+    on_wait: Optional[Callable[[int, float], None]] = None
+) -> Any:
+    """
+    Call `fetch` until `is_done(result)` holds, sleeping with exponential
+    backoff and +/- `jitter` randomisation between attempts.
+
+    `on_wait(attempt, elapsed)` is called before every sleep.
+    Raises TimeoutError once `deadline` seconds have passed.
+    """
+    started = time.monotonic()
+    delay = initial_delay
+    attempt = 0
+    while True:
+        elapsed = time.monotonic() - started
+        remaining = deadline - elapsed
+        if remaining <= 0:
+            raise TimeoutError(f"Gave up after {elapsed:.1f}s ({attempt} checks).")
+        if on_wait is not None:
+            on_wait(attempt, elapsed)
+        time.sleep(min(delay * random.uniform(1 - jitter, 1 + jitter), remaining))
+
+        result = fetch()
+        attempt += 1
+        if is_done(result):
+            return result
+        delay = min(delay * backoff, max_delay)
+
+
+async def _apoll(
+    fetch: Callable[[], Awaitable[Any]],
+    is_done: Callable[[Any], bool],
+    initial_delay: float = POLL_INITIAL_DELAY,
+    backoff: float = POLL_BACKOFF,
+    max_delay: float = POLL_MAX_DELAY,
+    jitter: float = POLL_JITTER,
+    deadline: float = POLL_DEADLINE,
+    on_wait: Optional[Callable[[int, float], None]] = None
+) -> Any:
+    """`_poll` for coroutines: awaits `fetch()` and sleeps without blocking the loop."""
+    started = time.monotonic()
+    delay = initial_delay
+    attempt = 0
+    while True:
+        elapsed = time.monotonic() - started
+        remaining = deadline - elapsed
+        if remaining <= 0:
+            raise TimeoutError(f"Gave up after {elapsed:.1f}s ({attempt} checks).")
+        if on_wait is not None:
+            on_wait(attempt, elapsed)
+        await asyncio.sleep(min(delay * random.uniform(1 - jitter, 1 + jitter), remaining))
+
+        result = await fetch()
+        attempt += 1
+        if is_done(result):
+            return result
+        delay = min(delay * backoff, max_delay)
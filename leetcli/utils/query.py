@@ -31,99 +31,120 @@ def _req_problem_query() -> str:
         }
         """
 
-def _req_problem_detail_query() -> str:
+def _req_problem_status_query() -> str:
     return """
-        query questionData($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
+        query problemStatus($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+            problemsetQuestionList: questionList(
+                categorySlug: $categorySlug
+                limit: $limit
+                skip: $skip
+                filters: $filters
+            ) {
+                total: totalNum
+                questions: data {
+                    questionFrontendId
+                    acRate
+                    status
+                }
+            }
+        }
+        """
+
+PROBLEM_DETAIL_FIELDS = """
                 questionFrontendId
                 title
                 content
                 difficulty
                 stats
+                exampleTestcases
+                metaData
                 codeSnippets {
                     lang
                     code
                 }
+"""
+
+def _req_batch_alias(index: int) -> str:
+    return f"q{index}"
+
+def _req_batch_query(
+    operation: str,
+    field: str,
+    argument: str,
+    argument_type: str,
+    selection: str,
+    count: int
+) -> str:
+    """
+    Build one document that runs `field` `count` times under the aliases
+    q0..q{count-1}, each with its own `${argument}{i}` variable.
+    """
+    params = ", ".join(f"${argument}{i}: {argument_type}" for i in range(count))
+    body = "".join(
+        f"""
+            {_req_batch_alias(i)}: {field}({argument}: ${argument}{i}) {{{selection}            }}"""
+        for i in range(count)
+    )
+    return f"""
+        query {operation}({params}) {{{body}
+        }}
+        """
+
+def _req_problem_detail_batch_query(count: int) -> str:
+    return _req_batch_query(
+        "questionDataBatch",
+        "question",
+        "titleSlug",
+        "String!",
+        PROBLEM_DETAIL_FIELDS,
+        count
+    )
+
+def _req_problem_daily_row_query() -> str:
+    """Only the fields of the daily question's `problem daily` row."""
+    return """
+        query getDailyProblemRow {
+            activeDailyCodingChallengeQuestion {
+                question {
+                    questionFrontendId
+                    title
+                    titleSlug
+                    difficulty
+                    acRate
+                    isPaidOnly
+                    status
+                }
             }
         }
-        """
+    """
 
-def _req_problem_daily_query() -> str:
+def _req_problem_daily_slim_query() -> str:
     return """
         query getDailyProblem {
             activeDailyCodingChallengeQuestion {
                 date
-                link
                 question {
                     questionId
                     questionFrontendId
-                    boundTopicId
                     title
                     titleSlug
                     content
-                    translatedTitle
-                    translatedContent
                     isPaidOnly
                     difficulty
-                    likes
-                    dislikes
-                    isLiked
-                    similarQuestions
+                    status
+                    stats
                     exampleTestcases
-                    contributors {
-                        username
-                        profileUrl
-                        avatarUrl
-                    }
-                    topicTags {
-                        name
-                        slug
-                        translatedName
-                    }
-                    companyTagStats
+                    metaData
                     codeSnippets {
                         lang
-                        langSlug
                         code
                     }
-                    stats
-                    hints
-                    solution {
-                        id
-                        canSeeDetail
-                        paidOnly
-                        hasVideoSolution
-                        paidOnlyVideo
-                    }
-                    status
-                    sampleTestCase
-                    metaData
-                    judgerAvailable
-                    judgeType
-                    mysqlSchemas
-                    enableRunCode
-                    enableTestMode
-                    enableDebugger
-                    envInfo
-                    libraryUrl
-                    adminUrl
-                    challengeQuestion {
-                        id
-                        date
-                        incompleteChallengeCount
-                        streakCount
-                        type
-                    }
-                    note
                 }
             }
         }
     """
 
-def _req_problem_solution_detail_query() -> str:
-    return """
-        query submissionDetails($submissionId: Int!) {
-            submissionDetails(submissionId: $submissionId) {
+SUBMISSION_DETAIL_FIELDS = """
                 statusCode
                 runtime
                 memory
@@ -132,10 +153,35 @@ def _req_problem_solution_detail_query() -> str:
                 lastTestcase
                 compileError
                 runtimeError
-            }
+"""
+
+def _req_problem_solution_detail_query() -> str:
+    return """
+        query submissionDetails($submissionId: Int!) {
+            submissionDetails(submissionId: $submissionId) {""" + SUBMISSION_DETAIL_FIELDS + """            }
         }
     """
 
+def _req_problem_solution_detail_batch_query(count: int) -> str:
+    return _req_batch_query(
+        "submissionDetailsBatch",
+        "submissionDetails",
+        "submissionId",
+        "Int!",
+        SUBMISSION_DETAIL_FIELDS,
+        count
+    )
+
+def _req_user_status_query() -> str:
+    return """
+        query globalData {
+        userStatus {
+            isSignedIn
+            username
+        }
+        }
+        """
+
 def _req_user_progress_v2_query() -> str:
     return """
         query userProfileUserQuestionProgressV2($userSlug: String!) {
@@ -158,4 +204,33 @@ def _req_user_progress_v2_query() -> str:
                 }
             }
         }
-    """
\ No newline at end of file
+    """
+
+def _req_user_status_progress_query() -> str:
+    """`userStatus` and the progress of `$userSlug` in one document."""
+    return """
+        query userStatusProgress($userSlug: String!) {
+            userStatus {
+                isSignedIn
+                username
+            }
+            userProfileUserQuestionProgressV2(userSlug: $userSlug) {
+                numAcceptedQuestions {
+                    difficulty
+                    count
+                }
+                numFailedQuestions {
+                    difficulty
+                    count
+                }
+                numUntouchedQuestions {
+                    difficulty
+                    count
+                }
+                userSessionBeatsPercentage {
+                    difficulty
+                    percentage
+                }
+            }
+        }
+    """
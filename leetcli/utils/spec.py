@@ -0,0 +1,127 @@
+import os
+import re
+from typing import (
+    List,
+    Sequence,
+    Tuple,
+    Union
+)
+
+MAX_SPEC_ITEMS = 5000
+DEFAULT_SUBMIT_WORKERS = 2
+SOLUTION_FILE_RE = re.compile(r"^(\d+)_.+\.(\w+)$")
+
+
+def _is_problem_spec(
+    text: str
+) -> bool:
+    """True if `text` selects more than one problem (a list or a range)."""
+    return "," in text or "-" in text.strip("-")
+
+
+def _parse_problem_spec(
+    spec: str
+) -> List[Union[int, str]]:
+    """
+    Expand a selection such as "1-300,450,daily" into an ordered,
+    de-duplicated list of frontend IDs (and the literal "daily").
+    """
+    items = []
+    for token in spec.split(","):
+        token = token.strip().lower()
+        if not token:
+            continue
+        if token == "daily":
+            items.append(token)
+        elif "-" in token:
+            low, _, high = token.partition("-")
+            try:
+                low, high = int(low), int(high)
+            except ValueError:
+                raise ValueError(f"Invalid range: {token}")
+            if low < 1 or high < low:
+                raise ValueError(f"Invalid range: {token}")
+            items.extend(range(low, high + 1))
+        else:
+            try:
+                problem_id = int(token)
+            except ValueError:
+                raise ValueError(f"Invalid problem ID: {token}")
+            if problem_id < 1:
+                raise ValueError(f"Invalid problem ID: {token}")
+            items.append(problem_id)
+
+        if len(items) > MAX_SPEC_ITEMS:
+            raise ValueError(f"Too many problems selected (max {MAX_SPEC_ITEMS}).")
+
+    return list(dict.fromkeys(items))
+
+
+def _solution_file_id(
+    path: str,
+    extensions
+):
+    """Frontend ID of a file named like `get` writes them ("1_Two_Sum.py"), else None."""
+    match = SOLUTION_FILE_RE.match(os.path.basename(path))
+    if match and match.group(2) in extensions:
+        return int(match.group(1))
+    return None
+
+
+def _parse_submit_targets(
+    targets: Sequence[str]
+) -> List[Tuple[int, str]]:
+    """
+    Expand `submit` arguments into [(problem_id, filename)].
+
+    Accepts "PROBLEM_ID FILE" pairs, solution files named like
+    "1_Two_Sum.py" and directories of such files, in any mix. A directory
+    holding several files for one problem (e.g. the templates written by
+    `get --langs`) is refused, since only the caller knows which to submit.
+    """
+    from leetcli.utils.file import LANG_FILE_EXT
+
+    extensions = set(LANG_FILE_EXT.values())
+    pairs = []
+    i = 0
+    while i < len(targets):
+        target = targets[i]
+        if os.path.isdir(target):
+            found = []
+            for name in os.listdir(target):
+                path = os.path.join(target, name)
+                problem_id = _solution_file_id(path, extensions)
+                if problem_id is not None and os.path.isfile(path):
+                    found.append((problem_id, path))
+            if not found:
+                raise ValueError(f"No solution files (like 1_Two_Sum.py) in {target}")
+            found.sort()
+            by_problem = {}
+            for problem_id, path in found:
+                by_problem.setdefault(problem_id, []).append(path)
+            for problem_id, paths in by_problem.items():
+                if len(paths) > 1:
+                    raise ValueError(
+                        f"{target} has {len(paths)} solution files for problem {problem_id}: "
+                        f"{', '.join(paths)}\nSubmit the one you mean, e.g. \"leetcli submit {paths[0]}\""
+                    )
+            pairs.extend(found)
+            i += 1
+        elif target.isdigit() and i + 1 < len(targets) and os.path.isfile(targets[i + 1]):
+            pairs.append((int(target), targets[i + 1]))
+            i += 2
+        elif os.path.isfile(target) and _solution_file_id(target, extensions) is not None:
+            pairs.append((_solution_file_id(target, extensions), target))
+            i += 1
+        elif target.isdigit():
+            raise ValueError(f"Missing solution file after problem ID {target}")
+        else:
+            raise ValueError(
+                f"Cannot submit {target}: expected PROBLEM_ID FILE, "
+                f"a file named like 1_Two_Sum.py, or a directory of them."
+            )
+
+        if len(pairs) > MAX_SPEC_ITEMS:
+            raise ValueError(f"Too many solutions selected (max {MAX_SPEC_ITEMS}).")
+
+    return list(dict.fromkeys(pairs))
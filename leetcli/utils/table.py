@@ -0,0 +1,118 @@
+import io
+import csv
+import json
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+from leetcli.utils.trace import _span
+
+OUTPUT_FORMATS = ("table", "plain", "json", "jsonl", "csv")
+
+
+def _fit(
+    value,
+    width: int
+) -> str:
+    text = "" if value is None else str(value)
+    if len(text) > width:
+        return text[:width - 1] + "…"
+    return text.ljust(width)
+
+
+def _stream_table(
+    rows: Iterable[Sequence],
+    headers: Sequence[str],
+    widths: Sequence[int]
+) -> Iterator[str]:
+    """
+    Render rows as fixed-width lines, one line per row as it arrives.
+
+    Unlike tabulate, nothing is buffered: column widths are decided up
+    front and long cells are truncated.
+    """
+    yield "  ".join(_fit(h, w) for h, w in zip(headers, widths)).rstrip()
+    yield "  ".join("─" * w for w in widths)
+    for row in rows:
+        yield "  ".join(_fit(cell, w) for cell, w in zip(row, widths)).rstrip()
+
+
+def _csv_cell(
+    value
+):
+    """
+    One csv field: lists of plain values join with ";" (tags), other
+    lists and dicts become JSON, None is empty.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        if all(isinstance(item, (str, int, float)) for item in value):
+            return ";".join(map(str, value))
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _csv_line(
+    values: Sequence
+) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(values)
+    return buffer.getvalue()
+
+
+def _render(
+    records: Iterable[Mapping],
+    columns: Sequence[Tuple[str, str, int]],
+    fmt: str = "table",
+    display: Optional[Callable[[Mapping], Sequence]] = None
+) -> Iterator[str]:
+    """
+    Render records (dicts) in one of OUTPUT_FORMATS, yielding output chunks.
+
+    `columns` is [(key, header, width)] for the human formats and `display`
+    turns a record into its table cells (default: the column values).
+    - table: tabulate's fancy_grid, one chunk once every row is in
+    - plain: `_stream_table`, one line per record as it arrives
+    - json:  one JSON array of the records
+    - jsonl: one JSON object per record as it arrives
+    - csv:   a header line, then one line per record as it arrives
+             (list and dict fields flattened by `_csv_cell`)
+
+    The machine formats (json, jsonl, csv) write every field of the record
+    and never import tabulate.
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (choose from {', '.join(OUTPUT_FORMATS)})")
+    if display is None:
+        display = lambda record: [record.get(key) for key, _, _ in columns]
+    headers = [header for _, header, _ in columns]
+
+    if fmt == "table":
+        from tabulate import tabulate
+
+        rows = [display(record) for record in records]
+        with _span("tabulate", rows=len(rows)):
+            yield tabulate(rows, headers=headers, tablefmt="fancy_grid")
+    elif fmt == "plain":
+        yield from _stream_table(map(display, records), headers, [width for _, _, width in columns])
+    elif fmt == "json":
+        yield json.dumps([dict(record) for record in records], ensure_ascii=False)
+    elif fmt == "jsonl":
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False)
+    else:
+        fields = None
+        for record in records:
+            if fields is None:
+                fields = list(record)
+                yield _csv_line(fields)
+            yield _csv_line([_csv_cell(record.get(key)) for key in fields])
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import atexit
+import inspect
+import functools
+import threading
+from typing import (
+    Callable,
+    Optional
+)
+
+TRACE_ENV = "LEETCLI_TRACE"
+DEFAULT_TRACE_FILE = "leetcli-trace.json"
+
+
+class _Span:
+    """One timed region; becomes a Chrome "complete" (ph=X) event on exit."""
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._record(self, end)
+        return False
+
+    def _set(self, **args) -> None:
+        """Attach values known only at the end, e.g. byte counts."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Shared do-nothing span returned while tracing is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def _set(self, **args) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Collects spans and writes them in Chrome's trace-event format, which
+    chrome://tracing and https://ui.perfetto.dev open directly.
+
+    Disabled by default; while disabled `_span` returns `NULL_SPAN` and
+    `_traced` calls straight through, so instrumented code pays one
+    attribute check per call.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self._events = []
+        self._threads = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def _start(
+        self,
+        path: str
+    ) -> None:
+        """Start recording; the trace is written to `path` when the process exits."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.path = path
+        self._origin = time.perf_counter_ns()
+        atexit.register(self._write)
+
+    def _record(
+        self,
+        span: _Span,
+        end: int
+    ) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start - self._origin) / 1000,
+            "dur": (end - span.start) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": span.args,
+        }
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def _export(
+        self
+    ) -> dict:
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        metadata.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "leetcli"}})
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def _write(
+        self
+    ) -> None:
+        if not self.enabled or not self.path:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._export(), f)
+        except OSError:
+            pass
+
+
+TRACER = Tracer()
+
+
+def _span(
+    name: str,
+    category: str = "leetcli",
+    **args
+):
+    """`with _span("http.post", url=url) as span: ...; span._set(bytes=n)`"""
+    if not TRACER.enabled:
+        return NULL_SPAN
+    return _Span(TRACER, name, category, args)
+
+
+def _traced(
+    name: str,
+    category: str = "leetcli"
+) -> Callable:
+    """Decorator form of `_span` for whole functions, methods and coroutines."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not TRACER.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(TRACER, name, category, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with _Span(TRACER, name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _start_trace(
+    path: Optional[str]
+) -> None:
+    """Enable tracing to `path` (from --trace or $LEETCLI_TRACE); no-op for None."""
+    if path:
+        TRACER._start(path)
@@ -3,7 +3,8 @@
 def _req_problem_variable(
     mode: str,
     difficulty: str | None,
-    start: int
+    start: int,
+    limit: int = 10
 ) -> dict:
     filters = {}
     if mode == "solved":
@@ -18,28 +19,36 @@ def _req_problem_variable(
 
     return {
         "categorySlug": "",
-        "limit": 10,
+        "limit": limit,
         "skip": start,
         "filters": filters
     }
 
 
-def _req_one_problem_variable(
-    problem_id
+def _req_problem_page_variable(
+    skip: int,
+    limit: int
 ) -> dict:
     return {
         "categorySlug": "",
-        "limit": 1,
-        "skip": problem_id - 1,
+        "limit": limit,
+        "skip": skip,
         "filters": {}
     }
-def _req_problem_detail_variable(
-    titleSlug
+
+def _req_batch_variable(
+    argument,
+    values
 ) -> dict:
     return {
-        "titleSlug": titleSlug
+        f"{argument}{i}": value for i, value in enumerate(values)
     }
 
+def _req_problem_detail_batch_variable(
+    titleSlugs
+) -> dict:
+    return _req_batch_variable("titleSlug", titleSlugs)
+
 def _req_problem_submit_variable(
     language,
     code,
@@ -59,6 +68,11 @@ def _req_problem_solution_detail_variable(
         "submissionId": submission_id
     }
 
+def _req_problem_solution_detail_batch_variable(
+    submission_ids
+) -> dict:
+    return _req_batch_variable("submissionId", submission_ids)
+
 def _req_user_progress_variable(
     user_name
 ):